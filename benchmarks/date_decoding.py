@@ -0,0 +1,44 @@
+"""
+Compares the timestamp decoder against the dateutil based
+implementation it replaced.
+
+Run with ``python benchmarks/date_decoding.py``.
+"""
+
+import random
+import timeit
+
+from dateutil.parser import isoparse
+
+from recnetpy.misc import date_to_unix
+from recnetpy.misc.date_to_unix import parse_iso_date
+from payloads import created_at
+
+COUNT = 100000
+REPEAT = 5
+
+def dateutil_to_unix(date: str) -> int:
+    return int(isoparse(date).timestamp())
+
+def bench(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+def main():
+    rng = random.Random(0)
+    unique = [created_at(rng) for _ in range(COUNT)]
+    # Feeds repeat the same dates often, such as the start times of events
+    repeated = [rng.choice(unique[:500]) for _ in range(COUNT)]
+
+    for label, dates in (("unique", unique), ("repeated", repeated)):
+        print(f"{COUNT} {label} dates")
+        baseline = bench(lambda: [dateutil_to_unix(date) for date in dates])
+        timings = {
+            "dateutil isoparse": baseline,
+            "fast path, uncached": bench(lambda: [parse_iso_date(date) for date in dates]),
+            "date_to_unix": bench(lambda: (date_to_unix.cache_clear(), [date_to_unix(date) for date in dates])),
+        }
+        for name, timing in timings.items():
+            print(f"  {name:<22}{timing * 1e3:>9.1f}ms {baseline / timing:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures how long importing recnetpy takes in a fresh interpreter,
+and which heavy modules each step pulls in. The eager scenario
+imports every module, like ``import recnetpy`` used to.
+
+Run with ``python benchmarks/import_time.py``. Pass ``--check`` to
+exit with an error if a step imports a module it shouldn't, so it
+can guard against regressions in CI.
+"""
+
+import statistics
+import subprocess
+import sys
+
+REPEAT = 15
+
+SCENARIOS = {
+    "import recnetpy": "import recnetpy",
+    "from recnetpy.dataclasses import Image": "from recnetpy.dataclasses import Image",
+    "recnetpy.Client()": "import recnetpy; recnetpy.Client()",
+    "eager (all modules)": "import recnetpy.client, recnetpy.managers.room_manager, recnetpy.dataclasses.base, aiohttp, dateutil.parser; "
+        "[getattr(m, name) for m in (recnetpy, recnetpy.managers, recnetpy.dataclasses, recnetpy.rest) for name in m.__all__]",
+}
+
+#: Modules each scenario must not import.
+FORBIDDEN = {
+    "import recnetpy": ["aiohttp", "dateutil", "numpy", "asyncio", "recnetpy.client", "recnetpy.managers", "recnetpy.dataclasses", "recnetpy.rest"],
+    "from recnetpy.dataclasses import Image": ["aiohttp", "dateutil", "numpy", "recnetpy.client", "recnetpy.managers", "recnetpy.rest"],
+    "recnetpy.Client()": ["aiohttp", "dateutil", "numpy", "recnetpy.rest.cache.sqlite_cache"],
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(" ".join(sys.modules))
+"""
+
+def run(code: str):
+    out = subprocess.run([sys.executable, "-c", PROBE.format(code=code)], capture_output=True, text=True, check=True).stdout
+    elapsed, modules = out.splitlines()
+    return float(elapsed), set(modules.split())
+
+def main():
+    check = "--check" in sys.argv
+    failures = []
+    for name, code in SCENARIOS.items():
+        timings = []
+        for _ in range(REPEAT):
+            elapsed, modules = run(code)
+            timings.append(elapsed)
+        timing = statistics.median(timings)
+        print(f"{name:<42}{timing * 1e3:>9.1f}ms")
+        for module in FORBIDDEN.get(name, ()):
+            if module in modules:
+                failures.append(f"{name} imported {module}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if check and failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
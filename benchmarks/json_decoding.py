@@ -0,0 +1,54 @@
+"""
+Compares the JSON backends used to decode response bodies.
+
+Run with ``python benchmarks/json_decoding.py``. The orjson backend
+is only measured if it's installed (``pip install recnetpy[speedups]``).
+Pass ``--check`` to only check that every backend decodes the payloads
+the same way, and that dataclasses can be built from them.
+"""
+
+import json
+import sys
+import timeit
+
+from recnetpy import Client
+from recnetpy.rest.json_decoder import get_json_decoder, orjson
+from payloads import make_accounts, make_images, make_rooms
+
+SIZES = (1, 64, 1000)
+REPEAT = 5
+
+def bench(loads, body: bytes, number: int) -> float:
+    return min(timeit.repeat(lambda: loads(body), number=number, repeat=REPEAT)) / number
+
+def check(backends) -> None:
+    client = Client()
+    for make, manager in ((make_accounts, client.accounts), (make_images, client.images), (make_rooms, client.rooms)):
+        payload = make(64)
+        body = json.dumps(payload).encode()
+        for name, loads in backends.items():
+            assert loads(body) == payload, f"{name} decoded {make.__name__} differently"
+        # Every field is decoded right away, since the client doesn't decode lazily
+        objects = manager.create_from_data_list(backends["json"](body))
+        assert [obj.id for obj in objects] == [obj.id for obj in manager.create_from_data_list(payload)]
+    print("OK")
+
+def main():
+    backends = {"json": get_json_decoder("json")}
+    if orjson is not None: backends["orjson"] = get_json_decoder("orjson")
+    else: print("orjson isn't installed, only the standard library backend is measured.\n")
+    if "--check" in sys.argv:
+        check(backends)
+        return
+
+    print(f"{'payload':<18}{'size':>10}" + "".join(f"{name:>14}" for name in backends))
+    for label, make in (("ImageResponse", make_images), ("RoomResponse", make_rooms)):
+        for count in SIZES:
+            body = json.dumps(make(count)).encode()
+            number = max(1, 20000 // count)
+            timings = [bench(loads, body, number) for loads in backends.values()]
+            row = f"{label + ' x' + str(count):<18}{len(body) // 1024:>8}KB"
+            print(row + "".join(f"{t * 1e6:>12.1f}us" for t in timings))
+
+if __name__ == "__main__":
+    main()
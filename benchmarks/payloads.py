@@ -0,0 +1,118 @@
+"""
+Generates realistic API response payloads for the benchmarks.
+The shapes follow the typed dictionaries in recnetpy.misc.api_responses.
+"""
+
+import random
+
+def created_at(rng: random.Random) -> str:
+    return "20{:02d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}.{:07d}Z".format(
+        rng.randint(16, 23), rng.randint(1, 12), rng.randint(1, 28),
+        rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59), rng.randint(0, 9999999)
+    )
+
+def make_accounts(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "accountId": rng.randint(1, 10 ** 8),
+            "username": f"Player{i}",
+            "displayName": f"Player {i} ✨",
+            "profileImage": f"{rng.getrandbits(128):032x}.jpg",
+            "isJunior": rng.random() < 0.1,
+            "platforms": rng.getrandbits(8),
+            "personalPronouns": rng.getrandbits(6),
+            "identityFlags": rng.getrandbits(10),
+            "createdAt": created_at(rng),
+        }
+        for i in range(count)
+    ]
+
+def make_images(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "Id": rng.randint(1, 10 ** 9),
+            "Type": 1,
+            "Accessibility": 1,
+            "AccessibilityLocked": False,
+            "ImageName": f"{rng.getrandbits(128):032x}.jpg",
+            "Description": rng.choice([None, "", "Good times with friends in the Rec Center!"]),
+            "PlayerId": rng.randint(1, 10 ** 8),
+            "TaggedPlayerIds": [rng.randint(1, 10 ** 8) for _ in range(rng.randint(0, 6))],
+            "RoomId": rng.randint(1, 10 ** 8),
+            "PlayerEventId": rng.choice([None, rng.randint(1, 10 ** 7)]),
+            "CreatedAt": created_at(rng),
+            "CheerCount": rng.randint(0, 5000),
+            "CommentCount": rng.randint(0, 200),
+        }
+        for _ in range(count)
+    ]
+
+def make_rooms(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    rooms = []
+    for i in range(count):
+        room_id = rng.randint(1, 10 ** 8)
+        rooms.append({
+            "RoomId": room_id,
+            "IsDorm": False,
+            "MaxPlayerCalculationMode": 0,
+            "MaxPlayers": rng.choice([4, 8, 20, 40]),
+            "CloningAllowed": rng.random() < 0.3,
+            "DisableMicAutoMute": False,
+            "DisableRoomComments": False,
+            "EncryptVoiceChat": False,
+            "ToxmodEnabled": rng.random() < 0.5,
+            "LoadScreenLocked": False,
+            "Version": rng.randint(1, 500),
+            "Name": f"Room{i}",
+            "Description": "A room made for benchmarking. " * rng.randint(1, 8),
+            "ImageName": f"{rng.getrandbits(128):032x}.jpg",
+            "WarningMask": rng.getrandbits(6),
+            "CustomWarning": None,
+            "CreatorAccountId": rng.randint(1, 10 ** 8),
+            "State": 0,
+            "Accessibility": 1,
+            "SupportsLevelVoting": False,
+            "IsRRO": rng.random() < 0.05,
+            "SupportsScreens": True,
+            "SupportsWalkVR": True,
+            "SupportsTeleportVR": True,
+            "SupportsVRLow": True,
+            "SupportsQuest2": True,
+            "SupportsMobile": True,
+            "SupportsJuniors": True,
+            "MinLevel": 0,
+            "CreatedAt": created_at(rng),
+            "Stats": {
+                "CheerCount": rng.randint(0, 10 ** 6),
+                "FavoriteCount": rng.randint(0, 10 ** 6),
+                "VisitorCount": rng.randint(0, 10 ** 7),
+                "VisitCount": rng.randint(0, 10 ** 8),
+            },
+            "SubRooms": [
+                {
+                    "SupportsJoinInProgress": True,
+                    "UseLevelBasedMatchmaking": False,
+                    "UseAgeBasedMatchmaking": False,
+                    "UseRecRoyaleMatchmaking": False,
+                    "SubRoomId": rng.randint(1, 10 ** 8),
+                    "RoomId": room_id,
+                    "UnitySceneId": f"{rng.getrandbits(128):032x}",
+                    "Name": "Home",
+                    "DataBlob": f"{rng.getrandbits(128):032x}",
+                    "DataSavedAt": created_at(rng),
+                    "IsSandbox": False,
+                    "MaxPlayers": 20,
+                    "Accessibility": 1,
+                }
+                for _ in range(rng.randint(1, 3))
+            ],
+            "Roles": [
+                {"AccountId": rng.randint(1, 10 ** 8), "Role": rng.choice([10, 20, 30, 255]), "LastChangedByAccountId": None, "InvitedRole": 0}
+                for _ in range(rng.randint(1, 5))
+            ],
+            "Tags": [{"Tag": tag, "Type": 0} for tag in rng.sample(["pvp", "quest", "hangout", "art", "parkour", "horror"], 3)],
+        })
+    return rooms
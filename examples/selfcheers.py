@@ -16,19 +16,19 @@ async def main():
     # Fetch Meriesa by username
     user = await RecNet.accounts.get("Meriesa")
     
-    # Fetch Meriesa's RecNet posts through the Account dataclass
-    images = await user.get_images(take=100_000)  # 100,000 to make sure ALL posts are included
-    
     start_time = time.perf_counter()
     
-    # Filter out images that have no cheers since they can't possibly be self-cheered
-    cheered_images = list(filter(lambda image: image.cheer_count, images))
-    
-    # Create co-routines for fetching the cheers of the images
-    coroutines = map(lambda image: image.get_cheers(), cheered_images)
-    
-    # Fetch the cheers
-    await asyncio.gather(*coroutines)
+    # Page through ALL of Meriesa's RecNet posts. The next page is fetched while the current one is processed
+    images = []
+    cheered_images = []
+    async for image in RecNet.images.paginate(RecNet.images.from_account, user.id, page_size=100):
+        images.append(image)
+        
+        # Filter out images that have no cheers since they can't possibly be self-cheered
+        if image.cheer_count: cheered_images.append(image)
+    
+    # Fetch the cheers with a fixed number of workers, instead of creating a task for every image at once
+    await RecNet.map(lambda image: image.get_cheers(), cheered_images, concurrency=32).collect()
     
     # Exclude images that are self-cheered
     self_cheered_images = list(filter(lambda image: user.id in image.cheer_player_ids, cheered_images))
@@ -1,3 +1,28 @@
-from .client import Client
-from .managers.room_manager import RoomInclude
-from .dataclasses import *
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from .misc import lazy_import
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .managers.room_manager import RoomInclude
+    from .rest.priority import Priority, use_priority
+    from .rest.deadline import use_timeout
+    from .rest.tenant import use_tenant
+    from .rest.exceptions import DeadlineExceeded, MapError
+    from .dataclasses import (
+        BaseDataClass, Account, Room, Event, Image, LoadScreen, Role, Score, SubRoom, Tag,
+        PromoExternalContent, Invention, InventionVersion, Progression, EventInteraction, Comment,
+    )
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".client": ["Client"],
+    ".managers.room_manager": ["RoomInclude"],
+    ".rest.priority": ["Priority", "use_priority"],
+    ".rest.deadline": ["use_timeout"],
+    ".rest.tenant": ["use_tenant"],
+    ".rest.exceptions": ["DeadlineExceeded", "MapError"],
+    ".dataclasses": [
+        "BaseDataClass", "Account", "Room", "Event", "Image", "LoadScreen", "Role", "Score", "SubRoom", "Tag",
+        "PromoExternalContent", "Invention", "InventionVersion", "Progression", "EventInteraction", "Comment",
+    ],
+})
\ No newline at end of file
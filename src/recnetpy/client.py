@@ -1,5 +1,11 @@
-from .rest import RouteManager
-from .managers import AccountManager, EventManager, ImageManager, InventionManager, RoomManager
+from typing import AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar, Union
+
+from .rest import RouteManager, BaseCache, CachePolicy, BaseTokenStore
+from .rest.json_decoder import JSONDecoder
+from .managers import AccountManager, EventManager, ImageManager, InventionManager, RoomManager, WorkerPool
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 class Client:
     """
@@ -18,14 +24,81 @@ class Client:
     inventions: InventionManager
     #: Use this property to request room data. It serves as a factory for all room objects.
     rooms: RoomManager
+    #: If true, derived fields of dataclasses are decoded on first access instead of when data is received.
+    lazy_fields: bool
+    #: If false, dataclasses drop their raw API response once it's decoded.
+    keep_data: bool
 
-    def __init__(self, api_key: str = None) -> None:
-        self.rec_net = RouteManager(api_key)
+    def __init__(self, api_key: Union[str, List[str], None] = None, cache: Optional[BaseCache] = None, cache_policy: Optional[CachePolicy] = None, batch_fetches: bool = False, json_loads: Union[str, JSONDecoder, None] = None, lazy_fields: bool = False, keep_data: bool = True, identity_map: bool = False, pin_size: int = 0, token_store: Optional[BaseTokenStore] = None, tenant_quota: Optional[float] = None) -> None:
+        """
+        :param api_key: The API key used for endpoints that require authorization. Pass a list of keys to spread requests over all of them, keys the server rejects are left out for a while.
+        :param cache: An optional response cache, such as a ``MemoryCache``. Responses aren't cached by default.
+        :param cache_policy: Decides how long responses of each route are cached for.
+        :param batch_fetches: If true, fetches made in the same event loop tick are sent as a single bulk request.
+        :param json_loads: The JSON decoder used for responses, either a function or ``'orjson'``/``'json'``. Defaults to orjson if it's installed.
+        :param lazy_fields: If true, derived fields such as dates, bitmasks and nested objects are decoded on first access.
+        :param keep_data: If false, dataclasses don't keep their raw API response, which saves memory. Lazy fields are decoded right away.
+        :param identity_map: If true, each id maps to one live object, which is patched when new data for it arrives.
+        :param pin_size: The number of recently used objects of each type the identity map keeps alive.
+        :param token_store: A store, such as a ``FileTokenStore``, which shares rate limits between processes using the same key.
+        :param tenant_quota: The number of requests per second each tenant, set with ``use_tenant``, is allowed. Tenants aren't capped by default, but still share the rate limit fairly.
+        """
+        self.rec_net = RouteManager(api_key, cache, cache_policy, json_loads, token_store, tenant_quota)
+        self.lazy_fields = lazy_fields
+        self.keep_data = keep_data
         self.accounts = AccountManager(self)
         self.events = EventManager(self)
         self.images = ImageManager(self)
         self.inventions = InventionManager(self)
         self.rooms = RoomManager(self)
+        if batch_fetches:
+            for manager in (self.accounts, self.events, self.images, self.rooms):
+                manager.enable_batching()
+        if identity_map:
+            for manager in (self.accounts, self.events, self.images, self.inventions, self.rooms):
+                manager.enable_identity_map(pin_size)
+
+    def map(self, func: Callable[[T], Awaitable[R]], items: Union[Iterable[T], AsyncIterable[T]], concurrency: int = 16, queue_size: Optional[int] = None, return_exceptions: bool = False) -> WorkerPool[T, R]:
+        """
+        Calls a function on each item with a fixed number of workers,
+        such as fetching the cheers of thousands of images. Unlike
+        gathering every call at once, only a few requests are
+        pending at a time, however many items there are. Items can
+        be an async iterable, such as a paginator.
+
+        Iterate over the pool to receive ``(item, result)`` pairs as
+        they finish, or call ``collect`` to receive the results in
+        input order. Failed calls don't stop the others, a ``MapError``
+        listing them is raised once every item was processed.
+
+        :param func: A function returning the awaitable to run for an item.
+        :param items: The items to process.
+        :param concurrency: The number of calls made at once.
+        :param queue_size: The max number of items read ahead of the workers, defaults to twice the concurrency.
+        :param return_exceptions: If true, exceptions are returned in place of results instead of being raised.
+        :return: A worker pool.
+        """
+        return WorkerPool(func, items, concurrency, queue_size, return_exceptions)
+
+    async def warm_up(self, connections: int = 1, timeout: float = 10) -> Dict[str, bool]:
+        """
+        Opens connections to every RecNet host ahead of time, so
+        the first requests don't wait on DNS resolution and TLS
+        handshakes. Sessions are otherwise only created once the
+        first request is sent. Each connection costs a token of
+        the host's rate limit.
+
+        :param connections: The number of connections to open to each host.
+        :param timeout: The number of seconds to wait for each connection.
+        :return: A dictionary of hosts, and whether connecting to them succeeded.
+        """
+        return await self.rec_net.warm_up(connections, timeout)
+
+    async def __aenter__(self) -> 'Client':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def close(self) -> None:
         """
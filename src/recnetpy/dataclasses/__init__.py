@@ -1,16 +1,40 @@
-from .base import BaseDataClass
-from .account import Account
-from .room import Room
-from .event import Event
-from .image import Image
-from .loading_screen import LoadScreen
-from .role import Role
-from .score import Score
-from .subroom import SubRoom
-from .tag import Tag
-from .promo_external_content import PromoExternalContent
-from .invention import Invention
-from .invention_version import InventionVersion
-from .progression import Progression
-from .event_response import EventInteraction
-from .comment import Comment
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from ..misc import lazy_import
+
+if TYPE_CHECKING:
+    from .base import BaseDataClass
+    from .account import Account
+    from .room import Room
+    from .event import Event
+    from .image import Image
+    from .loading_screen import LoadScreen
+    from .role import Role
+    from .score import Score
+    from .subroom import SubRoom
+    from .tag import Tag
+    from .promo_external_content import PromoExternalContent
+    from .invention import Invention
+    from .invention_version import InventionVersion
+    from .progression import Progression
+    from .event_response import EventInteraction
+    from .comment import Comment
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".base": ["BaseDataClass"],
+    ".account": ["Account"],
+    ".room": ["Room"],
+    ".event": ["Event"],
+    ".image": ["Image"],
+    ".loading_screen": ["LoadScreen"],
+    ".role": ["Role"],
+    ".score": ["Score"],
+    ".subroom": ["SubRoom"],
+    ".tag": ["Tag"],
+    ".promo_external_content": ["PromoExternalContent"],
+    ".invention": ["Invention"],
+    ".invention_version": ["InventionVersion"],
+    ".progression": ["Progression"],
+    ".event_response": ["EventInteraction"],
+    ".comment": ["Comment"],
+})
\ No newline at end of file
@@ -1,8 +1,8 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from .base import BaseDataClass
 from .progression import Progression
-from ..misc import date_to_unix, bitmask_decode
+from ..misc import date_to_unix, bitmask_decode, LazyField
 
 if TYPE_CHECKING:
     from . import Event, Image, Room
@@ -10,9 +10,9 @@ if TYPE_CHECKING:
     from ..rest import Response
 
 
-PLATFORM_LIST: List[str] = ['Steam', 'Meta', 'PlayStation', 'Xbox', 'HeadlessBot', 'iOS', 'Android', 'Standalone', 'Pico']
-PERSONAL_PRONOUNS_LIST: List[str] = ['She / her', 'He / him', 'They / them', 'Ze / hir', 'Ze / zir', 'Xe / xem']
-IDENTITY_FLAGS_LIST: List[str] = ['LGBTQIA', 'Transgender', 'Bisexual', 'Lesbian', 'Pansexual', 'Asexual', 'Intersex', 'Genderqueer', 'Nonbinary', 'Aromantic']
+PLATFORM_LIST: Tuple[str, ...] = ('Steam', 'Meta', 'PlayStation', 'Xbox', 'HeadlessBot', 'iOS', 'Android', 'Standalone', 'Pico')
+PERSONAL_PRONOUNS_LIST: Tuple[str, ...] = ('She / her', 'He / him', 'They / them', 'Ze / hir', 'Ze / zir', 'Xe / xem')
+IDENTITY_FLAGS_LIST: Tuple[str, ...] = ('LGBTQIA', 'Transgender', 'Bisexual', 'Lesbian', 'Pansexual', 'Asexual', 'Intersex', 'Genderqueer', 'Nonbinary', 'Aromantic')
 
 class Account(BaseDataClass['AccountResponse']):
     """
@@ -29,14 +29,14 @@ class Account(BaseDataClass['AccountResponse']):
     profile_image: str
     #: This is true if the account is a junior account, false if the account is a non-junior account. 
     is_junior: bool
-    #: This is a list of platforms a user plays on. It has these possible values ``['Steam', 'Meta', 'PlayStation', 'Xbox', 'RecNet', 'iOS', 'Android', 'Standalone']``.   
-    platforms: List[str]
-    #: This is the list of pronouns a user goes by. It has these possible values ``['She / her', 'He / him', 'They / them', 'Ze / hir', 'Ze / zir', 'Xe / xem']``.  
-    personal_pronouns: List[str]
-    #: This is a list of a user's gender identities. It has these possible values ``['LGBTQIA', 'Transgender', 'Bisexual', 'Lesbian', 'Pansexual', 'Asexual', 'Intersex', 'Genderqueer', 'Nonbinary', 'Aromantic']``.  
-    identity_flags: List[str] 
+    #: This is a tuple of platforms a user plays on. It has these possible values ``['Steam', 'Meta', 'PlayStation', 'Xbox', 'RecNet', 'iOS', 'Android', 'Standalone']``.   
+    platforms: Tuple[str, ...] = LazyField(lambda data: bitmask_decode(data['platforms'], PLATFORM_LIST))
+    #: This is the tuple of pronouns a user goes by. It has these possible values ``['She / her', 'He / him', 'They / them', 'Ze / hir', 'Ze / zir', 'Xe / xem']``.  
+    personal_pronouns: Tuple[str, ...] = LazyField(lambda data: bitmask_decode(data['personalPronouns'], PERSONAL_PRONOUNS_LIST))
+    #: This is a tuple of a user's gender identities. It has these possible values ``['LGBTQIA', 'Transgender', 'Bisexual', 'Lesbian', 'Pansexual', 'Asexual', 'Intersex', 'Genderqueer', 'Nonbinary', 'Aromantic']``.  
+    identity_flags: Tuple[str, ...] = LazyField(lambda data: bitmask_decode(data['identityFlags'], IDENTITY_FLAGS_LIST))
     #: This is the date the account was created as a Unix integer. 
-    created_at: int
+    created_at: int = LazyField(lambda data: date_to_unix(data['createdAt']))
     #: This is the file of an account's banner image.  
     banner_image: Optional[str] = None  
     #: This is a users bio.
@@ -74,10 +74,7 @@ class Account(BaseDataClass['AccountResponse']):
         self.profile_image = data['profileImage']
         self.banner_image = data.get("bannerImage", None)
         self.is_junior = bool(data['isJunior'])
-        self.platforms = bitmask_decode(data['platforms'], PLATFORM_LIST)
-        self.personal_pronouns = bitmask_decode(data['personalPronouns'], PERSONAL_PRONOUNS_LIST)
-        self.identity_flags = bitmask_decode(data['identityFlags'], IDENTITY_FLAGS_LIST)
-        self.created_at = date_to_unix(data['createdAt'])
+        self.patch_lazy_fields()
 
     async def get_events(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Event']:
         """
@@ -90,7 +87,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of events.
         """
         if self.events is None or force:
-            self.events = await self.client.events.from_account(self.id, take, skip)
+            self.events = await self.client.events.from_account(self.id, take, skip, force = force)
         return self.events
 
     async def get_images(self, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Image']:
@@ -105,7 +102,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of images.
         """
         if self.images is None or force:
-            self.images = await self.client.images.from_account(self.id, take, skip, sort)
+            self.images = await self.client.images.from_account(self.id, take, skip, sort, force = force)
         return self.images
 
     async def get_feed(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Image']:
@@ -119,7 +116,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of images.
         """
         if self.feed is None or force:
-            self.feed = await self.client.images.player_feed(self.id, take, skip)
+            self.feed = await self.client.images.player_feed(self.id, take, skip, force = force)
         return self.feed
 
     async def get_created_rooms(self, force: bool = False) -> List['Room']:
@@ -131,7 +128,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of rooms.
         """
         if self.created_rooms is None or force:
-            self.created_rooms = await self.client.rooms.created_by(self.id)
+            self.created_rooms = await self.client.rooms.created_by(self.id, force = force)
         return self.created_rooms
     
     async def get_showcased_rooms(self, force: bool = False) -> List['Room']:
@@ -143,7 +140,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of rooms.
         """
         if self.featured_rooms is None or force:
-            self.featured_rooms = await self.client.rooms.showcased_by(self.id)
+            self.featured_rooms = await self.client.rooms.showcased_by(self.id, force = force)
         return self.featured_rooms
 
     async def get_owned_rooms(self, force: bool = False) -> List['Room']:
@@ -155,7 +152,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: A list of rooms.
         """
         if self.owned_rooms is None or force:
-            self.owned_rooms = await self.client.rooms.owned_by(self.id)
+            self.owned_rooms = await self.client.rooms.owned_by(self.id, force = force)
         return self.owned_rooms
 
     async def get_bio(self, force: bool = False) -> str:
@@ -167,7 +164,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: The player's bio.
         """
         if self.bio is None or force:
-            data: 'Response[BioResponse]' = await self.rec_net.accounts(self.id).bio.make_request('get')
+            data: 'Response[BioResponse]' = await self.rec_net.accounts(self.id).bio.make_request('get', force = force)
             self.bio = data.data['bio']
         return self.bio
 
@@ -180,7 +177,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: This player's level.
         """
         if self.level is None or force:
-            data: 'Response[List[ProgressionResponse]]' = await self.rec_net.api.players.v2.progression.bulk.make_request('post', body = {'id': [self.id]})
+            data: 'Response[List[ProgressionResponse]]' = await self.rec_net.api.players.v2.progression.bulk.make_request('post', body = {'id': [self.id]}, idempotent = True, force = force)
             self.level = Progression(data.data[0])
         return self.level
 
@@ -193,7 +190,7 @@ class Account(BaseDataClass['AccountResponse']):
         :return: This player's subscriber count.
         """
         if self.subscriber_count is None or force:
-            data: 'Response[int]' = await self.rec_net.clubs.subscription.subscribercount(self.id).make_request('get')
+            data: 'Response[int]' = await self.rec_net.clubs.subscription.subscribercount(self.id).make_request('get', force = force)
             self.subscriber_count = data.data
         return self.subscriber_count
 
@@ -206,6 +203,6 @@ class Account(BaseDataClass['AccountResponse']):
         :return: This player's subscriber count.
         """
         if self.is_influencer is None or force:
-            data: 'Response[bool]' = await self.rec_net.api.influencerpartnerprogram.isinfluencer.make_request('get', params = {'accountId': self.id})
+            data: 'Response[bool]' = await self.rec_net.api.influencerpartnerprogram.isinfluencer.make_request('get', params = {'accountId': self.id}, force = force)
             self.is_influencer = data.data
         return self.is_influencer 
\ No newline at end of file
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, List, Optional, TypeVar, TypedDict
+from typing import TYPE_CHECKING, ClassVar, Dict, Generic, List, Optional, TypeVar, TypedDict
+
+from ..misc import LazyField, SlotsMeta
 
 if TYPE_CHECKING:
     from .. import Client
@@ -7,26 +9,43 @@ if TYPE_CHECKING:
 
 RT = TypeVar("RT", bound=TypedDict)
 
-class BaseDataClass(ABC, Generic[RT]):
+class BaseDataClass(ABC, Generic[RT], metaclass=SlotsMeta):
     """
     The base class used for all dataclasses. This class is inteded to
-    be inherited, and shouldn't be created directly.
+    be inherited, and shouldn't be created directly. Dataclasses use
+    slots built from their annotations, so they don't carry a ``__dict__``.
     """
 
     id: int
     #: This is reference to the client that created the dataclass.
     client: 'Client'
-    #: This is an interface for the HTTP manager.
-    rec_net: 'RouteManager'
-    #: Data returned by an API request.
+    #: Data returned by an API request. It's dropped after decoding if the client doesn't keep data.
     data: Optional[RT] = None
+    #: The fields of the dataclass which are decoded from data on first access.
+    lazy_fields: ClassVar[Dict[str, LazyField]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.lazy_fields = {
+            name: value 
+            for base in reversed(cls.__mro__) 
+            for name, value in vars(base).items() 
+            if isinstance(value, LazyField)
+        }
 
     def __init__(self, client: 'Client', id: int, data: Optional[RT] = None) -> None:
+        for name, value in self.__field_defaults__.items(): setattr(self, name, value)
         self.client = client
-        self.rec_net = client.rec_net
         self.id = id
         if data is not None: self.patch_data(data)
 
+    @property
+    def rec_net(self) -> 'RouteManager':
+        """
+        This is an interface for the HTTP manager.
+        """
+        return self.client.rec_net
+
     @classmethod
     def create_from_id_list(cls, client: 'Client', ids: List[int]):
         """
@@ -38,6 +57,19 @@ class BaseDataClass(ABC, Generic[RT]):
             dataclass_list.append(dataclass_obj)
         return dataclass_list
 
+    def patch_lazy_fields(self) -> None:
+        """
+        Forgets the decoded values of lazy fields, so they're decoded
+        from the new data on their next access. If the client has lazy
+        fields disabled, or doesn't keep data around to decode them
+        from later, they're all decoded right away instead.
+        """
+        if self.client.lazy_fields and self.client.keep_data:
+            for field in self.lazy_fields.values(): field.reset(self)
+            return
+        for field in self.lazy_fields.values(): setattr(self, field.storage, field.decode(self.data))
+        if not self.client.keep_data: self.data = None
+
     @abstractmethod
     def patch_data(self, data: RT) -> None:
         pass
\ No newline at end of file
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Dict, Optional, List
 
 from .base import BaseDataClass
 from .event_response import EventInteraction
-from ..misc import date_to_unix
+from ..misc import date_to_unix, LazyField
 from ..misc.constants import ACCESSIBILITY_DICT
 
 if TYPE_CHECKING:
@@ -39,21 +39,21 @@ class Event(BaseDataClass['EventResponse']):
     #: This is the description of the event.
     description: str
     #: This is the date the event will start represented as an Unix integer.
-    start_time: int
+    start_time: int = LazyField(lambda data: date_to_unix(data['StartTime']))
     #: This is the date the event will end represented as an Unix integer.
-    end_time: int
+    end_time: int = LazyField(lambda data: date_to_unix(data['EndTime']))
     #: This is the number of people attending the event.
     attendee_count: int
     #: This is the visibility of the event which has the possible values of ``['Private', 'Public', 'Unlisted']``.
-    accessibility: str
+    accessibility: str = LazyField(lambda data: ACCESSIBILITY_DICT.get(data['Accessibility'], "Unknown"))
     #: This is true if the event supports broadcasting, false if it doesn't.
     is_multi_instance: bool
     #: This is true if the event has cross-instance chat enabled, false if it doesn't. 
     support_multi_instance_room_chat: bool
     #: This defines who has broadcasting permissions which has the possible values of ``[None, 'Room Owners', 'All']``
-    default_broadcast_permissions: str
+    default_broadcast_permissions: str = LazyField(lambda data: BROADCAST_PERMISSION_DICT.get(data['DefaultBroadcastPermissions'], "Unknown"))
     #: This defines who can request to broadcast which has the possible values of ``[None, 'Room Owners', 'All']``
-    can_request_broadcast_permissions: str
+    can_request_broadcast_permissions: str = LazyField(lambda data: BROADCAST_PERMISSION_DICT.get(data['CanRequestBroadcastPermissions'], "Unkown"))
     #: This is an account object which represents who created the event.
     creator_player: Optional['Account'] = None
     #: This is a room object which represents the room where the event is taking place.
@@ -78,14 +78,10 @@ class Event(BaseDataClass['EventResponse']):
         self.club = data['ClubId']
         self.name = data['Name']
         self.description = data['Description']
-        self.start_time = date_to_unix(data['StartTime'])
-        self.end_time = date_to_unix(data['EndTime'])
         self.attendee_count = data['AttendeeCount']
-        self.accessibility = ACCESSIBILITY_DICT.get(data['Accessibility'], "Unknown")
         self.is_multi_instance = data['IsMultiInstance']
         self.support_multi_instance_room_chat = data['SupportMultiInstanceRoomChat']
-        self.default_broadcast_permissions = BROADCAST_PERMISSION_DICT.get(data['DefaultBroadcastPermissions'], "Unknown")
-        self.can_request_broadcast_permissions = BROADCAST_PERMISSION_DICT.get(data['CanRequestBroadcastPermissions'], "Unkown")
+        self.patch_lazy_fields()
 
     async def get_images(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Image']:
         """
@@ -98,7 +94,7 @@ class Event(BaseDataClass['EventResponse']):
         :return: A list of images.
         """
         if self.images is None or force:
-            self.images = await self.client.images.during_event(self.id, take = take, skip = skip)
+            self.images = await self.client.images.during_event(self.id, take = take, skip = skip, force = force)
         return self.images
 
     async def get_creator_player(self, force: bool = False) -> 'Account':
@@ -110,7 +106,7 @@ class Event(BaseDataClass['EventResponse']):
         :return: An account object.
         """
         if self.creator_player is None or force:
-            self.creator_player = await self.client.accounts.fetch(self.creator_player_id)
+            self.creator_player = await self.client.accounts.fetch(self.creator_player_id, force = force)
         return self.creator_player
 
     async def get_room(self, include: int = 0, force: bool = False) -> Optional['Room']:
@@ -137,7 +133,7 @@ class Event(BaseDataClass['EventResponse']):
         :return: A room object.
         """
         if self.room is None or force:
-            self.room = await self.client.rooms.fetch(self.room_id, include = include)
+            self.room = await self.client.rooms.fetch(self.room_id, include = include, force = force)
         return self.room
 
     async def get_responses(self, force: bool = False) -> List['EventInteraction']:
@@ -149,7 +145,7 @@ class Event(BaseDataClass['EventResponse']):
         :return: A list of event interaction objects.
         """
         if self.responses is None or force:
-            data: Response[List['EventResponseResponse']] = await self.rec_net.api.playerevents.v1(self.id).responses.make_request('get')
+            data: Response[List['EventResponseResponse']] = await self.rec_net.api.playerevents.v1(self.id).responses.make_request('get', force = force)
             self.responses = EventInteraction.create_from_list(data.data)
         return self.responses
 
@@ -170,6 +166,6 @@ class Event(BaseDataClass['EventResponse']):
                 player = self.client.accounts.create_dataclass(response.player_id)
                 response.player = player
                 players[response.player_id] = player
-            data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {"id": players.keys()})
+            data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {"id": list(players)}, idempotent = True, force = force)
             for data_response in data.data: players.get(data_response['accountId']).patch_data(data_response)
         return self.responses
\ No newline at end of file
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, List, Optional, Dict
 
 from .base import BaseDataClass
 from .comment import Comment
-from ..misc import date_to_unix
+from ..misc import date_to_unix, LazyField
 from ..misc.constants import ACCESSIBILITY_DICT
 
 if TYPE_CHECKING:
@@ -29,9 +29,9 @@ class Image(BaseDataClass['ImageResponse']):
     #: This is an image's unique identifier.
     id: int
     #: This is the type of image which has the possible value of ``[None, 'Share Camera', 'Outfit Thumbnail', 'Room Thumbnail', 'Profile Thumbnail', 'Invention Thumbnail', 'Player Event Thumbnail', 'Room Load Screen']``.
-    type: str
+    type: str = LazyField(lambda data: IMAGE_TYPE.get(data['Type'], "Unknown"))
     #: This is the visibilty of the image which has the possible value of ``['Private', 'Public', 'Unlisted']``.
-    accessibility: str
+    accessibility: str = LazyField(lambda data: ACCESSIBILITY_DICT.get(data['Accessibility'], "Unknown"))
     #: This is true if the accessiblity of the image is fixed, false if its able to able to be changed.
     accessibility_locked: bool
     #: This is the file name of the image itself.
@@ -47,7 +47,7 @@ class Image(BaseDataClass['ImageResponse']):
     #: This is the event the image was taken during.
     event_id: Optional[int]
     #: This is the date the image was taken on represented as an Unix integer.
-    created_at: int
+    created_at: int = LazyField(lambda data: date_to_unix(data['CreatedAt']))
     #: This is the number of cheers the image has recieved.
     cheer_count: int
     #: This is the number of comments the post has recieved.
@@ -75,8 +75,6 @@ class Image(BaseDataClass['ImageResponse']):
         """
         self.data = data
         self.id = data['Id']
-        self.type = IMAGE_TYPE.get(data['Type'], "Unknown")
-        self.accessibility = ACCESSIBILITY_DICT.get(data['Accessibility'], "Unknown")
         self.accessibility_locked = data['AccessibilityLocked']
         self.image_name = data['ImageName']
         self.description = data['Description']
@@ -84,9 +82,9 @@ class Image(BaseDataClass['ImageResponse']):
         self.tagged_player_ids = data['TaggedPlayerIds']
         self.room_id = data['RoomId']
         self.event_id = data['PlayerEventId']
-        self.created_at = date_to_unix(data['CreatedAt'])
         self.cheer_count = data['CheerCount']
         self.comment_count = data['CommentCount']
+        self.patch_lazy_fields()
 
     async def get_player(self, force: bool = False) -> 'Account':
         """
@@ -97,7 +95,7 @@ class Image(BaseDataClass['ImageResponse']):
         :return: An account object.
         """
         if self.player is None or force:
-            self.player = await self.client.accounts.fetch(self.player_id)
+            self.player = await self.client.accounts.fetch(self.player_id, force = force)
         return self.player
 
     async def get_tagged_players(self, force: bool = False) -> List['Account']:
@@ -110,7 +108,7 @@ class Image(BaseDataClass['ImageResponse']):
         """
         if not self.tagged_player_ids: return []
         if self.tagged_players is None or force:
-            self.tagged_players = await self.client.accounts.fetch_many(self.tagged_player_ids)
+            self.tagged_players = await self.client.accounts.fetch_many(self.tagged_player_ids, force = force)
         return self.tagged_players
 
     async def get_room(self, include: int = 0, force: bool = False) -> 'Room':
@@ -136,7 +134,7 @@ class Image(BaseDataClass['ImageResponse']):
         """
         if self.room_id is None: return None
         if self.room is None or force:
-            self.room = await self.client.rooms.fetch(self.room_id, include)
+            self.room = await self.client.rooms.fetch(self.room_id, include, force = force)
         return self.room
 
     async def get_event(self, force: bool = False) -> Optional['Event']:
@@ -149,7 +147,7 @@ class Image(BaseDataClass['ImageResponse']):
         """
         if self.event_id is None: return None
         if self.event is None or force:
-            self.event = await self.client.events.fetch(self.event_id)
+            self.event = await self.client.events.fetch(self.event_id, force = force)
         return self.event
         
     async def get_cheers(self, force: bool = False) -> List[int]:
@@ -162,7 +160,7 @@ class Image(BaseDataClass['ImageResponse']):
         """        
         if self.cheer_count == 0: return []
         if self.cheer_player_ids is None or force:
-            data: 'Response[List[int]]' = await self.rec_net.api.images.v1(self.id).cheers.make_request('get')
+            data: 'Response[List[int]]' = await self.rec_net.api.images.v1(self.id).cheers.make_request('get', force = force)
             self.cheer_player_ids = data.data           
         return self.cheer_player_ids
 
@@ -176,7 +174,7 @@ class Image(BaseDataClass['ImageResponse']):
         """
         if self.comment_count == 0: return []
         if self.comments is None or force:
-            data: 'Response[List[CommentResponse]]' = await self.rec_net.api.images.v1(self.id).comments.make_request('get')
+            data: 'Response[List[CommentResponse]]' = await self.rec_net.api.images.v1(self.id).comments.make_request('get', force = force)
             self.comments = Comment.create_from_list(data.data)
         return self.comments
 
@@ -191,7 +189,7 @@ class Image(BaseDataClass['ImageResponse']):
         if not self.cheer_player_ids: return []
         if self.cheer_players is None or force:
             player_ids = await self.get_cheers(force)
-            self.cheer_players = await self.client.accounts.fetch_many(player_ids)
+            self.cheer_players = await self.client.accounts.fetch_many(player_ids, force = force)
         return self.cheer_players
 
     async def resolve_commenters(self, force: bool = False) -> List['Comment']:
@@ -211,6 +209,6 @@ class Image(BaseDataClass['ImageResponse']):
                 player = self.client.accounts.create_dataclass(comment.player_id)
                 comment.player = player
                 players[comment.player_id] = player
-            data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {id: players.keys})
+            data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {"id": list(players)}, idempotent = True, force = force)
             for data_response in data.data: players.get(data_response['accountId']).patch_data(data_response)
         return self.comments
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 from .base import BaseDataClass
 from .invention_version import InventionVersion
 from .tag import Tag
-from ..misc import date_to_unix
+from ..misc import date_to_unix, LazyField
 from ..misc.constants import ACCESSIBILITY_DICT
 
 if TYPE_CHECKING:
@@ -39,19 +39,19 @@ class Invention(BaseDataClass['InventionResponse']):
     #: This is an integer that represents the current version of the invention.
     current_version_number: int
     #: This is an invention version object that represents the current version of the invention.
-    current_version: InventionVersion
+    current_version: InventionVersion = LazyField(lambda data: InventionVersion(data['CurrentVersion']))
     #: This is the visibilty of the invention which has the possible value of ``['Private', 'Public', 'Unlisted']``.
-    accessibility: str
+    accessibility: str = LazyField(lambda data: ACCESSIBILITY_DICT.get(data['Accessibility'], 'Unknown'))
     #: If true the invention has been published to the store. 
     is_published: bool
     #: If true the invention has been featured.
     is_featured: bool
     #: This is the date the invention was last modified represented as an Unix integer.
-    modified_at: int
+    modified_at: int = LazyField(lambda data: date_to_unix(data['ModifiedAt']))
     #: This is the date the invention was created represented as an Unix integer.
-    created_at: int
+    created_at: int = LazyField(lambda data: date_to_unix(data['CreatedAt']))
     #: This is the date the invention was first published to the store represented as an Unix integer.
-    first_published_at: int
+    first_published_at: int = LazyField(lambda data: date_to_unix(data['FirstPublishedAt']))
     #: This is the id of the room the invention was created in.
     creation_room_id: int
     #: This is the number of players who have used the invention in one of their rooms.
@@ -61,9 +61,9 @@ class Invention(BaseDataClass['InventionResponse']):
     #: This is the number of cheers the invention has recieved.
     cheer_count: int
     #: This the permission level of the creator which has the possible values of ``['Unassigned', 'Limited One Use Only', 'Disallow Key Lock', 'Use Only', 'Edit and Save', 'Publish', 'Charge', 'Unlimited']``.
-    creator_permission: str
+    creator_permission: str = LazyField(lambda data: INVENTION_PERMISSION_DICT.get(data['CreatorPermission'], 'Unknown'))
     #: This the general permission level of the invention which has the possible values of ``['Unassigned', 'Limited One Use Only', 'Disallow Key Lock', 'Use Only', 'Edit and Save', 'Publish', 'Charge', 'Unlimited']``.
-    general_permission: str
+    general_permission: str = LazyField(lambda data: INVENTION_PERMISSION_DICT.get(data['GeneralPermission'], 'Unknown'))
     #: If true this is an invention that is from RecRoomInc.
     is_ag_invention: bool
     #: If true this invention has been certified.
@@ -94,24 +94,18 @@ class Invention(BaseDataClass['InventionResponse']):
         self.description = data['Description']
         self.image_name = data['ImageName']
         self.current_version_number = data['CurrentVersionNumber']
-        self.current_version = InventionVersion(data['CurrentVersion'])
-        self.accessibility = ACCESSIBILITY_DICT.get(data['Accessibility'], 'Unknown')
         self.is_published = data['IsPublished']
         self.is_featured = data['IsFeatured']
-        self.modified_at = date_to_unix(data['ModifiedAt'])
-        self.created_at = date_to_unix(data['CreatedAt'])
-        self.first_published_at = date_to_unix(data['FirstPublishedAt'])
         self.creation_room_id = data['CreationRoomId']
         self.num_players_have_used_in_room = data['NumPlayersHaveUsedInRoom']
         self.num_downloads = data['NumDownloads']
         self.cheer_count = data['CheerCount']
-        self.creator_permission = INVENTION_PERMISSION_DICT.get(data['CreatorPermission'], 'Unknown')
-        self.general_permission = INVENTION_PERMISSION_DICT.get(data['GeneralPermission'], 'Unknown')
         self.is_ag_invention = data['IsAGInvention']
         self.is_certified_invention = data['IsCertifiedInvention']
         self.price = data['Price']
         self.allow_trial = data['AllowTrial']
         self.hide_from_player = data['HideFromPlayer']
+        self.patch_lazy_fields()
 
     async def get_creator_player(self, force: bool = False) -> 'Account':
         """
@@ -122,7 +116,7 @@ class Invention(BaseDataClass['InventionResponse']):
         :return: An account object.
         """
         if self.creator_player is None or force:
-            self.creator_player = await self.client.accounts.fetch(self.creator_player_id)
+            self.creator_player = await self.client.accounts.fetch(self.creator_player_id, force = force)
         return self.creator_player
 
     async def get_creation_room(self, include: int = 0, force: bool = False) -> 'Room':
@@ -148,7 +142,7 @@ class Invention(BaseDataClass['InventionResponse']):
         :return: A room object.
         """
         if self.creation_room is None or force:
-            self.creation_room = await self.client.rooms.fetch(self.creation_room_id, include)
+            self.creation_room = await self.client.rooms.fetch(self.creation_room_id, include, force = force)
         return self.creation_room
 
     async def get_tags(self, force: bool = False) -> List['Tag']:
@@ -160,7 +154,7 @@ class Invention(BaseDataClass['InventionResponse']):
         :return: A list of tag objects.
         """
         if self.tags is None or force:
-            data: 'Response[List[TagResponse]]' = await self.rec_net.api.inventions.v1.details.make_request('get', params = {'inventionId': self.id})
+            data: 'Response[List[TagResponse]]' = await self.rec_net.api.inventions.v1.details.make_request('get', params = {'inventionId': self.id}, force = force)
             self.tags = Tag.create_from_list(data.data["Tags"])
         return self.tags
 
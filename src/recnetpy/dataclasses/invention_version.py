@@ -1,9 +1,11 @@
 from typing import TYPE_CHECKING
 
+from ..misc import SlotsMeta
+
 if TYPE_CHECKING:
     from ..misc.api_responses import CurrentVersion
 
-class InventionVersion:
+class InventionVersion(metaclass=SlotsMeta):
     """
     This object is an invention partial that represents a version of an invention.
     """
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 
 from .base import BaseDataClass
 from .subroom import SubRoom
@@ -7,7 +7,7 @@ from .tag import Tag
 from .promo_external_content import PromoExternalContent
 from .score import Score
 from .loading_screen import LoadScreen
-from ..misc import bitmask_decode, date_to_unix
+from ..misc import bitmask_decode, date_to_unix, LazyField
 from ..misc.constants import ACCESSIBILITY_DICT
 
 if TYPE_CHECKING:
@@ -29,7 +29,7 @@ MAX_PLAYER_CALCULATION_MODE: Dict[int, str] = {
     1: "Only Entry Subrooms"
 }
 
-WARNING_MASK_LIST: List[str] = ["Spooky/scary themes", "Mature themes", "Bright/flashing lights", "Intense motion", "Gore/violence", "Custom"]
+WARNING_MASK_LIST: Tuple[str, ...] = ("Spooky/scary themes", "Mature themes", "Bright/flashing lights", "Intense motion", "Gore/violence", "Custom")
 
 class Room(BaseDataClass['RoomResponse']):
     """
@@ -41,7 +41,7 @@ class Room(BaseDataClass['RoomResponse']):
     #: If true this room is a player's dorm.
     is_dorm: int
     #: Determines how the max number of players is calculated which has the possible values ``['All Subrooms', 'Only Entry Subrooms']``. 
-    max_player_calculation_mode: str
+    max_player_calculation_mode: str = LazyField(lambda data: MAX_PLAYER_CALCULATION_MODE.get(data["MaxPlayerCalculationMode"], "Unknown"))
     #: This is the max number of players allowed to join the room.
     max_players: int
     #: If true players can clone this room.
@@ -62,16 +62,16 @@ class Room(BaseDataClass['RoomResponse']):
     description: str
     #: This is the file name of the rooms thumbnail.
     image_name: Optional[str]
-    #: This is a list of warnings for the room that can have any of these possible valuess ``["Custom", "Spooky/scary themes", "Mature themes", "Bright/flashing lights", "Intense motion", "Gore/violence"]``
-    warnings: List[str]
+    #: This is a tuple of warnings for the room that can have any of these possible valuess ``["Custom", "Spooky/scary themes", "Mature themes", "Bright/flashing lights", "Intense motion", "Gore/violence"]``
+    warnings: Tuple[str, ...] = LazyField(lambda data: bitmask_decode(data["WarningMask"], WARNING_MASK_LIST))
     #: This is a custom warning for the room.
     custom_warning: Optional[str]
     #: This is the id of the player who created the room.
     creator_account_id: int
     #: This is the current state of the room which has the possible values of ``['Active', 'Junior Pending', 'Moderation Pending', 'Moderation Closed', 'Moderation Banned', 'Marked For Delete']``.
-    state: str 
+    state: str = LazyField(lambda data: ROOM_MODERATION_STATE.get(data["State"], "Unknown"))
     #: This is the visibilty of the room which has the possible value of ``['Private', 'Public', 'Unlisted']``.
-    accessibility: str
+    accessibility: str = LazyField(lambda data: ACCESSIBILITY_DICT.get(data["Accessibility"], "Unknown"))
     #: If true players can vote on the next level.
     supports_level_voting: bool
     #: If true the room was published by coach.
@@ -93,7 +93,7 @@ class Room(BaseDataClass['RoomResponse']):
     #: This is the minimum level requried to join the room.
     min_level: int
     #: This is the date the room was created represented as an Unix integer.
-    created_at: int
+    created_at: int = LazyField(lambda data: date_to_unix(data["CreatedAt"]))
     #: This is the number of players that cheered the room.
     cheer_count: int
     #: This is the number of players who have the room favorited.
@@ -105,19 +105,19 @@ class Room(BaseDataClass['RoomResponse']):
     #: This is an account object which represents the player who created the room.
     creator_account: Optional['Account'] = None
     #: This a list of subroom objects which represents the room's subrooms.
-    subrooms: Optional[List['SubRoom']] = None
+    subrooms: Optional[List['SubRoom']] = LazyField(lambda data: SubRoom.create_from_list(data.get("SubRooms")), None)
     #: This a list of role objects which represents the room's player roles.
-    roles: Optional[List['Role']] = None
+    roles: Optional[List['Role']] = LazyField(lambda data: Role.create_from_list(data.get("Roles")), None)
     #: This a list of tag objects which represents the room's tags.
-    tags: Optional[List['Tag']] = None
+    tags: Optional[List['Tag']] = LazyField(lambda data: Tag.create_from_list(data.get("Tags")), None)
     #: This is a list of file names for a room's promotional images. 
     promo_images: Optional[List[str]] = None
     #: This is a list of promotional content objects that represent's a rooms promo content.
-    promo_external_content: Optional[List['PromoExternalContent']] = None
+    promo_external_content: Optional[List['PromoExternalContent']] = LazyField(lambda data: PromoExternalContent.create_from_list(data.get("PromoExternalContent")), None)
     #: This is a list of score objects that represents a room's ranking.
-    scores: Optional[List['Score']] = None
+    scores: Optional[List['Score']] = LazyField(lambda data: Score.create_from_list(data.get("Scores")), None)
     #: This is a list of load screen objects that represents a room's loading screens.
-    load_screens: Optional[List['LoadScreen']] = None
+    load_screens: Optional[List['LoadScreen']] = LazyField(lambda data: LoadScreen.create_from_list(data.get("LoadScreens")), None)
     #: This is a list of images that were taken in the room.
     images: Optional[List['Image']] = None
     #: This is a list of events that are happening in the room.
@@ -133,7 +133,6 @@ class Room(BaseDataClass['RoomResponse']):
         self.data = data
         self.id = data["RoomId"]
         self.is_dorm = data["IsDorm"]
-        self.max_player_calculation_mode = MAX_PLAYER_CALCULATION_MODE.get(data["MaxPlayerCalculationMode"], "Unknown")
         self.max_players = data["MaxPlayers"]
         self.cloning_allowed = data["CloningAllowed"]
         self.disable_mic_auto_mute = data["DisableMicAutoMute"]
@@ -144,11 +143,8 @@ class Room(BaseDataClass['RoomResponse']):
         self.name = data["Name"]
         self.description = data["Description"]
         self.image_name = data["ImageName"]
-        self.warnings = bitmask_decode(data["WarningMask"], WARNING_MASK_LIST)
         self.custom_warning = data["CustomWarning"]
         self.creator_account_id = data["CreatorAccountId"]
-        self.state = ROOM_MODERATION_STATE.get(data["State"], "Unknown")
-        self.accessibility = ACCESSIBILITY_DICT.get(data["Accessibility"], "Unknown")
         self.supports_level_voting = data["SupportsLevelVoting"]
         self.is_rro = data["IsRRO"]
         self.supports_screens = data["SupportsScreens"]
@@ -159,18 +155,12 @@ class Room(BaseDataClass['RoomResponse']):
         self.supports_mobile = data["SupportsMobile"]
         self.supports_juniors = data["SupportsJuniors"]
         self.min_level = data["MinLevel"]
-        self.created_at = date_to_unix(data["CreatedAt"])
         self.cheer_count = data["Stats"]["CheerCount"]
         self.favorite_count = data["Stats"]["FavoriteCount"]
         self.visitor_count = data["Stats"]["VisitorCount"]
         self.visit_count = data["Stats"]["VisitCount"]
-        self.subrooms = SubRoom.create_from_list(data.get("SubRooms"))
-        self.roles = Role.create_from_list(data.get("Roles"))
-        self.tags = Tag.create_from_list(data.get("Tags"))
         self.promo_images = data.get("PromoImages")
-        self.promo_external_content = PromoExternalContent.create_from_list(data.get("PromoExternalContent"))
-        self.scores = Score.create_from_list(data.get("Scores"))
-        self.load_screens = LoadScreen.create_from_list(data.get("LoadScreens")) 
+        self.patch_lazy_fields()
 
     async def get_images(self, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Image']:
         """
@@ -184,7 +174,7 @@ class Room(BaseDataClass['RoomResponse']):
         :return: A list of images.
         """
         if self.images is None or force:
-            self.images = await self.client.images.in_room(self.id, take = take, skip = skip, sort = sort)
+            self.images = await self.client.images.in_room(self.id, take = take, skip = skip, sort = sort, force = force)
         return self.images
 
     async def get_events(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Event']:
@@ -198,7 +188,7 @@ class Room(BaseDataClass['RoomResponse']):
         :return: A list of events.
         """
         if self.events is None or force:
-            self.events = await self.client.events.in_room(self.id, take = take, skip = skip)
+            self.events = await self.client.events.in_room(self.id, take = take, skip = skip, force = force)
         return self.events
 
     async def get_creator_player(self, force: bool = False) -> 'Account':
@@ -210,7 +200,7 @@ class Room(BaseDataClass['RoomResponse']):
         :return: An account object.
         """
         if self.creator_account is None or force:
-            self.creator_account = await self.client.accounts.fetch(self.creator_account_id)
+            self.creator_account = await self.client.accounts.fetch(self.creator_account_id, force = force)
         return self.creator_account
 
     async def resolve_role_owners(self) -> Optional[List['Role']]:
@@ -228,7 +218,7 @@ class Room(BaseDataClass['RoomResponse']):
             account = self.client.accounts.create_dataclass(role.account_id)
             role.account = account
             accounts[role.account_id] = account
-        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {"id": accounts.keys()})
+        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.account.bulk.make_request('post', body = {"id": list(accounts)}, idempotent = True)
         for data_response in data.data: accounts.get(data_response['accountId']).patch_data(data_response)
 
         # Search for deleted accounts
@@ -34,8 +34,10 @@ class SubRoom(VariableClass['SubRoomResponse']):
     accessibility: str
     #: The blob that contains the data
     data_blob: Optional[str]
-    #: The user who saved the last
+    #: The date the data was last saved represented as an Unix integer.
     data_saved_at: Optional[int]
+    #: The id of the player who last saved the data.
+    data_saved_by: int
     #: The latest save description for the subroom
     description: Optional[str]
 
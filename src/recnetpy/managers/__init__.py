@@ -1,6 +1,30 @@
-from .base_manager import BaseManager
-from .account_manager import AccountManager
-from .event_manager import EventManager
-from .image_manager import ImageManager
-from .invention_manager import InventionManager
-from .room_manager import RoomManager
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from ..misc import lazy_import
+
+if TYPE_CHECKING:
+    from .batch_loader import BatchLoader
+    from .paginator import Paginator, Page
+    from .worker_pool import WorkerPool
+    from .columnar import ColumnarCollection
+    from .identity_map import IdentityMap
+    from .base_manager import BaseManager
+    from .account_manager import AccountManager
+    from .event_manager import EventManager
+    from .image_manager import ImageManager
+    from .invention_manager import InventionManager
+    from .room_manager import RoomManager
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".batch_loader": ["BatchLoader"],
+    ".paginator": ["Paginator", "Page"],
+    ".worker_pool": ["WorkerPool"],
+    ".columnar": ["ColumnarCollection"],
+    ".identity_map": ["IdentityMap"],
+    ".base_manager": ["BaseManager"],
+    ".account_manager": ["AccountManager"],
+    ".event_manager": ["EventManager"],
+    ".image_manager": ["ImageManager"],
+    ".invention_manager": ["InventionManager"],
+    ".room_manager": ["RoomManager"],
+})
\ No newline at end of file
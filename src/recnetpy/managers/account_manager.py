@@ -12,7 +12,10 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
     This is a factory object for creating account objects. Its the
     main interface for fetching account related data.
     """
-    async def get(self, name: str) -> Optional['Account']:
+    #: This is the dataclass the manager is responsible for creating.
+    dataclass = Account
+
+    async def get(self, name: str, force: bool = False) -> Optional['Account']:
         """
         Gets user data by their username, and returns it as an account object.
         Returns nothing if the account doesn't exist.
@@ -20,13 +23,14 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
         Authorization required.
 
         :param name: The username of the RecNet user.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An account object representing the data or nothing if not found. 
         """
-        data: 'Response[AccountResponse]' = await self.rec_net.accounts.make_request('get', params = {'username': str(name)})
+        data: 'Response[AccountResponse]' = await self.rec_net.accounts.make_request('get', params = {'username': str(name)}, force = force)
         if data.success and data.data: return self.create_dataclass(data.data['accountId'], data.data)
         return None
 
-    async def fetch(self, id: int) -> Optional['Account']:
+    async def fetch(self, id: int, force: bool = False) -> Optional['Account']:
         """
         Gets user data by their id, and returns it as an account object.
         Returns nothing if an account with the specified id doesn't exist.
@@ -34,44 +38,48 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
         Authorization required.
 
         :param id: The id of the RecNet user.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An account object representing the data or nothing if not found. 
         """
-        data: 'Response[AccountResponse]' = await self.rec_net.accounts(id).make_request('get')
+        if self.loader is not None and not force: return await self.loader.load(id)
+        data: 'Response[AccountResponse]' = await self.rec_net.accounts(id).make_request('get', force = force)
         if data.success and data.data: return self.create_dataclass(id, data.data)
         return None
     
-    async def get_many(self, names: List[str]) -> List['Account']:
+    async def get_many(self, names: List[str], force: bool = False) -> List['Account']:
         """
         Gets a list of users by a list of usernames, and returns 
         a list of account object.
         Accounts that couldn't be found will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         Authorization required.
 
         :param names: A list of username.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of account objects. 
         """
         bulk = stringify_bulk(names)
-        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.bulk.make_request('post', body = {'name': bulk})
-        if data.success: return self.create_from_data_list(data.data)
-        return []
+        request = lambda chunk: self.rec_net.accounts.bulk.make_request('post', body = {'name': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, bulk, 'name', lambda account: account['username'], str.lower))
 
-    async def fetch_many(self, ids: List[int]) -> List['Account']:
+    async def fetch_many(self, ids: List[int], force: bool = False) -> List['Account']:
         """
         Gets a list of users by a list of ids, and returns 
         a list of account object.
         Accounts that couldn't be found will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         Authorization required.
 
         :param ids: A list of ids.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of account objects. 
         """
-        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.bulk.make_request('post', body = {'id': ids})
-        if data.success: return self.create_from_data_list(data.data)
-        return []
+        request = lambda chunk: self.rec_net.accounts.bulk.make_request('post', body = {'id': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, ids, 'id', lambda account: account['accountId'], int))
 
-    async def search(self, query: str) -> List['Account']:
+    async def search(self, query: str, force: bool = False) -> List['Account']:
         """
         Searches RecNet for users based on a query, and returns
         a list of account objects.
@@ -80,9 +88,10 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
         Authorization required.
 
         :param query: A search query string.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of account objects.
         """
-        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.search.make_request('get', params = {'name': str(query)})
+        data: 'Response[List[AccountResponse]]' = await self.rec_net.accounts.search.make_request('get', params = {'name': str(query)}, force = force)
         if data.success: return self.create_from_data_list(data.data)
         return []
 
@@ -94,7 +103,7 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
         :param data: An account api response.
         :return: Returns an account object.
         """
-        return Account(self.client, id, data)
+        return self.identify(id, data)
 
     def create_from_data_list(self, data: List['AccountResponse']) -> List['Account']:
         """
@@ -105,7 +114,7 @@ class AccountManager(BaseManager['Account', 'AccountResponse']):
         """
         account_list: List['Account'] = []
         for account_data in data:
-            account_obj = Account(self.client, account_data['accountId'], account_data)
+            account_obj = self.create_dataclass(account_data['accountId'], account_data)
             account_list.append(account_obj)
         return account_list
 
@@ -1,15 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, List, Optional, TypeVar, TypedDict, Type
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar, TypedDict, Type
+from asyncio import gather
+from operator import attrgetter
+
+from .batch_loader import BatchLoader
+from .identity_map import IdentityMap
+from .paginator import Paginator
+from ..misc import chunk_bulk
+from ..rest.exceptions import HTTPError, BulkFetchError, DeadlineExceeded
 
 if TYPE_CHECKING:
     from .. import Client
-    from ..rest import RouteManager
+    from ..rest import RouteManager, Response
     from ..dataclasses import BaseDataClass
+    from .columnar import ColumnarCollection
 
 
 BDC = TypeVar("BDC", bound='BaseDataClass')
 RT = TypeVar("RT", bound=TypedDict)
 
+#: Statuses which mean a bulk request should be split into smaller ones.
+SPLIT_STATUSES = frozenset({400, 413, 414})
+
 class BaseManager(ABC, Generic[BDC, RT]):
     """
     The base class used by all managers. This class 
@@ -23,18 +35,92 @@ class BaseManager(ABC, Generic[BDC, RT]):
     client: 'Client'
     #: This is an interface for the HTTP manager.
     rec_net: 'RouteManager'
+    #: This batches individual fetches into bulk requests, if batching is enabled.
+    loader: Optional[BatchLoader[BDC]]
+    #: This maps ids to the one live object of each id, if the identity map is enabled.
+    identity_map: Optional[IdentityMap[BDC]]
+    #: This is the max number of elements sent in a single bulk request.
+    bulk_chunk_size: int = 100
+    #: This is the max size of a single bulk request body in bytes.
+    bulk_max_bytes: int = 8192
+    #: These extract the numeric fields stored by columnar collections from API responses, keyed by attribute name.
+    column_getters: Dict[str, Callable[[RT], Optional[int]]] = {}
 
     def __init__(self, client: 'Client'):
         self.client = client
         self.rec_net = client.rec_net
+        self.loader = None
+        self.identity_map = None
+
+    @property
+    def supports_batching(self) -> bool:
+        """
+        True if the manager has a bulk endpoint fetches can be batched into.
+        """
+        return hasattr(self, 'fetch_many')
+
+    def enable_batching(self, delay: float = 0, max_batch_size: int = 100) -> None:
+        """
+        Makes individual fetches, which are made within the same
+        event loop tick or delay, get sent as a single bulk request.
+
+        :param delay: The number of seconds to wait for more fetches, 0 waits until the next tick.
+        :param max_batch_size: A batch is sent immediately once it reaches this many ids.
+        """
+        if not self.supports_batching: 
+            raise NotImplementedError(f"{type(self).__name__} doesn't have a bulk endpoint to batch fetches with.")
+        self.loader = BatchLoader(getattr(self, 'fetch_many'), delay, max_batch_size)
+
+    def disable_batching(self) -> None:
+        """
+        Makes each fetch send its own request again.
+        """
+        self.loader = None
+
+    def enable_identity_map(self, pin_size: int = 0) -> None:
+        """
+        Makes the manager return the same object for an id every time,
+        as long as the object is alive. New data for a known id is
+        patched into the existing object.
+
+        :param pin_size: The number of recently used objects kept alive by the manager.
+        """
+        self.identity_map = IdentityMap(pin_size)
+
+    def disable_identity_map(self) -> None:
+        """
+        Makes the manager create a new object for every response again.
+        """
+        self.identity_map = None
+
+    def identify(self, id: int, data: Optional[RT] = None) -> BDC:
+        """
+        Gets the object of an id. If the identity map is enabled and the id
+        is known, the existing object is returned and patched with the data.
+        Otherwise a new object is created.
+
+        :param id: The unique number associated with each data response.
+        :param data: The data from an API response associated with the dataclass.
+        :return: Returns an object representing the data.
+        """
+        if self.identity_map is None: return self.dataclass(self.client, id, data)
+        id = int(id)
+        obj = self.identity_map.get(id)
+        if obj is None:
+            obj = self.dataclass(self.client, id, data)
+            self.identity_map.add(id, obj)
+        elif data is not None:
+            obj.patch_data(data)
+        return obj
 
     @abstractmethod
-    async def fetch(self, id: int) -> BDC:
+    async def fetch(self, id: int, force: bool = False) -> BDC:
         """
         Fetches the data for an object by its id, and returns
         the class representing the data.
 
         :param id: The unique number associated with each data response.
+        :param force: If true, the response cache is bypassed and refreshed.
         :retun: Returns an object representing the data from the data response.
         """
         pass
@@ -59,4 +145,129 @@ class BaseManager(ABC, Generic[BDC, RT]):
         :return: A list of objects.
         """
         pass
-    
\ No newline at end of file
+
+    async def create_from_bulk(self, fetch: Awaitable[List[RT]]) -> List[BDC]:
+        """
+        Creates a list of objects from a bulk fetch. If some
+        chunks failed, the results of the rest are turned into
+        objects before the error is passed on.
+
+        :param fetch: An awaitable bulk fetch, usually from fetch_bulk.
+        :raises BulkFetchError: If any chunk failed, its results are objects.
+        :return: A list of objects.
+        """
+        try:
+            data = await fetch
+        except BulkFetchError as e:
+            e.results = self.create_from_data_list(e.results)
+            raise
+        return self.create_from_data_list(data)
+
+    async def create_from_stream(self, data: AsyncIterator[RT]) -> AsyncIterator[BDC]:
+        """
+        Creates objects from a stream of data, as each element arrives.
+
+        :param data: An async iterator of data from an API response associated with the dataclass.
+        :return: An async iterator of objects.
+        """
+        async for item in data:
+            yield self.create_from_data_list([item])[0]
+
+    def create_collection(self, data: List[RT], use_numpy: Optional[bool] = None) -> 'ColumnarCollection[BDC]':
+        """
+        Creates a columnar collection from a list of data. Numeric 
+        fields are stored in arrays, and objects are only created
+        when they're accessed.
+
+        :param data: A list of data from an API response associated with the dataclass.
+        :param use_numpy: If true, columns are NumPy arrays. Defaults to true if NumPy is installed.
+        :return: A columnar collection.
+        """
+        from .columnar import ColumnarCollection
+        return ColumnarCollection.from_rows(data, self.column_getters, lambda item: self.create_from_data_list([item])[0], use_numpy)
+
+    def to_collection(self, objects: Iterable[BDC], use_numpy: Optional[bool] = None) -> 'ColumnarCollection[BDC]':
+        """
+        Creates a columnar collection from objects that were already
+        created, such as the results of ``fetch_all``.
+
+        :param objects: The objects to store.
+        :param use_numpy: If true, columns are NumPy arrays. Defaults to true if NumPy is installed.
+        :return: A columnar collection.
+        """
+        from .columnar import ColumnarCollection
+        getters = {name: attrgetter(name) for name in self.column_getters}
+        return ColumnarCollection.from_rows(objects, getters, lambda obj: obj, use_numpy)
+
+    def paginate(self, method: Callable[..., Awaitable[List[BDC]]], *args: Any, page_size: int = 64, skip: int = 0, limit: Optional[int] = None, stop: Optional[Callable[[BDC], bool]] = None, prefetch: bool = True, **kwargs: Any) -> Paginator[BDC]:
+        """
+        Creates an async iterator over any method that pages its
+        results with take and skip, such as ``from_account`` or ``search``.
+        The next page is fetched while the current one is processed.
+
+        :param method: The method to page through.
+        :param args: Arguments passed to the method.
+        :param page_size: The number of results requested per page.
+        :param skip: The number of results to skip.
+        :param limit: The max number of results to yield, or None for no limit.
+        :param stop: Iteration stops at the first result this returns true for.
+        :param prefetch: If true, the next page is requested before the current one is processed.
+        :param kwargs: Keyword arguments passed to the method.
+        :return: An async iterator of objects.
+        """
+        fetch_page = lambda take, skip: method(*args, take = take, skip = skip, **kwargs)
+        return Paginator(fetch_page, page_size, skip, limit, stop, prefetch)
+
+    async def fetch_bulk(self, request: Callable[[List[Any]], Awaitable['Response[List[RT]]']], bulk: Iterable[Any], field: str, key: Callable[[RT], Any], normalize: Callable[[Any], Hashable] = lambda element: element) -> List[RT]:
+        """
+        Fetches a bulk of elements in chunks, which are split by both
+        element count and body size and sent concurrently. Duplicate
+        elements are only requested once. A chunk the server rejects
+        as too large or invalid is split in half and retried, so
+        one bad element doesn't fail the whole bulk, and is left
+        out like an element that wasn't found.
+
+        :param request: A function which sends a bulk request for a chunk.
+        :param bulk: The elements to fetch, such as ids or names.
+        :param field: The body field the elements are sent under.
+        :param key: A function which gets the element an API response belongs to.
+        :param normalize: A function which makes elements comparable to the keys of responses.
+        :raises BulkFetchError: If any chunk failed, the results of the rest are included.
+        :raises DeadlineExceeded: If the deadline of the current context passes.
+        :return: A list of API responses in the order of the input, missing elements are left out.
+        """
+        unique: Dict[Hashable, Any] = {}
+        for element in bulk:
+            unique.setdefault(normalize(element), element)
+        found: Dict[Hashable, RT] = {}
+        failed: List[Any] = []
+        errors: List[Exception] = []
+
+        async def fetch_chunk(chunk: List[Any]) -> None:
+            try:
+                resp = await request(chunk)
+            except HTTPError as e:
+                if e.response.status in SPLIT_STATUSES:
+                    # A single rejected element is treated like one that wasn't found
+                    if len(chunk) == 1: return
+                    half = len(chunk) // 2
+                    await gather(fetch_chunk(chunk[:half]), fetch_chunk(chunk[half:]))
+                    return
+                failed.extend(chunk)
+                errors.append(e)
+                return
+            except DeadlineExceeded:
+                # Every chunk shares the deadline, so it fails the whole bulk
+                raise
+            except Exception as e:
+                failed.extend(chunk)
+                errors.append(e)
+                return
+            for item in resp.data or []:
+                found[normalize(key(item))] = item
+
+        chunks = chunk_bulk(unique.values(), self.bulk_chunk_size, self.bulk_max_bytes, field)
+        await gather(*map(fetch_chunk, chunks))
+        results = [found[element] for element in unique if element in found]
+        if errors: raise BulkFetchError(results, failed, errors)
+        return results
@@ -0,0 +1,110 @@
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+from asyncio import Future, Handle, TimeoutError, get_running_loop, wait_for
+from contextvars import Context, copy_context
+
+from ..rest.exceptions import BulkFetchError, DeadlineExceeded
+from ..rest.deadline import current_deadline, remaining
+from ..rest.priority import current_priority
+from ..rest.tenant import current_tenant
+
+if TYPE_CHECKING:
+    from ..dataclasses import BaseDataClass
+
+BDC = TypeVar("BDC", bound='BaseDataClass')
+
+class BatchLoader(Generic[BDC]):
+    """
+    Collects ids which are requested within the same event
+    loop tick, or a short window, and fetches them all with
+    a single bulk request. Results are fanned back out to
+    each caller. The bulk request is made under the latest
+    deadline and the highest priority of the batched callers,
+    while each caller still stops waiting at its own deadline.
+    """
+    #: The number of seconds to wait for more ids, 0 waits until the next tick.
+    delay: float
+    #: A batch is sent immediately once it reaches this many ids.
+    max_batch_size: int
+    __load_many: Callable[[List[int]], Awaitable[List[BDC]]]
+    __pending: Dict[int, List[Future]]
+    __contexts: List[Tuple[Future, Context]]
+    __handle: Optional[Handle]
+
+    def __init__(self, load_many: Callable[[List[int]], Awaitable[List[BDC]]], delay: float = 0, max_batch_size: int = 100) -> None:
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self.__load_many = load_many
+        self.__pending = {}
+        self.__contexts = []
+        self.__handle = None
+
+    async def load(self, id: int) -> Optional[BDC]:
+        """
+        Queues an id to be fetched in the next batch.
+
+        :param id: The id of the object.
+        :raises BulkFetchError: If the chunk the id was fetched in failed.
+        :raises DeadlineExceeded: If the deadline of the current context passes first.
+        :return: The object, or None if it wasn't in the bulk response.
+        """
+        loop = get_running_loop()
+        future = loop.create_future()
+        self.__pending.setdefault(int(id), []).append(future)
+        self.__contexts.append((future, copy_context()))
+        if len(self.__pending) >= self.max_batch_size:
+            self.__dispatch()
+        elif self.__handle is None:
+            if self.delay > 0:
+                self.__handle = loop.call_later(self.delay, self.__dispatch)
+            else:
+                self.__handle = loop.call_soon(self.__dispatch)
+        deadline = current_deadline.get()
+        if deadline is None: return await future
+        try:
+            return await wait_for(future, max(remaining(deadline), 0))
+        except TimeoutError:
+            raise DeadlineExceeded("The deadline passed while waiting for a batched fetch.")
+
+    def __dispatch(self) -> None:
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+        batch, self.__pending = self.__pending, {}
+        contexts, self.__contexts = self.__contexts, []
+        # Ids whose callers have all been cancelled aren't fetched
+        batch = {id: futures for id, futures in batch.items() if not all(future.done() for future in futures)}
+        if not batch: return
+        # The batch runs in a context of its own, rather than the one of whichever caller came first
+        context = self.__batch_context([context for future, context in contexts if not future.done()])
+        context.run(get_running_loop().create_task, self.__run(batch))
+
+    @staticmethod
+    def __batch_context(callers: List[Context]) -> Context:
+        deadlines = [caller.run(current_deadline.get) for caller in callers]
+        priority = min(caller.run(current_priority.get) for caller in callers)
+        tenants = {caller.run(current_tenant.get) for caller in callers}
+        context = Context()
+        context.run(current_deadline.set, None if None in deadlines else max(deadlines))
+        context.run(current_priority.set, priority)
+        context.run(current_tenant.set, tenants.pop() if len(tenants) == 1 else None)
+        return context
+
+    async def __run(self, batch: Dict[int, List[Future]]) -> None:
+        failed = set()
+        error = None
+        try:
+            objects = await self.__load_many(list(batch))
+        except BulkFetchError as e:
+            # Only the callers of ids in the failed chunks get the error
+            objects, failed, error = e.results, set(e.failed), e
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done(): future.set_exception(e)
+            return
+        found = {obj.id: obj for obj in objects}
+        for id, futures in batch.items():
+            for future in futures:
+                if future.done(): continue
+                if id in failed: future.set_exception(error)
+                else: future.set_result(found.get(id))
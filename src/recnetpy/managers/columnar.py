@@ -0,0 +1,267 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union, overload
+from array import array
+from itertools import compress
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from .base_manager import BaseManager
+    from ..dataclasses import BaseDataClass
+
+BDC = TypeVar("BDC", bound='BaseDataClass')
+
+#: The typecode of the arrays columns are stored in, a signed 64 bit integer.
+TYPECODE = 'q'
+
+#: Comparison operators ``where`` accepts.
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+Column = Union[array, 'numpy.ndarray']
+
+class ColumnarCollection(Generic[BDC]):
+    """
+    A collection of objects whose numeric fields, such as ids,
+    counts and dates, are stored column by column in typed arrays,
+    or NumPy arrays if NumPy is installed. Filtering, sorting and
+    grouping work on whole columns, and objects are only created
+    when they're accessed. Missing values are stored as 0.
+    """
+    #: The numeric columns, keyed by the name of the field they hold.
+    columns: Dict[str, Column]
+    #: True if the columns are NumPy arrays.
+    uses_numpy: bool
+    __rows: Sequence[Any]
+    __materialize: Callable[[Any], BDC]
+
+    def __init__(self, columns: Dict[str, Column], rows: Sequence[Any], materialize: Callable[[Any], BDC]) -> None:
+        """
+        :param columns: The numeric columns, keyed by field name.
+        :param rows: The API responses or objects each row was built from. With NumPy columns, an object array.
+        :param materialize: A function which creates an object from a row.
+        """
+        self.columns = columns
+        self.uses_numpy = numpy is not None and isinstance(rows, numpy.ndarray)
+        self.__rows = rows
+        self.__materialize = materialize
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], getters: Dict[str, Callable[[Any], Optional[int]]], materialize: Callable[[Any], BDC], use_numpy: Optional[bool] = None) -> 'ColumnarCollection[BDC]':
+        """
+        Builds a collection by extracting each column from a list of rows.
+
+        :param rows: The API responses or objects to build the collection from.
+        :param getters: Functions which extract the value of each column from a row.
+        :param materialize: A function which creates an object from a row.
+        :param use_numpy: If true, columns are NumPy arrays. Defaults to true if NumPy is installed.
+        :return: A columnar collection.
+        """
+        if use_numpy is None: use_numpy = numpy is not None
+        if use_numpy and numpy is None: raise ImportError("NumPy backed collections require numpy to be installed.")
+        rows = list(rows)
+        columns: Dict[str, Column] = {}
+        for name, getter in getters.items():
+            values = (getter(row) or 0 for row in rows)
+            if use_numpy: columns[name] = numpy.fromiter(values, dtype=numpy.int64, count=len(rows))
+            else: columns[name] = array(TYPECODE, values)
+        if use_numpy:
+            # An object array lets rows be selected as fast as the columns
+            row_array = numpy.empty(len(rows), dtype=object)
+            row_array[:] = rows
+            rows = row_array
+        return cls(columns, rows, materialize)
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def __iter__(self) -> Iterator[BDC]:
+        return map(self.__materialize, self.__rows)
+
+    @overload
+    def __getitem__(self, key: str) -> Column: ...
+    @overload
+    def __getitem__(self, key: int) -> BDC: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, str): return self.columns[key]
+        return self.__materialize(self.__rows[key])
+
+    def to_list(self) -> List[BDC]:
+        """
+        Creates the object of every row.
+
+        :return: A list of objects.
+        """
+        return list(self)
+
+    def take(self, indices: Iterable[int]) -> 'ColumnarCollection[BDC]':
+        """
+        Creates a collection out of the rows at the given positions.
+
+        :param indices: The positions of the rows, in the order they should appear.
+        :return: A new collection.
+        """
+        if self.uses_numpy:
+            indices = numpy.asarray(indices, dtype=numpy.intp)
+            columns = {name: column[indices] for name, column in self.columns.items()}
+            rows = self.__rows[indices]
+        else:
+            indices = list(indices)
+            columns = {name: array(TYPECODE, map(column.__getitem__, indices)) for name, column in self.columns.items()}
+            rows = [self.__rows[index] for index in indices]
+        return ColumnarCollection(columns, rows, self.__materialize)
+
+    def filter(self, mask: Sequence[bool]) -> 'ColumnarCollection[BDC]':
+        """
+        Keeps the rows a mask is true for.
+
+        :param mask: A boolean for every row, such as ``collection['cheer_count'] > 0`` with NumPy.
+        :return: A new collection.
+        """
+        if self.uses_numpy: 
+            return self.take(numpy.flatnonzero(numpy.asarray(mask, dtype=bool)))
+        return self.take(compress(range(len(self)), mask))
+
+    def mask(self, name: str, op: str, value: int) -> Sequence[bool]:
+        """
+        Compares a column against a value.
+
+        :param name: The name of the column.
+        :param op: A comparison operator, one of ``==``, ``!=``, ``<``, ``<=``, ``>`` or ``>=``.
+        :param value: The value to compare against.
+        :return: A boolean for every row.
+        """
+        compare = OPERATORS[op]
+        column = self.columns[name]
+        if self.uses_numpy: return compare(column, value)
+        return [compare(item, value) for item in column]
+
+    def where(self, name: str, op: str, value: int) -> 'ColumnarCollection[BDC]':
+        """
+        Keeps the rows where a column compares true against a value,
+        such as ``where('cheer_count', '>', 0)``.
+
+        :param name: The name of the column.
+        :param op: A comparison operator, one of ``==``, ``!=``, ``<``, ``<=``, ``>`` or ``>=``.
+        :param value: The value to compare against.
+        :return: A new collection.
+        """
+        return self.filter(self.mask(name, op, value))
+
+    def argsort(self, name: str, reverse: bool = False) -> Sequence[int]:
+        """
+        Gets the positions of the rows sorted by a column. The sort is stable.
+
+        :param name: The name of the column.
+        :param reverse: If true, sorts in descending order.
+        :return: The positions of the rows in sorted order.
+        """
+        column = self.columns[name]
+        if self.uses_numpy:
+            if reverse: return (len(column) - 1 - numpy.argsort(column[::-1], kind='stable'))[::-1]
+            return numpy.argsort(column, kind='stable')
+        return sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+
+    def sort_by(self, name: str, reverse: bool = False) -> 'ColumnarCollection[BDC]':
+        """
+        Sorts the rows by a column.
+
+        :param name: The name of the column.
+        :param reverse: If true, sorts in descending order.
+        :return: A new collection.
+        """
+        return self.take(self.argsort(name, reverse))
+
+    def group_by(self, name: str) -> Dict[int, 'ColumnarCollection[BDC]']:
+        """
+        Splits the rows into groups that share the value of a column,
+        such as images grouped by ``room_id``.
+
+        :param name: The name of the column.
+        :return: A collection for each value, keyed by the value.
+        """
+        return {key: self.take(indices) for key, indices in self.__group_indices(name).items()}
+
+    def count_by(self, name: str) -> Dict[int, int]:
+        """
+        Counts the rows for each value of a column.
+
+        :param name: The name of the column.
+        :return: The number of rows, keyed by the value.
+        """
+        column = self.columns[name]
+        if self.uses_numpy:
+            keys, counts = numpy.unique(column, return_counts=True)
+            return dict(zip(keys.tolist(), counts.tolist()))
+        counts: Dict[int, int] = {}
+        for key in column: counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def sum_by(self, by: str, name: str) -> Dict[int, int]:
+        """
+        Sums a column for each value of another column, such as
+        the total ``cheer_count`` of each ``room_id``.
+
+        :param by: The name of the column to group by.
+        :param name: The name of the column to sum.
+        :return: The sums, keyed by the value grouped by.
+        """
+        keys_column, values = self.columns[by], self.columns[name]
+        if self.uses_numpy:
+            keys, inverse = numpy.unique(keys_column, return_inverse=True)
+            sums = numpy.bincount(inverse, weights=values, minlength=len(keys)).astype(numpy.int64)
+            return dict(zip(keys.tolist(), sums.tolist()))
+        sums: Dict[int, int] = {}
+        for key, value in zip(keys_column, values): sums[key] = sums.get(key, 0) + value
+        return sums
+
+    def sum(self, name: str) -> int:
+        """
+        :param name: The name of the column.
+        :return: The sum of the column.
+        """
+        return int(self.columns[name].sum()) if self.uses_numpy else sum(self.columns[name])
+
+    def min(self, name: str) -> Optional[int]:
+        """
+        :param name: The name of the column.
+        :return: The smallest value of the column, or None if the collection is empty.
+        """
+        if not len(self): return None
+        return int(self.columns[name].min()) if self.uses_numpy else min(self.columns[name])
+
+    def max(self, name: str) -> Optional[int]:
+        """
+        :param name: The name of the column.
+        :return: The largest value of the column, or None if the collection is empty.
+        """
+        if not len(self): return None
+        return int(self.columns[name].max()) if self.uses_numpy else max(self.columns[name])
+
+    def mean(self, name: str) -> Optional[float]:
+        """
+        :param name: The name of the column.
+        :return: The average value of the column, or None if the collection is empty.
+        """
+        if not len(self): return None
+        return self.sum(name) / len(self)
+
+    def __group_indices(self, name: str) -> Dict[int, Sequence[int]]:
+        column = self.columns[name]
+        if self.uses_numpy:
+            order = numpy.argsort(column, kind='stable')
+            keys, starts = numpy.unique(column[order], return_index=True)
+            return dict(zip(keys.tolist(), numpy.split(order, starts[1:])))
+        groups: Dict[int, List[int]] = {}
+        for index, key in enumerate(column): groups.setdefault(key, []).append(index)
+        return groups
@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING, List, Optional
+from operator import itemgetter
 
 from .base_manager import BaseManager
 from ..dataclasses import Event
+from ..misc import date_to_unix
 
 if TYPE_CHECKING:
     from ..misc.api_responses import EventResponse
@@ -12,7 +14,20 @@ class EventManager(BaseManager['Event', 'EventResponse']):
     This is a factory object for creating eveny objects. Its the
     main interface for fetching event related data.
     """
-    async def fetch(self, id: int) -> Optional['Event']:
+    #: This is the dataclass the manager is responsible for creating.
+    dataclass = Event
+
+    #: These extract the numeric fields stored by columnar collections of events.
+    column_getters = {
+        'id': itemgetter('PlayerEventId'),
+        'creator_player_id': itemgetter('CreatorPlayerId'),
+        'room_id': itemgetter('RoomId'),
+        'attendee_count': itemgetter('AttendeeCount'),
+        'start_time': lambda event: date_to_unix(event['StartTime']),
+        'end_time': lambda event: date_to_unix(event['EndTime'])
+    }
+
+    async def fetch(self, id: int, force: bool = False) -> Optional['Event']:
         """
         Gets event data by their id, and returns it as an event object.
         Returns nothing if the event doesn't exist or is private.
@@ -20,28 +35,32 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         Authorization required.
 
         :param id: The id of the event.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An event object representing the data or nothing if not found. 
         """
-        data: 'Response[EventResponse]' = await self.rec_net.apim.playerevents.v1(id).make_request('get')
+        if self.loader is not None and not force: return await self.loader.load(id)
+        data: 'Response[EventResponse]' = await self.rec_net.apim.playerevents.v1(id).make_request('get', force = force)
         if data.data: return self.create_dataclass(id, data.data)
         return None
         
 
-    async def fetch_many(self, ids: List[int]) -> List['Event']:
+    async def fetch_many(self, ids: List[int], force: bool = False) -> List['Event']:
         """
         Gets a list of events by a list of event ids, and returns 
         a list of event object.
         Events that couldn't be found will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         Authorization required.
 
         :param ids: A list of ids.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of event objects. 
         """
-        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.bulk.make_request('post', body = {'Ids': ids})
-        return self.create_from_data_list(data.data)
+        request = lambda chunk: self.rec_net.apim.playerevents.v1.bulk.make_request('post', body = {'Ids': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, ids, 'Ids', lambda event: event['PlayerEventId'], int))
 
-    async def search(self, query: str, take: int = 16, skip: int = 0, sort: int = 0) -> List['Event']:
+    async def search(self, query: str, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Event']:
         """
         Searches RecNet for events based on a query, and returns
         a list of event objects.
@@ -53,6 +72,7 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         :param take: The number of results to return.
         :param skip: The number of results to skip.
         :param sort: An integer that describes how the results are to be sorted.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of event objects.
         """
         params = {
@@ -61,10 +81,10 @@ class EventManager(BaseManager['Event', 'EventResponse']):
             'skip': skip,
             'sort': sort
         }
-        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.search.make_request('get', params=params)
+        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.search.make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def from_account(self, id: int, take: int = 16, skip: int = 0) -> List['Event']:
+    async def from_account(self, id: int, take: int = 16, skip: int = 0, force: bool = False) -> List['Event']:
         """
         Gets a list of events created by a player.
         If no event or the respective account is found, an empty list will be returned.
@@ -74,16 +94,17 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         :param id: An account id.
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of event objects.
         """
         params = {
             'take': take,
             'skip': skip,
         }
-        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.creator(id).make_request('get', params=params)
+        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.creator(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def in_room(self, id: int, take: int = 16, skip: int = 0) -> List['Event']:
+    async def in_room(self, id: int, take: int = 16, skip: int = 0, force: bool = False) -> List['Event']:
         """
         Gets a list of events happening in a room.
         If no event or the respective room is found, an empty list will be returned.
@@ -93,16 +114,17 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         :param query: A room id.
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of event objects.
         """
         params = {
             'take': take,
             'skip': skip,
         }
-        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.room(id).make_request('get', params=params)
+        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.room(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def get_events(self, take: int = 16, skip: int = 0, sort: int = 0) -> List['Event']:
+    async def get_events(self, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Event']:
         """
         Gets a list of events currently happening.
 
@@ -111,6 +133,7 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         :param take: The number of results to return.
         :param skip: The number of results to skip.
         :param sort: An integer that describes how the results are to be sorted.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of event objects.
         """
         params = {
@@ -118,7 +141,7 @@ class EventManager(BaseManager['Event', 'EventResponse']):
             'skip': skip,
             'sort': sort
         }
-        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.make_request('get', params=params)
+        data: 'Response[List[EventResponse]]' = await self.rec_net.apim.playerevents.v1.make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
     def create_dataclass(self, id: int, data: Optional['EventResponse'] = None) -> 'Event':
@@ -129,7 +152,7 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         :param data: An event api response.
         :return: Returns an event object.
         """
-        return Event(self.client, id, data)
+        return self.identify(id, data)
 
     def create_from_data_list(self, data: List['EventResponse']) -> List['Event']:
         """
@@ -140,6 +163,6 @@ class EventManager(BaseManager['Event', 'EventResponse']):
         """
         event_list: List['Event'] = []
         for event_data in data:
-            event_obj = Event(self.client, event_data['PlayerEventId'], event_data)
+            event_obj = self.create_dataclass(event_data['PlayerEventId'], event_data)
             event_list.append(event_obj)
         return event_list
@@ -0,0 +1,76 @@
+from typing import TYPE_CHECKING, Dict, Generic, Optional, TypeVar
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from ..dataclasses import BaseDataClass
+
+BDC = TypeVar("BDC", bound='BaseDataClass')
+
+class IdentityMap(Generic[BDC]):
+    """
+    Maps each id to the one live object that represents it, so
+    every part of a program shares the same object, along with
+    the relations it has cached. Objects are held weakly, and
+    dropped once nothing else references them, unless they're
+    among the most recently used objects that are pinned.
+    """
+    #: The number of recently used objects kept alive by the map.
+    pin_size: int
+    __objects: 'WeakValueDictionary[int, BDC]'
+    __pinned: 'OrderedDict[int, BDC]'
+
+    def __init__(self, pin_size: int = 0) -> None:
+        self.pin_size = pin_size
+        self.__objects = WeakValueDictionary()
+        self.__pinned = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.__objects
+
+    def get(self, id: int) -> Optional[BDC]:
+        """
+        Gets the live object of an id.
+
+        :param id: The id of the object.
+        :return: The object, or None if there's no live object with the id.
+        """
+        obj = self.__objects.get(id)
+        if obj is not None: self.__pin(id, obj)
+        return obj
+
+    def add(self, id: int, obj: BDC) -> None:
+        """
+        Makes an object the live object of an id.
+
+        :param id: The id of the object.
+        :param obj: The object.
+        """
+        self.__objects[id] = obj
+        self.__pin(id, obj)
+
+    def discard(self, id: int) -> None:
+        """
+        Forgets the object of an id, if there is one.
+
+        :param id: The id of the object.
+        """
+        self.__objects.pop(id, None)
+        self.__pinned.pop(id, None)
+
+    def clear(self) -> None:
+        """
+        Forgets every object.
+        """
+        self.__objects.clear()
+        self.__pinned.clear()
+
+    def __pin(self, id: int, obj: BDC) -> None:
+        if self.pin_size <= 0: return
+        self.__pinned[id] = obj
+        self.__pinned.move_to_end(id)
+        while len(self.__pinned) > self.pin_size:
+            self.__pinned.popitem(last=False)
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+from operator import itemgetter
 
 from . import BaseManager
 from ..dataclasses import Image
+from ..misc import date_to_unix
 
 if TYPE_CHECKING:
     from ..misc.api_responses import ImageResponse
@@ -12,7 +14,21 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
     This is a factory object for creating image objects. Its the
     main interface for fetching image related data.
     """
-    async def get(self, name: str) -> Optional['Image']:
+    #: This is the dataclass the manager is responsible for creating.
+    dataclass = Image
+
+    #: These extract the numeric fields stored by columnar collections of images.
+    column_getters = {
+        'id': itemgetter('Id'),
+        'player_id': itemgetter('PlayerId'),
+        'room_id': itemgetter('RoomId'),
+        'event_id': itemgetter('PlayerEventId'),
+        'cheer_count': itemgetter('CheerCount'),
+        'comment_count': itemgetter('CommentCount'),
+        'created_at': lambda image: date_to_unix(image['CreatedAt'])
+    }
+
+    async def get(self, name: str, force: bool = False) -> Optional['Image']:
         """
         Gets image data by their name, and returns it as an image object.
         Example of an image name: https://img.rec.net/>43ixtpl65wc9fc6ff4vsyrzoo.jpg<
@@ -22,31 +38,34 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         Authorization required.
 
         :param name: The name of the image.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An image object representing the data or nothing if not found. 
         """
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.bulk.make_request('post', body = {'Names': name})
-        if data.data: return self.create_dataclass(id, data.data[0])
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.bulk.make_request('post', body = {'Names': name}, idempotent = True, force = force)
+        if data.data: return self.create_dataclass(data.data[0]['Id'], data.data[0])
         return None
     
     
-    async def get_many(self, names: List[str]) -> List['Image']:
+    async def get_many(self, names: List[str], force: bool = False) -> List['Image']:
         """
         Gets a list of images by a list of image names, and returns 
         a list of image object.
         Example of an image name: https://img.rec.net/>43ixtpl65wc9fc6ff4vsyrzoo.jpg<
         Only accepts image names of public RecNet posts.
         Images that couldn't be found will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
     
         Authorization required.
 
         :param name: The name of the image.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects. 
         """
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.bulk.make_request('post', body = {'Names': names})
-        return self.create_from_data_list(data.data)
+        request = lambda chunk: self.rec_net.apim.images.v4.bulk.make_request('post', body = {'Names': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, names, 'Names', lambda image: image['ImageName']))
     
     
-    async def fetch(self, id: int) -> Optional['Image']:
+    async def fetch(self, id: int, force: bool = False) -> Optional['Image']:
         """
         Gets image data by their id, and returns it as an image object.
         Returns nothing if the image doesn't exist or is private.
@@ -54,28 +73,32 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         Authorization required.
 
         :param id: The id of the image.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An image object representing the data or nothing if not found. 
         """
-        data: 'Response[ImageResponse]' = await self.rec_net.apim.images.v4(id).make_request('get')
+        if self.loader is not None and not force: return await self.loader.load(id)
+        data: 'Response[ImageResponse]' = await self.rec_net.apim.images.v4(id).make_request('get', force = force)
         if data.data: return self.create_dataclass(id, data.data)
         return None
     
     
-    async def fetch_many(self, ids: List[int]) -> List['Image']:
+    async def fetch_many(self, ids: List[int], force: bool = False) -> List['Image']:
         """
         Gets a list of images by a list of image ids, and returns 
         a list of image object.
         Images that couldn't be found will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         Authorization required.
 
         :param ids: A list of ids.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects. 
         """
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v3.bulk.make_request('post', body = {'Ids': ids})
-        return self.create_from_data_list(data.data)
+        request = lambda chunk: self.rec_net.apim.images.v3.bulk.make_request('post', body = {'Ids': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, ids, 'Ids', lambda image: image['Id'], int))
 
-    async def from_account(self, id: int, take: int = 16, skip: int = 0, sort: int = 0) -> List['Image']:
+    async def from_account(self, id: int, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Image']:
         """
         Gets a list of images taken by a player.
         If no image or the respective account is found, an empty list will be returned.
@@ -86,6 +109,7 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         :param take: The number of results to return.
         :param skip: The number of results to skip.
         :param sort: An integer that describes how the results are to be sorted.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects.
         """
         params = {
@@ -93,10 +117,10 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
             'skip': skip,
             'sort': sort
         }
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.player(id).make_request('get', params=params)
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.player(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def player_feed(self, id: int, take: int = 16, skip: int = 0) -> List['Image']:
+    async def player_feed(self, id: int, take: int = 16, skip: int = 0, force: bool = False) -> List['Image']:
         """
         Gets a list of images taken of a player.
         If no image or the respective account is found, an empty list will be returned.
@@ -106,16 +130,17 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         :param id: A player id.
         :param take: The number of results to return.
         :param skip: The number of results to skip.                 
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects.
         """
         params = {
             'take': take,
             'skip': skip
         }        
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v3.feed.player(id).make_request('get', params=params)
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v3.feed.player(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def during_event(self, id: int, take: int = 16, skip: int = 0) -> List['Image']:
+    async def during_event(self, id: int, take: int = 16, skip: int = 0, force: bool = False) -> List['Image']:
         """
         Gets a list of images taken during an event.
         If no image or the respective event is found, an empty list will be returned.
@@ -125,16 +150,17 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         :param id: A event id.
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects.
         """
         params = {
             'take': take,
             'skip': skip
         }  
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v1.playerevent(id).make_request('get', params=params)
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v1.playerevent(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def in_room(self, id: int, take: int = 16, skip: int = 0, sort: int = 0) -> List['Image']:
+    async def in_room(self, id: int, take: int = 16, skip: int = 0, sort: int = 0, force: bool = False) -> List['Image']:
         """
         Gets a list of images taken in a room.
         If no image or the respective room is found, an empty list will be returned.
@@ -145,6 +171,7 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         :param take: The number of results to return.
         :param skip: The number of results to skip.
         :param sort: An integer that describes how the results are to be sorted.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects.
         """
         params = {
@@ -152,10 +179,10 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
             'skip': skip,
             'sort': sort
         }        
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.room(id).make_request('get', params=params)
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v4.room(id).make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def front_page(self, take: int = 16, skip: int = 0) -> List['Image']:
+    async def front_page(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Image']:
         """
         Gets a list of the most popular images on RecNet.
 
@@ -163,15 +190,114 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
 
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of image objects.
         """
         params = {
             'take': take,
             'skip': skip
         }  
-        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v3.feed('global').make_request('get', params=params)
+        data: 'Response[List[ImageResponse]]' = await self.rec_net.apim.images.v3.feed('global').make_request('get', params=params, force = force)
         return self.create_from_data_list(data.data)
 
+    def stream_from_account(self, id: int, take: int = 16, skip: int = 0, sort: int = 0) -> AsyncIterator['Image']:
+        """
+        Streams the images taken by a player. Images are yielded
+        as they're parsed from the response, so memory stays flat
+        however many are requested. Streamed responses aren't cached.
+
+        Authorization required.
+
+        :param id: A player id.
+        :param take: The number of results to return.
+        :param skip: The number of results to skip.
+        :param sort: An integer that describes how the results are to be sorted.
+        :return: An async iterator of image objects.
+        """
+        params = {
+            'take': take,
+            'skip': skip,
+            'sort': sort
+        }
+        return self.create_from_stream(self.rec_net.apim.images.v4.player(id).stream('get', params=params))
+
+    def stream_player_feed(self, id: int, take: int = 16, skip: int = 0) -> AsyncIterator['Image']:
+        """
+        Streams the images taken of a player. Images are yielded
+        as they're parsed from the response, so memory stays flat
+        however many are requested. Streamed responses aren't cached.
+
+        Authorization required.
+
+        :param id: A player id.
+        :param take: The number of results to return.
+        :param skip: The number of results to skip.
+        :return: An async iterator of image objects.
+        """
+        params = {
+            'take': take,
+            'skip': skip
+        }
+        return self.create_from_stream(self.rec_net.apim.images.v3.feed.player(id).stream('get', params=params))
+
+    def stream_during_event(self, id: int, take: int = 16, skip: int = 0) -> AsyncIterator['Image']:
+        """
+        Streams the images taken during an event. Images are yielded
+        as they're parsed from the response, so memory stays flat
+        however many are requested. Streamed responses aren't cached.
+
+        Authorization required.
+
+        :param id: A event id.
+        :param take: The number of results to return.
+        :param skip: The number of results to skip.
+        :return: An async iterator of image objects.
+        """
+        params = {
+            'take': take,
+            'skip': skip
+        }
+        return self.create_from_stream(self.rec_net.apim.images.v1.playerevent(id).stream('get', params=params))
+
+    def stream_in_room(self, id: int, take: int = 16, skip: int = 0, sort: int = 0) -> AsyncIterator['Image']:
+        """
+        Streams the images taken in a room. Images are yielded
+        as they're parsed from the response, so memory stays flat
+        however many are requested. Streamed responses aren't cached.
+
+        Authorization required.
+
+        :param id: A room id.
+        :param take: The number of results to return.
+        :param skip: The number of results to skip.
+        :param sort: An integer that describes how the results are to be sorted.
+        :return: An async iterator of image objects.
+        """
+        params = {
+            'take': take,
+            'skip': skip,
+            'sort': sort
+        }
+        return self.create_from_stream(self.rec_net.apim.images.v4.room(id).stream('get', params=params))
+
+    def stream_front_page(self, take: int = 16, skip: int = 0) -> AsyncIterator['Image']:
+        """
+        Streams the most popular images on RecNet. Images are yielded
+        as they're parsed from the response, so memory stays flat
+        however many are requested. Streamed responses aren't cached.
+
+        Authorization required.
+
+        :param take: The number of results to return.
+        :param skip: The number of results to skip.
+        :return: An async iterator of image objects.
+        """
+        params = {
+            'take': take,
+            'skip': skip
+        }
+        return self.create_from_stream(self.rec_net.apim.images.v3.feed('global').stream('get', params=params))
+
     def create_dataclass(self, id: int, data: Optional['ImageResponse'] = None) -> 'Image':
         """
         Creates an image object:
@@ -180,7 +306,7 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         :param data: An image api response.
         :return: Returns an image object.
         """
-        return Image(self.client, id, data)
+        return self.identify(id, data)
 
     def create_from_data_list(self, data: List['ImageResponse']) -> List['Image']:
         """
@@ -191,6 +317,6 @@ class ImageManager(BaseManager['Image', 'ImageResponse']):
         """
         image_list: List['Image'] = []
         for image_data in data:
-            image_obj = Image(self.client, image_data['Id'], image_data)
+            image_obj = self.create_dataclass(image_data['Id'], image_data)
             image_list.append(image_obj)
         return image_list
\ No newline at end of file
@@ -12,7 +12,10 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
     This is a factory object for creating invention objects. Its the
     main interface for fetching invention related data.
     """
-    async def fetch(self, id: int) -> Optional['Invention']:
+    #: This is the dataclass the manager is responsible for creating.
+    dataclass = Invention
+
+    async def fetch(self, id: int, force: bool = False) -> Optional['Invention']:
         """
         Gets invention data by their id, and returns it as an invention object.
         Returns nothing if the invention doesn't exist or is private.
@@ -20,14 +23,15 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
         Authorization required.
 
         :param id: The id of the invention.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An invention object representing the data or nothing if not found. 
         """
-        data: 'Response[InventionResponse]' = await self.rec_net.apim.inventions.v1.make_request('get', params = {'inventionId': id})
+        data: 'Response[InventionResponse]' = await self.rec_net.apim.inventions.v1.make_request('get', params = {'inventionId': id}, force = force)
         if data.data: return self.create_dataclass(id, data.data)
         return None
 
 
-    async def search(self, query: str, take: int = 16) -> List['Invention']:
+    async def search(self, query: str, take: int = 16, force: bool = False) -> List['Invention']:
         """
         Searches RecNet for inventions based on a query, and returns
         a list of invention objects.
@@ -36,16 +40,17 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
         Authorization required.
 
         :param query: A search query string.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of invention objects.
         """
         params = {
             'value': str(query),
             'take': take
         }
-        data: Response[List[InventionResponse]] = await self.rec_net.apim.inventions.v2.search.make_request('get', params = params)
+        data: Response[List[InventionResponse]] = await self.rec_net.apim.inventions.v2.search.make_request('get', params = params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def featured(self, take: int = 16, skip: int = 0) -> List['Invention']:
+    async def featured(self, take: int = 16, skip: int = 0, force: bool = False) -> List['Invention']:
         """
         Gets a list of the featured inventions on RecNet.
 
@@ -53,24 +58,26 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
 
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of invention objects.
         """
         params = {
             'take': take,
             'skip': skip
         }  
-        data: 'Response[List[InventionResponse]]' = await self.rec_net.apim.inventions.v1.featured.make_request('get', params = params)
+        data: 'Response[List[InventionResponse]]' = await self.rec_net.apim.inventions.v1.featured.make_request('get', params = params, force = force)
         return self.create_from_data_list(data.data)
 
-    async def top_today(self) -> List['Invention']:
+    async def top_today(self, force: bool = False) -> List['Invention']:
         """
         Gets a list of the top inventions on RecNet for today.
 
         Authorization required.
 
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of invention objects.
         """
-        data: 'Response[List[InventionResponse]]' = await self.rec_net.apim.inventions.v1.toptoday.make_request('get')
+        data: 'Response[List[InventionResponse]]' = await self.rec_net.apim.inventions.v1.toptoday.make_request('get', force = force)
         return self.create_from_data_list(data.data)
 
     def create_dataclass(self, id: int, data: Optional['InventionResponse'] = None) -> 'Invention':
@@ -81,7 +88,7 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
         :param data: An invention api response.
         :return: Returns an invention object.
         """
-        return Invention(self.client, id, data)
+        return self.identify(id, data)
 
     def create_from_data_list(self, data: List['InventionResponse']) -> List['Invention']:
         """
@@ -92,6 +99,6 @@ class InventionManager(BaseManager['Invention', 'InventionResponse']):
         """
         invention_list: List['Invention'] = []
         for invention_data in data:
-            invention_obj = Invention(self.client, invention_data['InventionId'], invention_data)
+            invention_obj = self.create_dataclass(invention_data['InventionId'], invention_data)
             invention_list.append(invention_obj)
         return invention_list
\ No newline at end of file
@@ -0,0 +1,152 @@
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar
+from asyncio import Task, create_task, gather
+
+T = TypeVar("T")
+
+class Page(List[T]):
+    """
+    A list of results from a paged endpoint, which also carries
+    the total number of results if the endpoint reports it.
+    """
+    #: The total number of results available, or None if unknown.
+    total: Optional[int]
+
+    def __init__(self, results: Iterable[T] = (), total: Optional[int] = None) -> None:
+        super().__init__(results)
+        self.total = total
+
+
+class Paginator(Generic[T]):
+    """
+    An async iterator over an endpoint that pages its results
+    with take and skip. The next page is fetched while the
+    current one is being processed, so only about two pages
+    are held in memory at a time. Use ``fetch_all`` to request
+    pages concurrently instead.
+    """
+    #: The number of results requested per page.
+    page_size: int
+    #: The number of results skipped before the first page.
+    skip: int
+    #: The max number of results to yield, or None for no limit.
+    limit: Optional[int]
+    #: Iteration stops at the first result this returns true for. The result isn't yielded.
+    stop: Optional[Callable[[T], bool]]
+    #: If true, the next page is requested before the current one is processed.
+    prefetch: bool
+    __fetch_page: Callable[[int, int], Awaitable[List[T]]]
+
+    def __init__(self, fetch_page: Callable[[int, int], Awaitable[List[T]]], page_size: int = 64, skip: int = 0, limit: Optional[int] = None, stop: Optional[Callable[[T], bool]] = None, prefetch: bool = True) -> None:
+        self.page_size = page_size
+        self.skip = skip
+        self.limit = limit
+        self.stop = stop
+        self.prefetch = prefetch
+        self.__fetch_page = fetch_page
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.__iterate()
+
+    def __take(self, requested: int) -> int:
+        if self.limit is None: return self.page_size
+        return min(self.page_size, self.limit - requested)
+
+    async def __iterate(self) -> AsyncIterator[T]:
+        skip = self.skip
+        requested = take = self.__take(0)
+        if take <= 0: return
+        next_page: Optional[Task] = create_task(self.__fetch_page(take, skip))
+        yielded = 0
+        try:
+            while next_page is not None:
+                page: List[T] = await next_page
+                next_page = None
+                full = len(page) >= take
+                skip += take
+                take = self.__take(requested)
+                if full and take > 0:
+                    if self.prefetch:
+                        next_page = create_task(self.__fetch_page(take, skip))
+                    requested += take
+                for item in page:
+                    if self.stop is not None and self.stop(item): return
+                    yield item
+                    yielded += 1
+                    if self.limit is not None and yielded >= self.limit: return
+                if not full or take <= 0: return
+                if next_page is None:
+                    next_page = create_task(self.__fetch_page(take, skip))
+        finally:
+            if next_page is not None: next_page.cancel()
+
+    async def pages(self) -> AsyncIterator[List[T]]:
+        """
+        Iterates over the results a page at a time.
+
+        :return: An async iterator of pages.
+        """
+        page: List[T] = []
+        async for item in self:
+            page.append(item)
+            if len(page) >= self.page_size:
+                yield page
+                page = []
+        if page: yield page
+
+    async def collect(self) -> List[T]:
+        """
+        Collects every result into a list.
+
+        :return: A list of results.
+        """
+        return [item async for item in self]
+
+    async def fetch_all(self, concurrency: int = 8) -> List[T]:
+        """
+        Collects every result by requesting pages concurrently. If the
+        first page reports the total number of results, only the pages
+        needed are requested. Otherwise pages are requested speculatively,
+        a window at a time, until the first page that isn't full.
+
+        :param concurrency: The max number of pages requested at once.
+        :return: A list of results.
+        """
+        take = self.__take(0)
+        if take <= 0: return []
+        first = await self.__fetch_page(take, self.skip)
+        pages: List[List[T]] = [first]
+        end: Optional[int] = None
+        total = getattr(first, 'total', None)
+        if total is not None: end = total
+        if self.limit is not None: end = self.skip + self.limit if end is None else min(end, self.skip + self.limit)
+        skip = self.skip + take
+        full = len(first) >= take
+        while full and not self.__stopped(pages[-1]) and (end is None or skip < end):
+            window = []
+            while len(window) < concurrency and (end is None or skip < end):
+                take = self.page_size if end is None else min(self.page_size, end - skip)
+                window.append((take, skip))
+                skip += take
+            tasks = [create_task(self.__fetch_page(page_take, page_skip)) for page_take, page_skip in window]
+            try:
+                results = await gather(*tasks)
+            finally:
+                for task in tasks: task.cancel()
+            for (take, _), page in zip(window, results):
+                pages.append(page)
+                if len(page) < take or self.__stopped(page):
+                    full = False
+                    break
+        return self.__flatten(pages)
+
+    def __stopped(self, page: List[T]) -> bool:
+        return self.stop is not None and any(map(self.stop, page))
+
+    def __flatten(self, pages: List[List[T]]) -> List[T]:
+        results: List[T] = []
+        for page in pages:
+            for item in page:
+                if self.stop is not None and self.stop(item): return results
+                results.append(item)
+                if self.limit is not None and len(results) >= self.limit: return results
+        return results
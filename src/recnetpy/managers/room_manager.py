@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING, List, Optional
+from operator import itemgetter
 
 from enum import Enum
-from . import BaseManager
+from . import BaseManager, Page
 from ..dataclasses import Room
-from ..misc import stringify_bulk
+from ..misc import stringify_bulk, date_to_unix
 
 if TYPE_CHECKING:
     from ..misc.api_responses import RoomResponse, RoomSearchResponse
@@ -37,7 +38,23 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
     This is a factory object for creating room objects. Its the
     main interface for fetching room related data.
     """
-    async def get(self, name: str, include: int | List[RoomInclude] = 0) -> 'Room':
+    #: This is the dataclass the manager is responsible for creating.
+    dataclass = Room
+
+    #: These extract the numeric fields stored by columnar collections of rooms.
+    column_getters = {
+        'id': itemgetter('RoomId'),
+        'creator_account_id': itemgetter('CreatorAccountId'),
+        'max_players': itemgetter('MaxPlayers'),
+        'min_level': itemgetter('MinLevel'),
+        'cheer_count': lambda room: room['Stats']['CheerCount'],
+        'favorite_count': lambda room: room['Stats']['FavoriteCount'],
+        'visitor_count': lambda room: room['Stats']['VisitorCount'],
+        'visit_count': lambda room: room['Stats']['VisitCount'],
+        'created_at': lambda room: date_to_unix(room['CreatedAt'])
+    }
+
+    async def get(self, name: str, include: int | List[RoomInclude] = 0, force: bool = False) -> 'Room':
         """
         Gets room data by their name, and returns it as an room object.
         Returns nothing if the room doesn't exist or is private.
@@ -57,16 +74,17 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
 
         :param name: The name of the room.
         :param include: An integer that add additional information to the response.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An room object representing the data or nothing if not found. 
         """
   
         if isinstance(include, list):
             include = sum_enum_list(include)                
-        data: 'Response[RoomResponse]' = await self.rec_net.rooms.rooms.make_request('get', params = {'name': name, 'include': include})
+        data: 'Response[RoomResponse]' = await self.rec_net.rooms.rooms.make_request('get', params = {'name': name, 'include': include}, force = force)
         if data.data: return self.create_dataclass(data.data['RoomId'], data.data)
         return None
 
-    async def fetch(self, id: int, include: int | List[RoomInclude] = 0) -> 'Room':
+    async def fetch(self, id: int, include: int | List[RoomInclude] = 0, force: bool = False) -> 'Room':
         """
         Gets room data by their id, and returns it as an room object.
         Returns nothing if the room doesn't exist or is private.
@@ -86,48 +104,56 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
 
         :param id: The id of the room.
         :param include: An integer that add additional information to the response.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: An room object representing the data. 
         """
         if isinstance(include, list):
             include = sum_enum_list(include)     
-        data: 'Response[RoomResponse]' = await self.rec_net.rooms.rooms(id).make_request('get', params = {'include': include})
+        if self.loader is not None and not include and not force: return await self.loader.load(id)
+        data: 'Response[RoomResponse]' = await self.rec_net.rooms.rooms(id).make_request('get', params = {'include': include}, force = force)
         if data.data: return self.create_dataclass(data.data['RoomId'], data.data)
         return None
 
-    async def get_many(self, names: List[str]) -> List['Room']:
+    async def get_many(self, names: List[str], force: bool = False) -> List['Room']:
         """
         Gets a list of rooms by a list of names, and returns 
         a list of rooms object.
         Room that couldn't be found or are private will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         :param names: A list of room names.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects. 
         """
         bulk = stringify_bulk(names)
-        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.bulk.make_request('post', body = {'name': bulk})
-        return self.create_from_data_list(data.data)
+        request = lambda chunk: self.rec_net.rooms.rooms.bulk.make_request('post', body = {'name': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, bulk, 'name', lambda room: room['Name'], str.lower))
 
-    async def fetch_many(self, ids: List[int]) -> List['Room']:
+    async def fetch_many(self, ids: List[int], force: bool = False) -> List['Room']:
         """
         Gets a list of rooms by a list of ids, and returns 
         a list of room objects.
         Room that couldn't be found or are private will be silently ignored.
+        Large lists are split into chunks which are fetched concurrently.
 
         :param ids: A list of ids.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects. 
         """
-        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.bulk.make_request('post', body = {'id': ids})
-        return self.create_from_data_list(data.data)
+        request = lambda chunk: self.rec_net.rooms.rooms.bulk.make_request('post', body = {'id': chunk}, idempotent = True, force = force)
+        return await self.create_from_bulk(self.fetch_bulk(request, ids, 'id', lambda room: room['RoomId'], int))
 
-    async def search(self, query: str, take: int = 16, skip: int = 0) -> List['Room']:
+    async def search(self, query: str, take: int = 16, skip: int = 0, force: bool = False) -> Page['Room']:
         """
         Searches RecNet for rooms based on a query, and returns
         a list of room objects.
         If no room is found, an empty list will be returned.
+        The list's ``total`` attribute holds the total number of results.
 
         :param query: A search query string.
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects.
         """
         params = {
@@ -135,58 +161,63 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
             'take': take,
             'skip': skip
         }          
-        data: 'Response[RoomSearchResponse]' = await self.rec_net.rooms.rooms.search.make_request('get', params = params)
-        return self.create_from_data_list(data.data['Results'])
+        data: 'Response[RoomSearchResponse]' = await self.rec_net.rooms.rooms.search.make_request('get', params = params, force = force)
+        return Page(self.create_from_data_list(data.data['Results']), data.data['TotalResults'])
 
-    async def created_by(self, id: int) -> List['Room']:
+    async def created_by(self, id: int, force: bool = False) -> List['Room']:
         """
         Gets a list of rooms created by a player.
         If no room or the respective account is found, an empty list will be returned.
 
         :param id: An account id.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects.
         """
-        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.createdby(id).make_request('get')
+        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.createdby(id).make_request('get', force = force)
         return self.create_from_data_list(data.data)
 
-    async def owned_by(self, id: int) -> List['Room']:
+    async def owned_by(self, id: int, force: bool = False) -> List['Room']:
         """
         Gets a list of rooms owned by a player.
         If no room or the respective account is found, an empty list will be returned.
 
         :param id: An account id.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects.
         """
-        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.ownedby(id).make_request('get')
+        data: 'Response[List[RoomResponse]]' = await self.rec_net.rooms.rooms.ownedby(id).make_request('get', force = force)
         return self.create_from_data_list(data.data)
     
-    async def showcased_by(self, id: int) -> List['Room']:
+    async def showcased_by(self, id: int, force: bool = False) -> List['Room']:
         """
         Gets a list of rooms showcased by a player.
         If no room or the respective account is found, an empty list will be returned.
 
         :param id: An account id.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects.
         """
-        data: 'Response[List[int]]' = await self.rec_net.rooms.showcase(id).make_request('get')
+        data: 'Response[List[int]]' = await self.rec_net.rooms.showcase(id).make_request('get', force = force)
         if not data.data: return []
-        rooms: List['Room'] = await self.fetch_many(data.data)
+        rooms: List['Room'] = await self.fetch_many(data.data, force = force)
         return rooms
 
-    async def hot(self, take: int = 16, skip: int = 0) -> List[Room]:
+    async def hot(self, take: int = 16, skip: int = 0, force: bool = False) -> Page['Room']:
         """
         Gets a list of the most popular rooms on RecNet.
+        The list's ``total`` attribute holds the total number of results.
 
         :param take: The number of results to return.
         :param skip: The number of results to skip.
+        :param force: If true, the response cache is bypassed and refreshed.
         :return: A list of room objects.
         """
         params = {
             'take': take,
             'skip': skip
         }  
-        data: 'Response[RoomSearchResponse]' = await self.rec_net.rooms.rooms.hot.make_request('get', params = params)
-        return self.create_from_data_list(data.data['Results'])
+        data: 'Response[RoomSearchResponse]' = await self.rec_net.rooms.rooms.hot.make_request('get', params = params, force = force)
+        return Page(self.create_from_data_list(data.data['Results']), data.data['TotalResults'])
 
     def create_dataclass(self, id: int, data: Optional['RoomResponse'] = None) -> 'Room':
         """
@@ -196,7 +227,7 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
         :param data: An room api response.
         :return: Returns an room object.
         """
-        return Room(self.client, id, data)
+        return self.identify(id, data)
 
     def create_from_data_list(self, data: List['RoomResponse']) -> List['Room']:
         """
@@ -207,6 +238,6 @@ class RoomManager(BaseManager['Room', 'RoomResponse']):
         """
         room_list: List['Room'] = []
         for room_data in data:
-            room_obj = Room(self.client, room_data['RoomId'], room_data)
+            room_obj = self.create_dataclass(room_data['RoomId'], room_data)
             room_list.append(room_obj)
         return room_list
\ No newline at end of file
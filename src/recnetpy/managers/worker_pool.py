@@ -0,0 +1,144 @@
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
+from asyncio import CancelledError, Queue, Task, create_task, gather
+
+from ..rest.exceptions import MapError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Marks the end of the input queue.
+DONE = object()
+
+class WorkerPool(Generic[T, R]):
+    """
+    Calls a function on each item of an iterable with a fixed
+    number of workers, and streams back the results as they
+    finish. Items are read into a bounded queue, so a slow
+    consumer holds back the workers, and the workers hold back
+    the input. The number of tasks and pending requests stays
+    the same however many items there are.
+    """
+    #: The number of calls made at once.
+    concurrency: int
+    #: The max number of items read ahead of the workers.
+    queue_size: int
+    #: If true, exceptions are yielded in place of results, instead of being raised once every item was processed.
+    return_exceptions: bool
+    #: The items whose calls failed.
+    failed: List[T]
+    #: The exceptions raised by the failed calls.
+    errors: List[BaseException]
+    __func: Callable[[T], Awaitable[R]]
+    __items: Union[Iterable[T], AsyncIterable[T]]
+
+    def __init__(self, func: Callable[[T], Awaitable[R]], items: Union[Iterable[T], AsyncIterable[T]], concurrency: int = 16, queue_size: Optional[int] = None, return_exceptions: bool = False) -> None:
+        if concurrency < 1: raise ValueError("A worker pool needs at least one worker.")
+        self.concurrency = concurrency
+        self.queue_size = queue_size if queue_size is not None else concurrency * 2
+        self.return_exceptions = return_exceptions
+        self.failed = []
+        self.errors = []
+        self.__func = func
+        self.__items = items
+
+    def __aiter__(self) -> AsyncIterator[Tuple[T, R]]:
+        return self.__iterate()
+
+    async def __iterate(self) -> AsyncIterator[Tuple[T, R]]:
+        run = self.__run()
+        try:
+            async for _, item, result in run:
+                if self.return_exceptions or not isinstance(result, BaseException):
+                    yield item, result
+        finally:
+            # Stops the workers right away if the caller stops iterating early
+            await run.aclose()
+        # The results were already streamed, so they aren't held on to
+        if self.errors and not self.return_exceptions:
+            raise MapError([], self.failed, self.errors)
+
+    async def __run(self) -> AsyncIterator[Tuple[int, T, Any]]:
+        self.failed, self.errors = [], []
+        inputs: Queue = Queue(self.queue_size)
+        outputs: Queue = Queue(self.concurrency)
+        closing = False
+
+        async def feed() -> None:
+            index = 0
+            try:
+                if hasattr(self.__items, '__aiter__'):
+                    async for item in self.__items:
+                        await inputs.put((index, item))
+                        index += 1
+                else:
+                    for item in self.__items:
+                        await inputs.put((index, item))
+                        index += 1
+            except Exception:
+                # The workers still finish the queued items, and the error is raised after them
+                for _ in range(self.concurrency): await inputs.put(DONE)
+                raise
+            for _ in range(self.concurrency): await inputs.put(DONE)
+
+        async def work() -> None:
+            try:
+                while True:
+                    entry = await inputs.get()
+                    if entry is DONE: break
+                    index, item = entry
+                    try:
+                        result = await self.__func(item)
+                    except CancelledError as e:
+                        # A call cancelled from within, such as by its own timeout, is a failed call
+                        if closing: raise
+                        result = e
+                    except Exception as e:
+                        result = e
+                    await outputs.put((index, item, result))
+            finally:
+                # The consumer waits for every worker to finish, even one that died
+                if not closing: await outputs.put(DONE)
+
+        feeder = create_task(feed())
+        workers: List[Task] = [create_task(work()) for _ in range(self.concurrency)]
+        running = len(workers)
+        try:
+            while running:
+                entry = await outputs.get()
+                if entry is DONE:
+                    running -= 1
+                    continue
+                _, item, result = entry
+                if isinstance(result, BaseException):
+                    self.failed.append(item)
+                    self.errors.append(result)
+                yield entry
+            # Surfaces errors raised while reading the items
+            await feeder
+        finally:
+            closing = True
+            for task in (feeder, *workers): task.cancel()
+            await gather(feeder, *workers, return_exceptions=True)
+
+    async def collect(self) -> List[R]:
+        """
+        Processes every item, and collects the results in input
+        order. With ``return_exceptions``, exceptions take the
+        place of the results of failed calls.
+
+        :return: A list of results.
+        :raise MapError: If any of the calls failed, and exceptions aren't returned.
+        """
+        results: List[Tuple[int, Any]] = []
+        run = self.__run()
+        try:
+            async for index, _, result in run:
+                if self.return_exceptions or not isinstance(result, BaseException):
+                    results.append((index, result))
+        finally:
+            await run.aclose()
+        results.sort(key=lambda entry: entry[0])
+        ordered = [result for _, result in results]
+        if self.errors and not self.return_exceptions:
+            raise MapError(ordered, self.failed, self.errors)
+        return ordered
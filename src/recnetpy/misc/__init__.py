@@ -1,4 +1,8 @@
+from .lazy_field import LazyField
+from .slots import SlotsMeta
 from .bitmask_decode import bitmask_decode
 from .date_to_unix import date_to_unix
 from .variable_class import VariableClass
-from .stringify_bulk import stringify_bulk
\ No newline at end of file
+from .stringify_bulk import stringify_bulk
+from .chunk_bulk import chunk_bulk
+from .lazy_import import lazy_import
\ No newline at end of file
@@ -260,6 +260,7 @@ class RoomResponse(RoomResponseOptionals):
     DisableMicAutoMute: bool
     DisableRoomComments: bool
     EncryptVoiceChat: bool
+    ToxmodEnabled: bool
     LoadScreenLocked: bool
     Version: int
     Name: str
@@ -1,15 +1,18 @@
-from typing import List
+from typing import Sequence, Tuple
+from functools import lru_cache
 
-def bitmask_decode(bitmask: int, resolved_list: List[str]) -> List[str]:
+def bitmask_decode(bitmask: int, resolved_list: Sequence[str]) -> Tuple[str, ...]:
     """
-    Decodes a bitmasked integer into a human readable list of items.
+    Decodes a bitmasked integer into a human readable tuple of items.
+    Decoded tuples are interned, so every object with the same 
+    bitmask shares a single tuple.
 
     @param bitmask: Bitmasked integer to be decoded.
-    @param resolved_list: A list where each item coresponds to the state of the next base two place value.
-    @return: A list of items the bitmask resolved to. 
+    @param resolved_list: A sequence where each item coresponds to the state of the next base two place value.
+    @return: A tuple of items the bitmask resolved to. 
     """
-    decoded_list: List[str] = []
-    for index, item in enumerate(resolved_list):
-        if 1 << index & bitmask:
-            decoded_list.append(item)
-    return decoded_list
\ No newline at end of file
+    return _bitmask_decode(bitmask, tuple(resolved_list))
+
+@lru_cache(maxsize=4096)
+def _bitmask_decode(bitmask: int, resolved_list: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(item for index, item in enumerate(resolved_list) if 1 << index & bitmask)
@@ -0,0 +1,27 @@
+from typing import Any, Iterable, List
+from urllib.parse import quote_plus
+
+def chunk_bulk(bulk: Iterable[Any], max_count: int, max_bytes: int, field: str = '') -> List[List[Any]]:
+    """
+    Splits a bulk into chunks which stay under both an element count
+    and an encoded body size. Sizes are measured as form encoded fields,
+    the way bulk bodies are sent.
+
+    @param bulk: The elements to split.
+    @param max_count: The max number of elements in a chunk.
+    @param max_bytes: The max encoded size of a chunk.
+    @param field: The name of the body field the elements are sent under.
+    @return: A list of chunks.
+    """
+    chunks: List[List[Any]] = []
+    chunk: List[Any] = []
+    size = 0
+    for element in bulk:
+        element_size = len(field) + len(quote_plus(str(element))) + 2
+        if chunk and (len(chunk) >= max_count or size + element_size > max_bytes):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(element)
+        size += element_size
+    if chunk: chunks.append(chunk)
+    return chunks
@@ -1,15 +1,55 @@
-from dateutil.parser import isoparse
+from typing import Optional
+from functools import lru_cache
+from datetime import date as Date
+import re
 
+#: The max number of decoded timestamps that are remembered.
+CACHE_SIZE = 4096
+
+EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+
+# RecNet dates look like 2023-01-05T12:34:56.1234567Z, sometimes with 
+# fewer fractional digits, none at all, or a numeric utc offset.
+ISO_DATE = re.compile(r"(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:[.,](\d+))?(?:(Z)|([+-])(\d\d):?(\d\d))\Z")
+
+def parse_iso_date(date: str) -> Optional[int]:
+    """
+    Parses the ISO 8601 variants RecNet responds with by hand.
+
+    @param date: String representation of a date.
+    @return: Unix date represented as an integer, or None if the date isn't in a supported format.
+    """
+    match = ISO_DATE.match(date)
+    if match is None: return None
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hour, offset_minute = match.groups()
+    hour, minute, second = int(hour), int(minute), int(second)
+    if hour > 23 or minute > 59 or second > 59: return None
+    try:
+        days = Date(int(year), int(month), int(day)).toordinal() - EPOCH_ORDINAL
+    except ValueError:
+        return None
+    timestamp = days * 86400 + hour * 3600 + minute * 60 + second
+    if utc is None:
+        offset = int(offset_hour) * 3600 + int(offset_minute) * 60
+        timestamp += -offset if sign == '+' else offset
+    # Match int() of a float timestamp, which truncates towards zero
+    if timestamp < 0 and fraction and fraction.strip('0'): timestamp += 1
+    return timestamp
+
+@lru_cache(maxsize=CACHE_SIZE)
 def date_to_unix(date: str) -> int:
     """
     Converts dates from RecNet to an unix timestamp, that can be used to show dates more elegantly.
+    The formats RecNet uses are parsed by a fast path, and anything else falls back to dateutil.
+    Results are cached, since the same dates tend to repeat across responses.
 
     Credit to Jegarde for this function.
 
     @param date: String representation of a date.
     @return: Unix date represented as an integer.
     """
-        
-    timestamp = isoparse(date).timestamp()
-        
-    return int(timestamp)  # Return UNIX timestamp
\ No newline at end of file
+    timestamp = parse_iso_date(date)
+    if timestamp is not None: return timestamp
+
+    from dateutil.parser import isoparse
+    return int(isoparse(date).timestamp())  # Return UNIX timestamp
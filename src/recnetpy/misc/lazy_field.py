@@ -0,0 +1,71 @@
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+MISSING = object()
+
+class LazyField(Generic[T]):
+    """
+    A descriptor for a dataclass field that's derived from its
+    raw API response. The field is decoded on first access and
+    memoized on the instance, so fields that are never read
+    cost nothing.
+    """
+    #: The name of the attribute the field is accessed by.
+    name: str
+    #: The name of the attribute the decoded value is memoized in.
+    storage: str
+    #: The function which decodes the field from the raw data.
+    decode: Callable[[Any], T]
+    #: The value returned when the instance has no data, if any.
+    default: Any
+
+    def __init__(self, decode: Callable[[Any], T], default: Any = MISSING) -> None:
+        """
+        @param decode: A function which takes the raw data, and returns the field's value.
+        @param default: The value returned when the instance has no data. Raises an attribute error if not provided.
+        """
+        self.decode = decode
+        self.default = default
+
+    @staticmethod
+    def storage_name(name: str) -> str:
+        """
+        Gets the name of the attribute a field's value is memoized in.
+
+        @param name: The name of the field.
+        @return: The name of the storage attribute.
+        """
+        return f"_lazy_{name}"
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.storage = self.storage_name(name)
+
+    def __get__(self, instance: Optional[Any], owner: type) -> T:
+        if instance is None: return self
+        value = getattr(instance, self.storage, MISSING)
+        if value is not MISSING: return value
+        data = instance.data
+        if data is None:
+            if self.default is MISSING: 
+                raise AttributeError(f"'{owner.__name__}' object has no attribute '{self.name}'")
+            return self.default
+        value = self.decode(data)
+        setattr(instance, self.storage, value)
+        return value
+
+    def __set__(self, instance: Any, value: T) -> None:
+        setattr(instance, self.storage, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.reset(instance)
+
+    def reset(self, instance: Any) -> None:
+        """
+        Forgets the memoized value of an instance, so it's
+        decoded again on the next access.
+
+        @param instance: The instance the field belongs to.
+        """
+        setattr(instance, self.storage, MISSING)
@@ -0,0 +1,36 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from importlib import import_module
+import sys
+
+def lazy_import(package: str, exports: Dict[str, Iterable[str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Builds the module level ``__getattr__`` and ``__dir__`` functions
+    of a package (PEP 562), so each exported name is only imported
+    from its submodule the first time it's accessed. The imported
+    value is stored on the package, so later lookups are plain
+    attribute accesses. Other names are looked up as submodules
+    of the package.
+
+    :param package: The name of the package, usually ``__name__``.
+    :param exports: Maps each submodule, relative to the package, to the names it exports.
+    :return: The ``__getattr__``, ``__dir__`` and ``__all__`` of the package.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            # Submodules are still reachable as attributes, like they were when they were imported eagerly
+            try:
+                return import_module('.' + name, package)
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}": raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(modules))
+
+    return __getattr__, __dir__, list(modules)
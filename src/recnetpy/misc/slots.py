@@ -0,0 +1,47 @@
+from abc import ABCMeta
+from typing import Any, ClassVar, Dict, Tuple
+
+from .lazy_field import LazyField
+
+def is_class_var(annotation: Any) -> bool:
+    """
+    Checks if an annotation marks a class variable.
+
+    @param annotation: A class attribute annotation.
+    @return: True if the annotation is a ClassVar.
+    """
+    if isinstance(annotation, str): return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or getattr(annotation, '__origin__', None) is ClassVar
+
+class SlotsMeta(ABCMeta):
+    """
+    A metaclass which gives classes ``__slots__`` built from their
+    annotated attributes, so instances don't carry a ``__dict__``.
+    Default values of annotated attributes are moved into
+    ``__field_defaults__``, since a slot can't share its name with
+    a class attribute, and lazy fields get a slot to memoize into.
+    """
+    def __new__(mcls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> type:
+        if '__slots__' not in namespace:
+            inherited = set()
+            for base in bases:
+                for klass in base.__mro__:
+                    inherited.update(getattr(klass, '__slots__', ()))
+            defaults: Dict[str, Any] = {}
+            slots = []
+            for attr, annotation in namespace.get('__annotations__', {}).items():
+                if is_class_var(annotation) or attr in inherited: continue
+                value = namespace.get(attr)
+                if isinstance(value, LazyField):
+                    slots.append(LazyField.storage_name(attr))
+                    continue
+                if attr in namespace: defaults[attr] = namespace.pop(attr)
+                slots.append(attr)
+            if not any('__weakref__' in vars(klass) for base in bases for klass in base.__mro__):
+                slots.append('__weakref__')
+            namespace['__slots__'] = tuple(slots)
+            namespace['__field_defaults__'] = {
+                **{key: value for base in reversed(bases) for key, value in getattr(base, '__field_defaults__', {}).items()},
+                **defaults
+            }
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
@@ -1,12 +1,15 @@
 from typing import Generic, Type, TypedDict, Optional, List, TypeVar
 
+from .slots import SlotsMeta
+
 VC = TypeVar("VC", bound="VariableClass")
 RT = TypeVar("RT", bound=TypedDict)
 
-class VariableClass(Generic[RT]):
+class VariableClass(Generic[RT], metaclass=SlotsMeta):
     """
     This class is ONLY to be inherited. It adds the create_from_list 
-    function, but still preserves type safety.
+    function, but still preserves type safety. Subclasses use slots
+    built from their annotations.
     """
     @classmethod
     def create_from_list(cls: Type[VC], data: Optional[List[RT]] = None) -> Optional[List[VC]]:
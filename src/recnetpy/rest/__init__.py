@@ -1,2 +1,32 @@
-from .route_manager import RouteManager
-from .response import Response
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from ..misc import lazy_import
+
+if TYPE_CHECKING:
+    from .route_manager import RouteManager
+    from .response import Response
+    from .rate_limiter import RateLimiter
+    from .priority import Priority, use_priority
+    from .deadline import use_timeout
+    from .tenant import use_tenant, TenantScheduler, TenantStats
+    from .exceptions import DeadlineExceeded, MapError
+    from .host_pool import HostPool, HostStats
+    from .api_key_pool import APIKeyPool, APIKey
+    from .retry_policy import RetryPolicy, RetryBudget
+    from .cache import BaseCache, MemoryCache, SQLiteCache, CachePolicy
+    from .token_store import BaseTokenStore, FileTokenStore, RedisTokenStore
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".route_manager": ["RouteManager"],
+    ".response": ["Response"],
+    ".rate_limiter": ["RateLimiter"],
+    ".priority": ["Priority", "use_priority"],
+    ".deadline": ["use_timeout"],
+    ".tenant": ["use_tenant", "TenantScheduler", "TenantStats"],
+    ".exceptions": ["DeadlineExceeded", "MapError"],
+    ".host_pool": ["HostPool", "HostStats"],
+    ".api_key_pool": ["APIKeyPool", "APIKey"],
+    ".retry_policy": ["RetryPolicy", "RetryBudget"],
+    ".cache": ["BaseCache", "MemoryCache", "SQLiteCache", "CachePolicy"],
+    ".token_store": ["BaseTokenStore", "FileTokenStore", "RedisTokenStore"],
+})
\ No newline at end of file
@@ -0,0 +1,147 @@
+from typing import TYPE_CHECKING, Hashable, Iterable, List, Optional
+from asyncio import get_running_loop
+from hashlib import sha256
+
+from .rate_limiter import RateLimiter, RATE_LIMIT
+from .priority import Priority
+
+if TYPE_CHECKING:
+    from .response import Response
+
+#: The number of seconds a rejected key is left out for. It doubles with each consecutive rejection.
+KEY_COOLDOWN = 60
+#: The max number of seconds a rejected key is left out for.
+MAX_KEY_COOLDOWN = 3600
+
+class APIKey:
+    """
+    A key in a key pool, along with the rate
+    limiter and health of the key.
+    """
+    #: The API key.
+    key: str
+    #: A name for the key which is safe to log, or share with other processes.
+    name: str
+    #: The token bucket requests authorized with this key have to pass through.
+    limiter: RateLimiter
+    #: Loop time until which the key is left out, after it was rejected.
+    disabled_until: float
+    #: The number of times in a row the key was rejected.
+    rejections: int
+    #: The number of requests sent with the key.
+    requests: int
+
+    def __init__(self, key: str, rate_limit: float = RATE_LIMIT) -> None:
+        self.key = key
+        self.name = "key:" + sha256(key.encode()).hexdigest()[:16]
+        self.limiter = RateLimiter(rate_limit)
+        self.disabled_until = 0.0
+        self.rejections = 0
+        self.requests = 0
+
+    def is_healthy(self, now: float) -> bool:
+        """
+        Checks if the key can be used.
+
+        @param now: The current loop time.
+        @return: True if the key isn't left out.
+        """
+        return now >= self.disabled_until
+
+    def budget(self, now: float) -> float:
+        """
+        Estimates the number of requests the key can send right
+        away. Requests waiting on the key count against it, and
+        so does the time left on a pause.
+
+        @param now: The current loop time.
+        @return: The number of tokens left, which can be negative.
+        """
+        limiter = self.limiter
+        limiter.refill(now)
+        budget = limiter.tokens - limiter.waiting
+        if now < limiter.paused_until:
+            budget -= (limiter.paused_until - now) * limiter.rate
+        return budget
+
+
+class APIKeyPool:
+    """
+    Spreads authorized requests over several API keys. Each
+    request is sent with the healthy key that has the most
+    budget left, and keys the server rejects are left out
+    for a while.
+    """
+    #: The keys in the pool.
+    keys: List[APIKey]
+    #: The number of requests per second allowed to each key.
+    rate_limit: float
+    #: The number of seconds a rejected key is left out for, before backing off.
+    cooldown: float
+
+    def __init__(self, keys: Iterable[str], rate_limit: float = RATE_LIMIT, cooldown: float = KEY_COOLDOWN) -> None:
+        self.keys = [APIKey(key, rate_limit) for key in keys]
+        if not self.keys: raise ValueError("A key pool needs at least one key.")
+        self.rate_limit = rate_limit
+        self.cooldown = cooldown
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def healthy(self) -> List[APIKey]:
+        """
+        The keys which aren't currently left out.
+        """
+        now = get_running_loop().time()
+        return [key for key in self.keys if key.is_healthy(now)]
+
+    def select(self) -> APIKey:
+        """
+        Picks the healthy key with the most budget left. If every
+        key is left out, the one which comes back first is used.
+
+        @return: The selected key.
+        """
+        now = get_running_loop().time()
+        healthy = [key for key in self.keys if key.is_healthy(now)]
+        if not healthy: return min(self.keys, key=lambda key: key.disabled_until)
+        return max(healthy, key=lambda key: key.budget(now))
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None, tenant: Hashable = None) -> APIKey:
+        """
+        Selects a key, and waits for its rate limiter
+        to hand out a token.
+
+        @param priority: The priority class of the request.
+        @param deadline: The monotonic time the token has to be taken by, or None.
+        @param tenant: The tenant the request is made on behalf of, or None.
+        @return: The key to send the request with.
+        """
+        key = self.select()
+        await key.limiter.acquire(priority, deadline, tenant)
+        key.requests += 1
+        return key
+
+    def feedback(self, key: APIKey, resp: 'Response') -> bool:
+        """
+        Reports the response of a request sent with a key. A 401,
+        or a 403 without a retry-after header, leaves the key out
+        for the cooldown, which doubles for each rejection in a row.
+        Other responses are passed on to the key's rate limiter.
+
+        @param key: The key the request was sent with.
+        @param resp: The response of the request.
+        @return: True if the key was rejected.
+        """
+        if resp.status == 401 or (resp.status == 403 and resp.headers.get("retry-after") is None):
+            now = get_running_loop().time()
+            # Requests that were in flight when the key was left out don't extend its cooldown
+            if key.is_healthy(now):
+                key.rejections += 1
+                cooldown = min(MAX_KEY_COOLDOWN, self.cooldown * 2 ** (key.rejections - 1))
+                key.disabled_until = now + cooldown
+            return True
+        if resp.success: key.rejections = 0
+        key.limiter.feedback(resp)
+        return False
@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING
+
+from ...misc import lazy_import
+
+if TYPE_CHECKING:
+    from .base_cache import BaseCache
+    from .memory_cache import MemoryCache
+    from .cache_policy import CachePolicy
+    from .sqlite_cache import SQLiteCache
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".base_cache": ["BaseCache"],
+    ".memory_cache": ["MemoryCache"],
+    ".cache_policy": ["CachePolicy"],
+    ".sqlite_cache": ["SQLiteCache"],
+})
\ No newline at end of file
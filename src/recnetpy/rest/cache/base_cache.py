@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Hashable, Optional
+
+if TYPE_CHECKING:
+    from ..response import Response
+
+class BaseCache(ABC):
+    """
+    The base class used by all response caches. This class 
+    is only to be inherited, and shouldn't be created
+    manually.
+    """
+    #: The number of lookups that found a fresh response.
+    hits: int
+    #: The number of lookups that found nothing, or an expired response.
+    misses: int
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups that were hits.
+        """
+        lookups = self.hits + self.misses
+        if not lookups: return 0.0
+        return self.hits / lookups
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Optional['Response']:
+        """
+        Looks up a cached response.
+
+        @param key: The canonical key of the request.
+        @return: The cached response, or None if it's missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: Hashable, resp: 'Response', ttl: float) -> None:
+        """
+        Caches a response.
+
+        @param key: The canonical key of the request.
+        @param resp: The response to cache.
+        @param ttl: The number of seconds the response stays fresh.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: Hashable) -> None:
+        """
+        Removes a cached response.
+
+        @param key: The canonical key of the request.
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes every cached response.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the cache,
+        such as database connections.
+        """
+        pass
@@ -0,0 +1,40 @@
+from typing import Dict, List, Optional, Tuple
+from fnmatch import fnmatchcase
+
+#: The number of seconds responses stay fresh, if no route matches.
+DEFAULT_TTL = 60
+#: Route patterns and how long their responses stay fresh. The first matching pattern wins.
+DEFAULT_ROUTE_TTLS: Dict[str, float] = {
+    "*/rooms/hot*": 30,
+    "*/images/v3/feed/global*": 30,
+    "*/playerevents/v1": 30,
+    "*/inventions/v1/toptoday*": 300,
+    "https://apim.rec.net/public/accounts/*": 3600,
+    "*/players/v2/progression/*": 600,
+}
+
+class CachePolicy:
+    """
+    Decides how long responses of each route stay fresh.
+    Routes are matched with shell style wildcards against
+    the url of the request, and a ttl of 0 disables caching.
+    """
+    #: The number of seconds responses stay fresh, if no route matches.
+    default_ttl: float
+    #: A list of route patterns and their ttls, in order of precedence.
+    route_ttls: List[Tuple[str, float]]
+
+    def __init__(self, route_ttls: Optional[Dict[str, float]] = None, default_ttl: float = DEFAULT_TTL) -> None:
+        self.default_ttl = default_ttl
+        self.route_ttls = list((route_ttls or {}).items()) + list(DEFAULT_ROUTE_TTLS.items())
+
+    def get_ttl(self, url: str) -> float:
+        """
+        Finds the ttl of a route.
+
+        @param url: The url of the request.
+        @return: The number of seconds the response stays fresh.
+        """
+        for pattern, ttl in self.route_ttls:
+            if fnmatchcase(url, pattern): return ttl
+        return self.default_ttl
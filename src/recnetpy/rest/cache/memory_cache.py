@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING, Hashable, Optional, Tuple
+from collections import OrderedDict
+import time
+
+from .base_cache import BaseCache
+
+if TYPE_CHECKING:
+    from ..response import Response
+
+class MemoryCache(BaseCache):
+    """
+    An in-memory response cache. Responses expire after
+    their ttl, and the least recently used responses are
+    evicted once the cache is full.
+    """
+    #: The max number of responses held.
+    max_size: int
+    __entries: 'OrderedDict[Hashable, Tuple[float, Response]]'
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.__entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    async def get(self, key: Hashable) -> Optional['Response']:
+        entry = self.__entries.get(key)
+        if entry is not None:
+            expires_at, resp = entry
+            if expires_at > time.monotonic():
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return resp
+            del self.__entries[key]
+        self.misses += 1
+        return None
+
+    async def set(self, key: Hashable, resp: 'Response', ttl: float) -> None:
+        self.__entries[key] = (time.monotonic() + ttl, resp)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    async def delete(self, key: Hashable) -> None:
+        self.__entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self.__entries.clear()
@@ -0,0 +1,158 @@
+from typing import Any, Callable, Hashable, Optional, TypeVar
+from asyncio import to_thread
+from threading import Lock
+from hashlib import sha256
+import sqlite3
+import json
+import time
+
+from multidict import CIMultiDict
+
+from .base_cache import BaseCache
+from ..response import Response
+
+RT = TypeVar('RT')
+
+#: The number of writes between checks of the size limit.
+EVICT_INTERVAL = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    data TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+class SQLiteCache(BaseCache):
+    """
+    A response cache persisted to an SQLite database, so it
+    survives restarts. The database runs in WAL mode, which
+    lets several processes on the same host read from it
+    while another one writes. Once the stored responses
+    exceed the size limit, the ones closest to expiring
+    are evicted first.
+    """
+    #: The path to the database file.
+    path: str
+    #: The max number of bytes of response data stored.
+    max_size: int
+    #: The number of writes between automatic compactions.
+    compact_interval: int
+    __connection: Optional[sqlite3.Connection]
+    __lock: Lock
+    __writes: int
+
+    def __init__(self, path: str, max_size: int = 256 * 1024 * 1024, compact_interval: int = 1000) -> None:
+        super().__init__()
+        self.path = path
+        self.max_size = max_size
+        self.compact_interval = compact_interval
+        self.__connection = None
+        self.__lock = Lock()
+        self.__writes = 0
+
+    @staticmethod
+    def hash_key(key: Hashable) -> str:
+        """
+        Hashes a canonical request key, so keys of any
+        length, and any credentials in them, aren't
+        stored in plain text.
+
+        @param key: The canonical key of the request.
+        @return: A hex digest of the key.
+        """
+        return sha256(json.dumps(key, default=str).encode()).hexdigest()
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self.__connection = connection
+        return self.__connection
+
+    async def __run(self, func: Callable[..., RT], *args: Any) -> RT:
+        def locked() -> RT:
+            with self.__lock:
+                return func(self.__connect(), *args)
+        return await to_thread(locked)
+
+    async def get(self, key: Hashable) -> Optional['Response']:
+        row = await self.__run(self.__get, self.hash_key(key))
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        url, status, headers, data = row
+        return Response(url, status, 200 <= status < 300, CIMultiDict(json.loads(headers)), json.loads(data))
+
+    @staticmethod
+    def __get(connection: sqlite3.Connection, key: str) -> Optional[tuple]:
+        return connection.execute(
+            "SELECT url, status, headers, data FROM responses WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+
+    async def set(self, key: Hashable, resp: 'Response', ttl: float) -> None:
+        headers = json.dumps(list(resp.headers.items()))
+        data = json.dumps(resp.data)
+        await self.__run(self.__set, self.hash_key(key), resp.url, resp.status, headers, data, time.time() + ttl)
+        self.__writes += 1
+        if self.__writes >= self.compact_interval: await self.compact()
+        elif self.__writes % EVICT_INTERVAL == 0: await self.__run(self.__evict)
+
+    def __set(self, connection: sqlite3.Connection, key: str, url: str, status: int, headers: str, data: str, expires_at: float) -> None:
+        size = len(headers) + len(data)
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (key, url, status, headers, data, size, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, url, status, headers, data, size, expires_at)
+        )
+
+    def __evict(self, connection: sqlite3.Connection) -> None:
+        total, = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_size: return
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        rows = connection.execute("SELECT key, size FROM responses ORDER BY expires_at").fetchall()
+        total, = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size: break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    async def delete(self, key: Hashable) -> None:
+        await self.__run(lambda connection, key: connection.execute("DELETE FROM responses WHERE key = ?", (key,)), self.hash_key(key))
+
+    async def clear(self) -> None:
+        await self.__run(lambda connection: connection.execute("DELETE FROM responses"))
+
+    async def compact(self) -> None:
+        """
+        Removes expired responses, and reclaims the
+        space they took up in the database file.
+        """
+        self.__writes = 0
+        await self.__run(self.__compact)
+
+    def __compact(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        self.__evict(connection)
+        connection.execute("VACUUM")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
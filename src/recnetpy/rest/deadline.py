@@ -0,0 +1,46 @@
+from typing import Iterator, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+#: The monotonic time by which requests made in the current context have to complete.
+current_deadline: ContextVar[Optional[float]] = ContextVar("recnetpy_deadline", default=None)
+
+def get_deadline(timeout: Optional[float] = None) -> Optional[float]:
+    """
+    Works out the deadline of a request, which is the
+    earlier of its own timeout and the deadline of the
+    current context.
+
+    @param timeout: The number of seconds the request may take, or None.
+    @return: The monotonic time the request has to complete by, or None if it has no deadline.
+    """
+    deadline = current_deadline.get()
+    if timeout is None: return deadline
+    own = time.monotonic() + timeout
+    return own if deadline is None else min(deadline, own)
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """
+    Returns the number of seconds left until a deadline.
+
+    @param deadline: The monotonic time of the deadline, or None.
+    @return: The number of seconds left, which is negative once it passed, or None without a deadline.
+    """
+    if deadline is None: return None
+    return deadline - time.monotonic()
+
+@contextmanager
+def use_timeout(timeout: float) -> Iterator[None]:
+    """
+    Gives every request made within the block, including
+    requests made by tasks created within it, a deadline.
+    Nested blocks can only shorten the deadline.
+
+    @param timeout: The number of seconds from now the requests have to complete in.
+    """
+    token = current_deadline.set(get_deadline(timeout))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
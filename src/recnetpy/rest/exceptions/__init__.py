@@ -4,4 +4,7 @@ from .bad_request import BadRequest
 from .internal_server_error import InternalServerError
 from .forbidden import Forbidden
 from .rate_limited import RateLimited
-from .unauthorized import Unauthorized
\ No newline at end of file
+from .unauthorized import Unauthorized
+from .bulk_fetch_error import BulkFetchError
+from .deadline_exceeded import DeadlineExceeded
+from .map_error import MapError
\ No newline at end of file
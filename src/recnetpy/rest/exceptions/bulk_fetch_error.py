@@ -0,0 +1,21 @@
+from typing import Any, List
+
+class BulkFetchError(Exception):
+    """
+    This exception is raised when some chunks of a bulk fetch failed. 
+    The results of the chunks that succeeded are still available.
+    """
+    #: The results of the chunks that succeeded, in input order.
+    results: List[Any]
+    #: The elements of the chunks that failed.
+    failed: List[Any]
+    #: The exceptions raised by the failed chunks.
+    errors: List[Exception]
+
+    def __init__(self, results: List[Any], failed: List[Any], errors: List[Exception]) -> None:
+        self.results = results
+        self.failed = failed
+        self.errors = errors
+        message = f"{len(errors)} chunk(s) of a bulk fetch failed, covering {len(failed)} element(s).\n" \
+                  f"First error: {errors[0]!r}"
+        super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..request import Request
+
+class DeadlineExceeded(Exception):
+    """
+    This exception is raised when a request can't be completed
+    before its deadline. Requests are dropped from the rate
+    limiter queue as soon as their deadline can't be met, so
+    they never spend any of the rate limit.
+    """
+    #: The request which missed its deadline, if it was known when raised.
+    request: Optional['Request']
+
+    def __init__(self, msg: str = "The deadline of the request passed.", request: Optional['Request'] = None) -> None:
+        self.request = request
+        super().__init__(msg)
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.request is None: return message
+        return f"{message} ({self.request.method.upper()} {self.request.url})"
@@ -7,8 +7,11 @@ class HTTPError(Exception):
     """
     This class represents an error or problem with a request.
     """
+    #: The response which caused the error.
+    response: 'Response'
 
     def __init__(self, resp: 'Response', msg: str = "No Info.") -> None:
+        self.response = resp
         error_message = f"Info: {msg}\n" \
                         f"URL: {resp.url}\n" \
                         f"Status: {resp.status}\n" \
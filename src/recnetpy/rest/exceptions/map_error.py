@@ -0,0 +1,22 @@
+from typing import Any, List
+
+class MapError(Exception):
+    """
+    This exception is raised when some calls made by a worker
+    pool failed. It's raised once every item was processed, so
+    the results of the calls that succeeded are still available.
+    """
+    #: The results of the calls that succeeded, in input order. It's empty if the results were streamed.
+    results: List[Any]
+    #: The items whose calls failed, in the order they failed.
+    failed: List[Any]
+    #: The exceptions raised by the failed calls.
+    errors: List[BaseException]
+
+    def __init__(self, results: List[Any], failed: List[Any], errors: List[BaseException]) -> None:
+        self.results = results
+        self.failed = failed
+        self.errors = errors
+        message = f"{len(errors)} call(s) failed.\n" \
+                  f"First error: {errors[0]!r}"
+        super().__init__(message)
@@ -1,5 +1,4 @@
-from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from . import HTTPError
 
@@ -10,9 +9,12 @@ class RateLimited(HTTPError):
     """
     This exception is raised when the a rate limit is encountered. Raised for a 403 with a retry-after header.
     """
+    #: The number of seconds until the time out expires.
+    retry_after: Optional[float]
 
     def __init__(self, resp: 'Response') -> None:
-        time_out = resp.headers.get("retry_after")
-        t = timedelta(time_out)
-        message = f"You're currently being rate limited. Time out expires in {t} seconds."
+        # Imported here, since the rate limiter raises exceptions from this package
+        from ..rate_limiter import parse_retry_after
+        self.retry_after = parse_retry_after(resp.headers.get("retry-after"))
+        message = f"You're currently being rate limited. Time out expires in {self.retry_after} seconds."
         super().__init__(resp, message)
\ No newline at end of file
@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+from asyncio import gather, TimeoutError
+import time
+
+from .rate_limiter import RateLimiter, RATE_LIMIT
+from .priority import Priority
+from .exceptions.deadline_exceeded import DeadlineExceeded
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from .response import Response
+    from .token_store import BaseTokenStore
+
+#: The default number of simultaneous connections a pool can open.
+CONNECTION_LIMIT = 100
+#: The number of seconds resolved host addresses are cached for.
+DNS_CACHE_TTL = 300
+
+class HostStats:
+    """
+    A small data class that keeps track of the
+    traffic that went through a host pool.
+    """
+    #: The number of requests sent.
+    requests: int
+    #: The number of responses received.
+    responses: int
+    #: The number of requests that raised before a response was received.
+    errors: int
+    #: The number of responses that told the client to back off.
+    rate_limited: int
+    #: The number of requests that were retried.
+    retries: int
+    #: The number of requests currently awaiting a response.
+    in_flight: int
+    #: The total number of seconds spent waiting on responses.
+    total_latency: float
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.responses = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """
+        The average number of seconds a response took.
+        """
+        if not self.responses: return 0.0
+        return self.total_latency / self.responses
+
+    def record(self, resp: 'Response', latency: float) -> None:
+        """
+        Records a received response.
+
+        @param resp: The response received.
+        @param latency: The number of seconds the response took.
+        """
+        self.responses += 1
+        self.total_latency += latency
+        if resp.headers.get("retry-after"): self.rate_limited += 1
+
+
+class HostPool:
+    """
+    This class groups the rate limiter, connection pool,
+    and stats of a host, or a group of hosts which share
+    the same limits.
+    """
+    #: The name of the pool, usually the host it serves.
+    name: str
+    #: The token bucket requests to this pool have to pass through.
+    limiter: RateLimiter
+    #: The max number of simultaneous connections.
+    connection_limit: int
+    #: The traffic that went through this pool.
+    stats: HostStats
+    __session: Optional['ClientSession']
+
+    def __init__(self, name: str, rate_limit: float = RATE_LIMIT, connection_limit: int = CONNECTION_LIMIT) -> None:
+        self.name = name
+        self.limiter = RateLimiter(rate_limit)
+        self.connection_limit = connection_limit
+        self.stats = HostStats()
+        self.__session = None
+
+    @property
+    def session(self) -> 'ClientSession':
+        """
+        The client session used for requests to this pool.
+        It gets created on first use, which is also when
+        aiohttp is first imported.
+        """
+        if self.__session is None or self.__session.closed:
+            from aiohttp import ClientSession, TCPConnector
+            connector = TCPConnector(limit=self.connection_limit, ttl_dns_cache=DNS_CACHE_TTL)
+            self.__session = ClientSession(connector=connector)
+        return self.__session
+
+    async def warm_up(self, url: str, connections: int = 1, timeout: float = 10, token_store: Optional['BaseTokenStore'] = None) -> bool:
+        """
+        Opens connections to the host of a url ahead of time, so
+        the first requests to it don't wait on DNS resolution and
+        the TLS handshake. Each connection sends a HEAD request to
+        the root of the host, which is kept alive in the connection
+        pool. The requests take tokens from the rate limiter, and
+        the shared bucket of the pool, like any other request, in
+        the background priority class.
+
+        @param url: A url of the host to connect to.
+        @param connections: The number of connections to open.
+        @param timeout: The number of seconds to wait for each connection, including the wait for a token.
+        @param token_store: The store the pool shares its rate limit through, if any.
+        @return: True if every connection was opened.
+        """
+        from aiohttp import ClientTimeout, ClientError
+        parts = urlsplit(url)
+        root = f"{parts.scheme}://{parts.netloc}/"
+        client_timeout = ClientTimeout(total=timeout)
+        async def connect() -> bool:
+            deadline = time.monotonic() + timeout
+            try:
+                await self.limiter.acquire(Priority.BACKGROUND, deadline)
+                if token_store is not None:
+                    await token_store.acquire(self.name, self.limiter.rate, self.limiter.capacity, deadline)
+                async with self.session.head(root, allow_redirects=False, timeout=client_timeout):
+                    return True
+            except (ClientError, TimeoutError, DeadlineExceeded):
+                return False
+        results = await gather(*(connect() for _ in range(connections)))
+        return all(results)
+
+    async def close(self) -> None:
+        """
+        Closes the underlying client session.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
@@ -1,16 +1,24 @@
-from typing import TYPE_CHECKING, Dict
-from math import floor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Union
+from urllib.parse import urlsplit
 
-from asyncio import Lock, get_running_loop, AbstractEventLoop, sleep
-from aiohttp import ClientSession, TCPConnector
+from asyncio import get_running_loop, gather, sleep, TimeoutError
 
 from .exceptions import *
+from .host_pool import HostPool, HostStats, CONNECTION_LIMIT
+from .api_key_pool import APIKey, APIKeyPool
+from .tenant import TenantScheduler
+from .rate_limiter import RATE_LIMIT, parse_retry_after
+from .retry_policy import RetryPolicy, RetryBudget
+from .single_flight import SingleFlight
+from .cache import BaseCache, CachePolicy
+from .token_store import BaseTokenStore
+from .json_decoder import JSONDecoder, get_json_decoder
+from .json_stream import iter_json_array, CHUNK_SIZE
+from .response import Response
+from .request import parse_response
 
 if TYPE_CHECKING:
     from .request import Request
-    from .response import Response
-    
-RATE_LIMIT = 30
 
 def verify_status(resp: 'Response'):
     match resp.status:
@@ -35,59 +43,336 @@ def verify_status(resp: 'Response'):
 class HTTPClient:
     """
     This class is responsible for managing the
-    client session, and adding requests to the
-    thread pool.
+    client sessions, and sending requests through
+    the rate limiter of the host they're meant for.
     """
-    session: ClientSession
-    api_key: str
-    rate_limit: int
-    remaining_limit: int
-    next_tick: float
-    tick_offset: float
-    __loop: AbstractEventLoop
-    __sleep: Lock
-    
-
-    def __init__(self, api_key: str) -> None:
-        connector = TCPConnector(limit=100)
-        self.session = ClientSession(connector=connector)
-        self.__sleep = Lock()
-        self.__loop = get_running_loop()
-        self.api_key = api_key
-        self.rate_limit = RATE_LIMIT
-        self.tick_offset = self.__loop.time() % 1
-        self.reset_limit()
-
-    def reset_limit(self):
-        self.next_tick = floor(self.__loop.time() + 1) + self.tick_offset
-        self.remaining_limit = self.rate_limit
+    #: The API key authorized requests are sent with, if there's only one.
+    api_key: Optional[str]
+    #: Spreads authorized requests over several API keys, if more than one is given.
+    key_pool: Optional[APIKeyPool]
+    #: The default number of requests per second allowed to each host.
+    rate_limit: float
+    #: The default max number of simultaneous connections to each host.
+    connection_limit: int
+    #: Maps a host to the name of the pool it shares with other hosts.
+    host_groups: Dict[str, str]
+    #: The pools requests are sent through, keyed by name.
+    pools: Dict[str, HostPool]
+    #: Decides which failed requests are retried, and when.
+    retry_policy: RetryPolicy
+    #: Limits the number of retries across all hosts.
+    retry_budget: RetryBudget
+    #: Coalesces identical idempotent requests which are in flight.
+    single_flight: SingleFlight
+    #: An optional cache for the responses of idempotent requests.
+    cache: Optional[BaseCache]
+    #: Decides how long responses of each route are cached for.
+    cache_policy: CachePolicy
+    #: The function used to decode JSON response bodies.
+    json_loads: JSONDecoder
+    #: An optional store which shares rate limits with other processes.
+    token_store: Optional[BaseTokenStore]
+    #: Keeps track of the quotas and stats of each tenant.
+    tenants: TenantScheduler
+
+    def __init__(self, api_key: Union[str, Sequence[str], APIKeyPool, None], rate_limit: float = RATE_LIMIT, connection_limit: int = CONNECTION_LIMIT, retry_policy: Optional[RetryPolicy] = None, retry_budget: Optional[RetryBudget] = None, cache: Optional[BaseCache] = None, cache_policy: Optional[CachePolicy] = None, json_loads: Union[str, JSONDecoder, None] = None, token_store: Optional[BaseTokenStore] = None, tenant_quota: Optional[float] = None) -> None:
+        if isinstance(api_key, (list, tuple)): api_key = APIKeyPool(api_key, rate_limit)
+        if isinstance(api_key, APIKeyPool):
+            self.api_key, self.key_pool = None, api_key
+        else:
+            self.api_key, self.key_pool = api_key, None
+        self.rate_limit = rate_limit
+        self.connection_limit = connection_limit
+        self.host_groups = {}
+        self.pools = {}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.single_flight = SingleFlight()
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        self.json_loads = get_json_decoder(json_loads)
+        self.token_store = token_store
+        self.tenants = TenantScheduler(tenant_quota)
+
+    @property
+    def stats(self) -> Dict[str, HostStats]:
+        """
+        The traffic stats of every pool, keyed by name.
+        """
+        return {name: pool.stats for name, pool in self.pools.items()}
+
+    def configure_pool(self, name: str, hosts: Optional[Iterable[str]] = None, rate_limit: Optional[float] = None, connection_limit: Optional[int] = None) -> HostPool:
+        """
+        Creates or updates a pool. Hosts assigned to the
+        pool share its rate limit and connections.
+
+        @param name: The name of the pool.
+        @param hosts: The hosts to route through the pool, defaults to the name.
+        @param rate_limit: The number of requests per second allowed.
+        @param connection_limit: The max number of simultaneous connections.
+        @return: The configured pool.
+        """
+        for host in hosts or [name]:
+            self.host_groups[host] = name
+        pool = self.pools.get(name)
+        if pool is None:
+            pool = HostPool(
+                name, 
+                self.rate_limit if rate_limit is None else rate_limit, 
+                self.connection_limit if connection_limit is None else connection_limit
+            )
+            self.pools[name] = pool
+        else:
+            if rate_limit is not None: pool.limiter.set_rate(rate_limit)
+            if connection_limit is not None: pool.connection_limit = connection_limit
+        return pool
+
+    def get_pool(self, url: str) -> HostPool:
+        """
+        Gets the pool responsible for the host of a url,
+        and creates one if the host hasn't been seen before.
+
+        @param url: The url a request is sent to.
+        @return: The pool for the url's host.
+        """
+        host = urlsplit(url).netloc
+        name = self.host_groups.get(host, host)
+        pool = self.pools.get(name)
+        if pool is None: pool = self.configure_pool(name, [host])
+        return pool
         
     async def push(self, request: 'Request') -> 'Response':
         """
-        Creates a lock unique to the request, and 
-        adds the request to the thread pool to be
-        executed.
+        Executes a request. Idempotent requests are served from
+        the cache if one is configured, and requests identical
+        to one that's already in flight share its response 
+        instead of being sent again, as long as the request in
+        flight has the same priority and tenant, and won't give
+        up before their deadline.
 
         @param request: The request object to be executed.
         @return: Returns a response object. 
+        @raise DeadlineExceeded: If the request can't be completed before its deadline.
         """
-        async with self.__sleep:
-            t = self.__loop.time()
-            if t >= self.next_tick: self.reset_limit()
-            if self.remaining_limit <= 0:
-                await sleep(self.next_tick - t)
-                self.reset_limit()
+        if not request.idempotent: return await self.execute(request)
+        key = request.key
+        # Requests only share a flight within their priority class and tenant, so each is scheduled and charged as its own
+        flight_key = (key, request.priority, request.tenant)
+        if self.cache is None:
+            return await self.single_flight.do(flight_key, lambda: self.execute(request), request.deadline)
+        if not request.force:
+            resp = await self.cache.get(key)
+            if resp is not None: return resp
+        async def fetch() -> 'Response':
+            # Only the request that was sent stores the response, not every caller sharing it
+            resp = await self.execute(request)
+            ttl = self.cache_policy.get_ttl(request.url)
+            if ttl > 0 and resp.status == 200: await self.cache.set(key, resp, ttl)
+            return resp
+        return await self.single_flight.do(flight_key, fetch, request.deadline)
+
+    async def execute(self, request: 'Request', send: Optional[Callable[[HostPool, 'Request'], Awaitable['Response']]] = None) -> 'Response':
+        """
+        Sends a request through the rate limiter of its host.
+        Connection errors and retryable statuses are retried
+        with backoff, as long as the retry policy and the 
+        retry budget allow it, and the retry can be made
+        before the request's deadline.
+
+        @param request: The request object to be executed.
+        @param send: The function making a single attempt, defaults to ``send``.
+        @return: Returns a response object. 
+        @raise DeadlineExceeded: If the request can't be completed before its deadline.
+        """
+        from aiohttp import ClientError
+        pool = self.get_pool(request.url)
+        policy = self.retry_policy
+        send = send or self.send
+        self.retry_budget.deposit()
+        while True:
+            error = None
+            try:
+                resp = await send(pool, request)
+            except DeadlineExceeded as e:
+                e.request = request
+                raise
+            except (ClientError, TimeoutError) as e:
+                if request.time_left is not None and request.time_left <= 0:
+                    raise DeadlineExceeded("The deadline passed while the request was being sent.", request) from e
+                if request.attempts >= policy.max_retries or not self.retry_budget.withdraw(): raise e
+                error = e
+                delay = policy.get_delay(request.attempts)
+            else:
+                if not policy.should_retry(resp) or request.attempts >= policy.max_retries or not self.retry_budget.withdraw():
+                    verify_status(resp)
+                    return resp
+                delay = policy.get_delay(request.attempts, resp)
+            if request.time_left is not None and request.time_left <= delay:
+                # The retry can't be made in time, so the last attempt is final
+                if error is not None: raise DeadlineExceeded("The deadline would pass before the request could be retried.", request) from error
+                verify_status(resp)
+                return resp
+            request.attempts += 1
+            pool.stats.retries += 1
+            await sleep(delay)
+
+    async def send(self, pool: HostPool, request: 'Request') -> 'Response':
+        """
+        Waits for the rate limiter to hand out a token, makes a
+        single attempt at the request, and reports the response
+        back to the limiter so it can adapt its rate.
+
+        @param pool: The pool of the request's host.
+        @param request: The request object to be executed.
+        @return: Returns a response object. 
+        """
+        async def attempt() -> 'Response':
             request.send()
-            self.remaining_limit -= 1
-        resp = await request.get_result()
-        verify_status(resp)
-        return resp
+            return await request.get_result()
+        return await self.__attempt(pool, request, attempt)
 
+    async def stream(self, request: 'Request') -> AsyncIterator[Any]:
+        """
+        Executes a request whose response is a JSON array, and
+        yields its elements as they're parsed from the body
+        stream. The body is never buffered as a whole, and
+        streamed responses aren't cached or shared.
+
+        @param request: The request object to be executed.
+        @return: An async iterator of the decoded elements.
+        """
+        resp = await self.execute(request, self.open)
+        response = resp.data
+        try:
+            async for element in iter_json_array(response.content.iter_chunked(CHUNK_SIZE)):
+                yield element
+        finally:
+            if response.content.at_eof(): response.release()
+            else: response.close()
+
+    async def open(self, pool: HostPool, request: 'Request') -> 'Response':
+        """
+        Makes a single attempt at a request, like ``send``, but
+        leaves the body of a successful response unread. The
+        data of a successful response is the open client
+        response, while other responses are parsed as usual.
+
+        @param pool: The pool of the request's host.
+        @param request: The request object to be executed.
+        @return: Returns a response object. 
+        """
+        async def attempt() -> 'Response':
+            response = await request.open()
+            if response.status == 200:
+                return Response(request.url, response.status, response.ok, response.headers, response)
+            async with response:
+                return Response(request.url, response.status, response.ok, response.headers, await parse_response(response, request.loads))
+        return await self.__attempt(pool, request, attempt)
+
+    async def authorize(self, request: 'Request') -> Optional[APIKey]:
+        """
+        Picks the API key an attempt at a request is sent with. 
+        With a key pool, this waits for the key's rate limiter.
+
+        @param request: The request object to be executed.
+        @return: The key taken from the key pool, if one was used.
+        """
+        if not request.use_auth:
+            request.api_key = None
+            return None
+        if self.key_pool is None:
+            request.api_key = self.api_key
+            return None
+        key = await self.key_pool.acquire(request.priority, request.deadline, request.tenant)
+        if self.token_store is not None:
+            await self.token_store.acquire(key.name, key.limiter.rate, key.limiter.capacity, request.deadline)
+        request.api_key = key.key
+        return key
+
+    async def share_feedback(self, name: str, resp: 'Response') -> None:
+        """
+        Pauses a shared bucket in every process when the
+        server tells the client to back off.
+
+        @param name: The name of the bucket the request drew from.
+        @param resp: The response of the request.
+        """
+        if self.token_store is None or resp.status not in (403, 429, 503): return
+        retry_after = parse_retry_after(resp.headers.get("retry-after"))
+        if retry_after is not None: await self.token_store.pause(name, retry_after)
+
+    async def __wait_turn(self, pool: HostPool, request: 'Request') -> Optional[APIKey]:
+        stats = self.tenants.get_stats(request.tenant)
+        start = get_running_loop().time()
+        stats.waiting += 1
+        try:
+            # The tenant's quota comes first, so a throttled tenant doesn't hold a place in the host's queue
+            await self.tenants.acquire(request.tenant, request.priority, request.deadline)
+            await pool.limiter.acquire(request.priority, request.deadline, request.tenant)
+            if self.token_store is not None:
+                await self.token_store.acquire(pool.name, pool.limiter.rate, pool.limiter.capacity, request.deadline)
+            key = await self.authorize(request)
+            if request.time_left is not None and request.time_left <= 0:
+                raise DeadlineExceeded("The deadline passed while the request was waiting to be sent.", request)
+        except DeadlineExceeded:
+            stats.shed += 1
+            raise
+        finally:
+            stats.waiting -= 1
+        stats.requests += 1
+        stats.total_wait += get_running_loop().time() - start
+        return key
+
+    async def __attempt(self, pool: HostPool, request: 'Request', attempt: Callable[[], Awaitable['Response']]) -> 'Response':
+        while True:
+            key = await self.__wait_turn(pool, request)
+            loop = get_running_loop()
+            start = loop.time()
+            pool.stats.requests += 1
+            pool.stats.in_flight += 1
+            try:
+                resp = await attempt()
+            except Exception:
+                pool.stats.errors += 1
+                raise
+            finally:
+                pool.stats.in_flight -= 1
+            pool.stats.record(resp, loop.time() - start)
+            if key is None:
+                pool.limiter.feedback(resp)
+                await self.share_feedback(pool.name, resp)
+                return resp
+            # Rate limits apply to each key, so the host's limiter isn't backed off.
+            # A rejected key is dropped, and the request is sent again with another one.
+            if not self.key_pool.feedback(key, resp):
+                await self.share_feedback(key.name, resp)
+                return resp
+            if not self.key_pool.healthy: return resp
+
+    async def warm_up(self, urls: Iterable[str], connections: int = 1, timeout: float = 10) -> Dict[str, bool]:
+        """
+        Opens connections to the hosts of the given urls ahead
+        of time, through the pools of each host. Each host is
+        only connected to once, no matter how many of its urls
+        are passed. Every connection costs a token of the host's
+        rate limit.
+
+        @param urls: The urls of the hosts to connect to.
+        @param connections: The number of connections to open to each host.
+        @param timeout: The number of seconds to wait for each connection.
+        @return: A dictionary of hosts, and whether connecting to them succeeded.
+        """
+        hosts: Dict[str, str] = {}
+        for url in urls:
+            hosts.setdefault(urlsplit(url).netloc, url)
+        results = await gather(*(self.get_pool(url).warm_up(url, connections, timeout, self.token_store) for url in hosts.values()))
+        return dict(zip(hosts, results))
 
-      
     async def stop(self) -> None:
         """
-        Stops the thread pool, and closes the
-        underlying client connection.
+        Closes the underlying client connections
+        of every pool, and the response cache.
         """
-        await self.session.close()
+        for pool in self.pools.values():
+            await pool.close()
+        if self.cache is not None: self.cache.close()
@@ -0,0 +1,36 @@
+from typing import Any, Callable, Union
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#: A function which decodes a raw JSON body.
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+def stdlib_loads(body: Union[bytes, str]) -> Any:
+    """
+    Decodes a JSON body with the standard library decoder.
+
+    @param body: The raw body.
+    @return: The decoded data.
+    """
+    return json.loads(body)
+
+def get_json_decoder(backend: Union[str, JSONDecoder, None] = None) -> JSONDecoder:
+    """
+    Resolves the JSON decoder used to parse responses. By default
+    orjson is used when it's installed, and the standard library
+    decoder otherwise.
+
+    @param backend: A decoder function, the name of a backend (``'orjson'`` or ``'json'``), or None for the default.
+    @return: A function which decodes raw JSON bodies.
+    """
+    if callable(backend): return backend
+    if backend is None: return orjson.loads if orjson is not None else stdlib_loads
+    if backend == 'json': return stdlib_loads
+    if backend == 'orjson':
+        if orjson is None: raise ImportError("The orjson backend requires orjson to be installed. Install it with `pip install recnetpy[speedups]`.")
+        return orjson.loads
+    raise ValueError(f"Unknown JSON backend: {backend!r}")
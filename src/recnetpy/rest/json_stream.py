@@ -0,0 +1,70 @@
+from typing import Any, AsyncIterable, AsyncIterator
+from json import JSONDecoder, JSONDecodeError
+import codecs
+import re
+
+#: The number of bytes read from a response stream at a time.
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Incrementally parses a JSON array from a stream of byte
+    chunks, and yields each element as soon as it's complete.
+    Only the unparsed tail of the stream is buffered, so memory
+    stays flat however large the array is.
+
+    @param chunks: An async iterable of raw body chunks.
+    @return: An async iterator of the decoded elements.
+    """
+    decoder = JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    started = False
+    ended = False
+    eof = False
+    # After an element fails to parse, wait until the buffer has grown
+    # enough before trying again, so huge elements aren't parsed quadratically.
+    retry_at = 0
+    iterator = chunks.__aiter__()
+
+    while not ended:
+        if eof: 
+            if not started: return
+            raise JSONDecodeError("Unterminated array", buffer, pos)
+        try:
+            chunk = await iterator.__anext__()
+            buffer = buffer[pos:] + utf8.decode(chunk)
+        except StopAsyncIteration:
+            buffer = buffer[pos:] + utf8.decode(b'', final=True)
+            eof = True
+        retry_at -= pos
+        pos = 0
+        if len(buffer) < retry_at and not eof: continue
+
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer): break
+            if not started:
+                if buffer[pos] != '[': raise JSONDecodeError("Expected a JSON array", buffer, pos)
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ',':
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                ended = True
+                break
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except JSONDecodeError:
+                if eof: raise
+                retry_at = 2 * (len(buffer) - pos) + pos
+                break
+            # A scalar at the end of the buffer, such as a number, may continue in the next chunk
+            if end >= len(buffer) and not eof: break
+            pos = end
+            yield element
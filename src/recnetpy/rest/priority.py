@@ -0,0 +1,38 @@
+from typing import Dict, Iterator, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+
+class Priority(IntEnum):
+    """
+    Enum of the classes requests are scheduled in. While
+    requests of several classes wait on the same rate limiter,
+    each class gets tokens in proportion to its weight.
+    """
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+#: The share of tokens each class gets, relative to the others, while they're all waiting.
+PRIORITY_WEIGHTS: Dict[Priority, float] = {
+    Priority.INTERACTIVE: 16,
+    Priority.NORMAL: 4,
+    Priority.BACKGROUND: 1,
+}
+
+#: The priority of requests made in the current context.
+current_priority: ContextVar[Priority] = ContextVar("recnetpy_priority", default=Priority.NORMAL)
+
+@contextmanager
+def use_priority(priority: Union[Priority, int]) -> Iterator[None]:
+    """
+    Sets the priority of every request made within the block,
+    including requests made by tasks created within it.
+
+    @param priority: The priority of the requests.
+    """
+    token = current_priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
@@ -0,0 +1,317 @@
+from typing import TYPE_CHECKING, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+from heapq import heappush, heappop
+from itertools import count
+from email.utils import parsedate_to_datetime
+from asyncio import Future, TimerHandle, CancelledError, get_running_loop
+import time
+
+from .priority import Priority, PRIORITY_WEIGHTS
+from .deadline import remaining
+from .exceptions.deadline_exceeded import DeadlineExceeded
+
+if TYPE_CHECKING:
+    from .response import Response
+
+#: The default number of requests allowed per second.
+RATE_LIMIT = 30
+#: The factor the rate is multiplied by after being rate limited.
+BACKOFF_FACTOR = 0.5
+#: The amount the rate increases by, in tokens per second, for each successful response.
+RECOVERY_STEP = 0.1
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a retry-after header value, which can be
+    a number of seconds or an HTTP date.
+
+    @param value: The raw header value.
+    @return: The number of seconds to wait, or None if it couldn't be parsed.
+    """
+    if value is None: return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def parse_header_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    """
+    Returns the first header out of the given names
+    that holds a valid number.
+
+    @param headers: The response headers.
+    @param names: The header names to look for, in order.
+    @return: The parsed number, or None if none of the headers are present.
+    """
+    for name in names:
+        value = headers.get(name)
+        if value is None: continue
+        try:
+            return float(value.split(',')[0])
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimiter:
+    """
+    A token bucket which refills continuously. The rate adapts
+    to the retry-after and rate limit headers returned by the
+    server. Waiting requests are woken up with weighted fair
+    queuing. Each tenant and priority class pair is a flow,
+    which gets a share of tokens in proportion to the weight
+    of its class, so no flow is starved, and a busy tenant
+    can't crowd out the others. Requests of the same flow
+    are woken up in the order they arrived.
+    """
+    #: The current number of tokens added to the bucket per second.
+    rate: float
+    #: The rate the limiter recovers to after backing off.
+    max_rate: float
+    #: The lowest rate the limiter will back off to.
+    min_rate: float
+    #: The max number of tokens the bucket can hold.
+    capacity: float
+    #: The number of tokens currently available.
+    tokens: float
+    #: Loop time until which no tokens will be handed out.
+    paused_until: float
+    #: Loop time until which rate limited responses belong to the last back-off, and don't lower the rate again.
+    backoff_until: float
+    last_refill: Optional[float]
+    #: The number of seconds the limiter is paused for once it starts, if it was paused before the event loop ran.
+    initial_pause: float
+    #: The share of tokens each priority class gets while they're all waiting.
+    weights: Dict[Priority, float]
+    #: The virtual finish time of the last woken up request.
+    virtual_time: float
+    __finish_times: Dict[Tuple[Hashable, Priority], float]
+    __waiters: List[Tuple[float, int, Future]]
+    __order: Iterator[int]
+    __timer: Optional[TimerHandle]
+
+    def __init__(self, rate: float = RATE_LIMIT, capacity: Optional[float] = None, min_rate: float = 1) -> None:
+        self.rate = float(rate)
+        self.max_rate = float(rate)
+        self.min_rate = float(min(min_rate, rate))
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.tokens = self.capacity
+        self.paused_until = 0.0
+        self.backoff_until = 0.0
+        self.last_refill = None
+        self.initial_pause = 0.0
+        self.weights = dict(PRIORITY_WEIGHTS)
+        self.virtual_time = 0.0
+        self.__finish_times = {}
+        self.__waiters = []
+        self.__order = count()
+        self.__timer = None
+
+    @property
+    def waiting(self) -> int:
+        """
+        The number of requests waiting for a token.
+        """
+        return sum(1 for _, _, future in self.__waiters if not future.done())
+
+    def refill(self, now: float) -> None:
+        """
+        Adds the tokens accumulated since the last refill.
+        No tokens accumulate while the limiter is paused.
+
+        @param now: The current loop time.
+        """
+        if self.last_refill is None:
+            self.last_refill = now
+            if self.initial_pause: self.paused_until = max(self.paused_until, now + self.initial_pause)
+        elapsed = now - max(self.last_refill, self.paused_until)
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_refill = max(self.last_refill, now)
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a token without waiting, if one is available
+        and no other request is queued ahead.
+
+        @return: True if a token was taken.
+        """
+        now = get_running_loop().time()
+        self.refill(now)
+        self.__prune()
+        if self.__waiters or now < self.paused_until or self.tokens < 1: return False
+        self.tokens -= 1
+        return True
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None, tenant: Hashable = None) -> None:
+        """
+        Waits until a token is available, and takes it.
+        The lock is never held while sleeping, waiters are
+        woken up by a timer in order of their virtual finish
+        time, which spaces out the waiters of each flow by
+        the inverse of its weight. A waiter whose deadline
+        can't be met is dropped from the queue without
+        taking a token.
+
+        @param priority: The priority class of the request.
+        @param deadline: The monotonic time the token has to be taken by, or None.
+        @param tenant: The tenant the request is made on behalf of, or None.
+        @raise DeadlineExceeded: If the deadline passes before a token is available.
+        """
+        time_left = remaining(deadline)
+        if time_left is not None and time_left <= 0: raise DeadlineExceeded("The deadline passed before the request was queued.")
+        if self.try_acquire(): return
+        loop = get_running_loop()
+        if time_left is not None and self.paused_until - loop.time() >= time_left:
+            raise DeadlineExceeded("The rate limiter is paused past the deadline of the request.")
+        future = loop.create_future()
+        # Finish times are relative to the current backlog, so they start over once it clears
+        if not self.__waiters: self.__finish_times.clear()
+        flow = (tenant, priority)
+        start = max(self.virtual_time, self.__finish_times.get(flow, 0.0))
+        finish = start + 1 / self.weights[priority]
+        self.__finish_times[flow] = finish
+        heappush(self.__waiters, (finish, next(self.__order), future))
+        self.__schedule()
+        expiry = None if time_left is None else loop.call_later(time_left, self.__expire, future)
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Hand the token back, and wake up the next waiter for it
+                self.tokens += 1
+                self.__reschedule()
+            else:
+                future.cancel()
+                self.__schedule()
+            raise
+        finally:
+            if expiry is not None: expiry.cancel()
+
+    def __expire(self, future: Future) -> None:
+        if future.done(): return
+        future.set_exception(DeadlineExceeded("The deadline passed while the request was waiting for the rate limiter."))
+        self.__prune()
+
+    def feedback(self, resp: 'Response') -> None:
+        """
+        Adjusts the rate based on the response returned by
+        the server. A retry-after header makes the limiter
+        back off, while successful responses slowly restore
+        the rate.
+
+        @param resp: The response of a request that went through this limiter.
+        """
+        retry_after = parse_retry_after(resp.headers.get("retry-after"))
+        if retry_after is not None and resp.status in (403, 429, 503):
+            self.back_off(retry_after)
+        elif resp.success:
+            self.rate = min(self.max_rate, self.rate + RECOVERY_STEP)
+        self.apply_headers(resp.headers)
+
+    def apply_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Syncs the bucket with any rate limit headers the server returned.
+
+        @param headers: The response headers.
+        """
+        remaining = parse_header_number(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+        if remaining is None: return
+        self.tokens = min(self.tokens, remaining)
+        if remaining >= 1: return
+        reset = parse_header_number(headers, "x-ratelimit-reset", "ratelimit-reset")
+        if reset is None: return
+        # Large values are unix timestamps rather than a delay
+        if reset > 1e9: reset -= time.time()
+        self.pause(reset)
+
+    def back_off(self, delay: float) -> None:
+        """
+        Lowers the rate, and pauses the limiter. Requests in flight
+        when the server starts throttling are rate limited together,
+        so the rate is only lowered once per retry-after window,
+        while the pause is still extended.
+
+        @param delay: The number of seconds to pause for.
+        """
+        now = get_running_loop().time()
+        if now >= self.backoff_until:
+            self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+            self.backoff_until = now + max(0.0, delay)
+        self.tokens = min(self.tokens, 0)
+        self.pause(delay)
+
+    def pause(self, delay: float) -> None:
+        """
+        Stops tokens from being handed out for a period of time.
+        Before the event loop runs, the pause starts once the
+        limiter is first used.
+
+        @param delay: The number of seconds to pause for.
+        """
+        now = self.__now()
+        if now is None:
+            self.initial_pause = max(self.initial_pause, delay)
+            return
+        self.refill(now)
+        self.paused_until = max(self.paused_until, now + max(0.0, delay))
+        self.__reschedule()
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Changes the rate, and the rate the limiter recovers to.
+        It can be called before the event loop runs.
+
+        @param rate: The number of tokens per second.
+        """
+        now = self.__now()
+        # Without a loop, there are no tokens to refill or waiters to wake up
+        if now is not None: self.refill(now)
+        self.rate = self.max_rate = float(rate)
+        self.min_rate = min(self.min_rate, self.rate)
+        if now is not None: self.__reschedule()
+
+    @staticmethod
+    def __now() -> Optional[float]:
+        try:
+            return get_running_loop().time()
+        except RuntimeError:
+            return None
+
+    def __reschedule(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__schedule()
+
+    def __prune(self) -> None:
+        while self.__waiters and self.__waiters[0][2].done():
+            heappop(self.__waiters)
+
+    def __schedule(self) -> None:
+        self.__prune()
+        if not self.__waiters or self.__timer is not None: return
+        loop = get_running_loop()
+        now = loop.time()
+        self.refill(now)
+        delay = max(self.paused_until - now, (1 - self.tokens) / self.rate, 0)
+        self.__timer = loop.call_later(delay, self.__release)
+
+    def __release(self) -> None:
+        self.__timer = None
+        now = get_running_loop().time()
+        self.refill(now)
+        while self.__waiters and now >= self.paused_until:
+            finish, _, future = self.__waiters[0]
+            if future.done():
+                heappop(self.__waiters)
+                continue
+            if self.tokens < 1: break
+            self.tokens -= 1
+            heappop(self.__waiters)
+            self.virtual_time = finish
+            future.set_result(None)
+        self.__schedule()
@@ -1,18 +1,51 @@
-from typing import Dict, Optional, Union, List, Generic, TypeVar
-from aiohttp import ClientSession, ClientResponse
+from typing import TYPE_CHECKING, Dict, Hashable, Optional, Union, List, Generic, Tuple, TypeVar
 from asyncio import Future
+import json
 
 from .response import Response
+from .json_decoder import JSONDecoder, stdlib_loads
+from .priority import Priority
+from .deadline import remaining
 
-async def parse_response(resp: ClientResponse) -> Union[str, Dict, List]:
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, ClientResponse
+    from .host_pool import HostPool
+
+#: Methods which are safe to coalesce and repeat.
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+#: The header authorized requests send their API key in.
+AUTH_HEADER = 'Ocp-Apim-Subscription-Key'
+
+def request_key(method: str, url: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None) -> Tuple[str, ...]:
+    """
+    Builds a canonical key for a request, which is the
+    same for any two requests that fetch the same data.
+
+    @param method: The method used to sent the request.
+    @param url: The url of the request.
+    @param params: The url params used in the request.
+    @param body: The body of the request.
+    @param headers: The headers of the request.
+    @return: A hashable key.
     """
-    Parses client response data. 
+    def dump(value) -> str:
+        if value is None: return ''
+        return json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+    return (method.upper(), url, dump(params), dump(body), dump(headers))
+
+async def parse_response(resp: 'ClientResponse', loads: JSONDecoder = stdlib_loads) -> Union[str, Dict, List]:
+    """
+    Parses client response data. JSON bodies are read as raw
+    bytes once, and decoded with the given decoder.
 
     @param resp: A client response from a request.
+    @param loads: The function used to decode JSON bodies.
     @return: Json data parsed in to a dictionary or list. Returns as string by default.
     """
     if resp.content_type == 'application/json':
-        return await resp.json()
+        body = await resp.read()
+        if not body: return None
+        return loads(body)
     return await resp.text()
 
 RT = TypeVar('RT')
@@ -22,27 +55,101 @@ class Request(Generic[RT]):
     This class encapsulates a request to be executed inside of a
     thread pool.
     """
-    client: ClientSession
+    #: The pool the request is sent through.
+    pool: 'HostPool'
     url: str
     method: str
+    #: The number of times the request has been retried.
     attempts: int
     params: Optional[Dict]
     body: Optional[Dict]
     headers: Optional[Dict]
+    #: True if sending the request more than once has no side effects.
+    idempotent: bool
+    #: True if the response cache should be bypassed and refreshed.
+    force: bool
+    #: The function used to decode JSON bodies.
+    loads: JSONDecoder
+    #: True if the request has to be sent with an API key.
+    use_auth: bool
+    #: The API key the current attempt is sent with. It's picked when the attempt is made.
+    api_key: Optional[str]
+    #: The priority class the request is scheduled in.
+    priority: Priority
+    #: The monotonic time the request has to complete by, or None.
+    deadline: Optional[float]
+    #: The tenant the request is made on behalf of, or None.
+    tenant: Optional[Hashable]
     result: Optional[Response]
     __future: Optional[Future]
 
-    def __init__(self, client: ClientSession, method: str, url: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None) -> None:
+    def __init__(self, pool: 'HostPool', method: str, url: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None, idempotent: Optional[bool] = None, force: bool = False, loads: JSONDecoder = stdlib_loads, use_auth: bool = False, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None, tenant: Optional[Hashable] = None) -> None:
         super().__init__()
-        self.client = client
+        self.pool = pool
         self.method = method
         self.url = url
         self.params = params
         self.body = body
         self.headers = headers
-        self.response = None
+        self.idempotent = method.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent
+        self.force = force
+        self.loads = loads
+        self.use_auth = use_auth
+        self.api_key = None
+        self.priority = priority
+        self.deadline = deadline
+        self.tenant = tenant
+        self.attempts = 0
+        self.result = None
         self.__future = None
 
+    @property
+    def client(self) -> 'ClientSession':
+        """
+        The client session of the request's pool. It's only
+        looked up once the request is sent, so requests served
+        from the cache never open a session.
+        """
+        return self.pool.session
+
+    @property
+    def send_headers(self) -> Optional[Dict]:
+        """
+        The headers sent with the current attempt, which
+        include the API key it's authorized with. They're
+        kept out of the request key, so requests sent with
+        different keys still share cached responses.
+        """
+        if self.api_key is None: return self.headers
+        return {**(self.headers or {}), AUTH_HEADER: self.api_key}
+
+    @property
+    def time_left(self) -> Optional[float]:
+        """
+        The number of seconds left until the deadline,
+        or None if the request has no deadline.
+        """
+        return remaining(self.deadline)
+
+    def timeout_options(self) -> Dict:
+        """
+        Builds the timeout passed to the client session, so
+        an attempt is cut off once the deadline passes.
+
+        @return: The keyword arguments to pass along with the request.
+        """
+        time_left = self.time_left
+        if time_left is None: return {}
+        from aiohttp import ClientTimeout
+        return {'timeout': ClientTimeout(total=max(time_left, 0.001))}
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        """
+        A canonical key identifying the data this request fetches.
+        """
+        return request_key(self.method, self.url, self.params, self.body, self.headers)
+
     def send(self) -> Response:
         """
         This function is to be executed within a thread. It makes a
@@ -50,27 +157,30 @@ class Request(Generic[RT]):
 
         @return: A response object containing the fetched data.
         """
-        self.attempts = 0
         self.__future = self.make_request()
 
     async def make_request(self) -> Response:
         """
-        This functions attempts to make a request. If an error is 
-        encountered the request will be attempted again up to three
-        times. Successful attempts will return the requested data as
-        a response object.
+        This functions makes a single attempt at the request. 
+        Retries are left to the http client, so they pass 
+        through the rate limiter again.
 
         @return: A response object containing the fetched data.
         """
-        try:
-            async with self.client.request(self.method, self.url, data = self.body, params = self.params, headers = self.headers) as response:
-                data = await parse_response(response)
-                return Response(self.url, response.status, response.ok, response.headers, data)
-        except Exception as e:
-            self.attempts += 1
-            if self.attempts <= 3: return await self.make_request()
-            raise e
+        async with self.client.request(self.method, self.url, data = self.body, params = self.params, headers = self.send_headers, **self.timeout_options()) as response:
+            data = await parse_response(response, self.loads)
+            return Response(self.url, response.status, response.ok, response.headers, data)
         
+    async def open(self) -> 'ClientResponse':
+        """
+        Makes a single attempt at the request, without reading
+        the response body. The caller is responsible for
+        releasing the response.
+
+        @return: The open client response.
+        """
+        return await self.client.request(self.method, self.url, data = self.body, params = self.params, headers = self.send_headers, **self.timeout_options())
+
     async def get_result(self):
         """
         It returns the result of the execution. Blocks if 
@@ -0,0 +1,107 @@
+from typing import TYPE_CHECKING, FrozenSet, Optional
+from asyncio import get_running_loop
+import random
+
+from .rate_limiter import parse_retry_after
+
+if TYPE_CHECKING:
+    from .response import Response
+
+#: Statuses which are worth retrying by default.
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be retried,
+    and how long to wait before doing so. Delays grow
+    exponentially with full jitter, and never undercut
+    a retry-after header returned by the server.
+    """
+    #: The max number of times a request is retried.
+    max_retries: int
+    #: The delay of the first retry in seconds, before jitter is applied.
+    base_delay: float
+    #: The upper bound of the delay in seconds.
+    max_delay: float
+    #: The response statuses that are retried.
+    retry_statuses: FrozenSet[int]
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 30, retry_statuses: FrozenSet[int] = RETRY_STATUSES) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(self, resp: 'Response') -> bool:
+        """
+        Checks if the response has a status that can be retried.
+        A 403 is only retried when it comes with a retry-after header.
+
+        @param resp: The response of the failed request.
+        @return: True if the request can be retried.
+        """
+        if resp.status in self.retry_statuses: return True
+        return resp.status == 403 and resp.headers.get("retry-after") is not None
+
+    def get_delay(self, attempt: int, resp: Optional['Response'] = None) -> float:
+        """
+        Calculates the number of seconds to wait before the next attempt.
+
+        @param attempt: The number of retries made so far.
+        @param resp: The response of the failed request, if one was received.
+        @return: The delay in seconds.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if resp is not None:
+            retry_after = parse_retry_after(resp.headers.get("retry-after"))
+            if retry_after is not None: delay = max(delay, retry_after)
+        return delay
+
+
+class RetryBudget:
+    """
+    Limits the number of retries across the whole client,
+    so retries can't multiply the load during an outage.
+    Every request deposits a fraction of a retry, and every
+    retry withdraws a whole one.
+    """
+    #: The number of retries earned by each request.
+    ratio: float
+    #: The number of retries allowed per second regardless of traffic.
+    min_per_second: float
+    #: The max number of retries that can be saved up.
+    capacity: float
+    #: The number of retries currently available.
+    balance: float
+    last_refill: Optional[float]
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1, capacity: float = 10) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.balance = capacity
+        self.last_refill = None
+
+    def __refill(self) -> None:
+        now = get_running_loop().time()
+        if self.last_refill is not None:
+            self.balance = min(self.capacity, self.balance + (now - self.last_refill) * self.min_per_second)
+        self.last_refill = now
+
+    def deposit(self) -> None:
+        """
+        Records a new request.
+        """
+        self.__refill()
+        self.balance = min(self.capacity, self.balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes a retry from the budget, if one is available.
+
+        @return: True if the retry is allowed.
+        """
+        self.__refill()
+        if self.balance < 1: return False
+        self.balance -= 1
+        return True
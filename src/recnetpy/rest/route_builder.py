@@ -1,6 +1,9 @@
-from typing import TYPE_CHECKING, List, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Dict, Optional
 
 from .request import Request
+from .priority import Priority, current_priority
+from .deadline import get_deadline
+from .tenant import current_tenant
 
 if TYPE_CHECKING:
     from .http_client import HTTPClient
@@ -22,23 +25,60 @@ class RouteBuilder:
         self.client = client
         self.use_auth = use_auth
 
-    async def make_request(self, method: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None) -> 'Response':
+    def build_request(self, method: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None, idempotent: Optional[bool] = None, force: bool = False, priority: Optional[Priority] = None, timeout: Optional[float] = None) -> Request:
         """
         Joins the route components into a url, and constructs
-        a request object that is processed by the http client.
+        a request object to be processed by the http client.
 
         @param method: The method used to sent the request.
         @param params: The url params used in the request.
         @param body: The body of the request.
-        @return: The response from the request.
+        @param headers: The headers of the request.
+        @param idempotent: Marks the request as safe to coalesce, defaults to true for get requests.
+        @param force: If true, the response cache is bypassed and refreshed.
+        @param priority: The priority class of the request, defaults to the priority of the current context.
+        @param timeout: The number of seconds the request may take, it can only shorten the deadline of the current context.
+        @return: The request object.
         """
-        if self.use_auth:
-            if headers is None: headers = {}
-            headers['Ocp-Apim-Subscription-Key'] = self.client.api_key
         url = self.base + "/".join(self.route)
-        request = Request(self.client.session, method, url, params, body, headers)
+        if priority is None: priority = current_priority.get()
+        return Request(self.client.get_pool(url), method, url, params, body, headers, idempotent, force, self.client.json_loads, self.use_auth, priority, get_deadline(timeout), current_tenant.get())
+
+    async def make_request(self, method: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None, idempotent: Optional[bool] = None, force: bool = False, priority: Optional[Priority] = None, timeout: Optional[float] = None) -> 'Response':
+        """
+        Constructs a request object for the route, and
+        has it processed by the http client.
+
+        @param method: The method used to sent the request.
+        @param params: The url params used in the request.
+        @param body: The body of the request.
+        @param headers: The headers of the request.
+        @param idempotent: Marks the request as safe to coalesce, defaults to true for get requests.
+        @param force: If true, the response cache is bypassed and refreshed.
+        @param priority: The priority class of the request, defaults to the priority of the current context.
+        @param timeout: The number of seconds the request may take, it can only shorten the deadline of the current context.
+        @return: The response from the request.
+        """
+        request = self.build_request(method, params, body, headers, idempotent, force, priority, timeout)
         return await self.client.push(request)
 
+    def stream(self, method: str, params: Optional[Dict] = None, body: Optional[Dict] = None, headers: Optional[Dict] = None, priority: Optional[Priority] = None, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        Sends a request to a route that responds with a JSON
+        array, and streams the elements of the array as
+        they're parsed, instead of buffering the whole body.
+
+        @param method: The method used to sent the request.
+        @param params: The url params used in the request.
+        @param body: The body of the request.
+        @param headers: The headers of the request.
+        @param priority: The priority class of the request, defaults to the priority of the current context.
+        @param timeout: The number of seconds the request may take, it can only shorten the deadline of the current context.
+        @return: An async iterator of the decoded elements.
+        """
+        request = self.build_request(method, params, body, headers, priority=priority, timeout=timeout)
+        return self.client.stream(request)
+
     def __getattr__(self, name: str):
         """
         Appends the requested attribute to the route 
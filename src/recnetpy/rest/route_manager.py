@@ -1,5 +1,14 @@
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
 from .route_builder import RouteBuilder
 from .http_client import HTTPClient
+from .host_pool import HostPool, HostStats
+from .api_key_pool import APIKeyPool
+from .cache import BaseCache, CachePolicy
+from .token_store import BaseTokenStore
+from .tenant import TenantStats
+from .json_decoder import JSONDecoder
 
 class RouteManager:
     """
@@ -9,8 +18,13 @@ class RouteManager:
     """
     client: HTTPClient
 
-    def __init__(self, api_key: str):
-        self.client = HTTPClient(api_key)
+    def __init__(self, api_key: Union[str, Sequence[str], APIKeyPool, None], cache: Optional[BaseCache] = None, cache_policy: Optional[CachePolicy] = None, json_loads: Union[str, JSONDecoder, None] = None, token_store: Optional[BaseTokenStore] = None, tenant_quota: Optional[float] = None):
+        self.client = HTTPClient(api_key, cache = cache, cache_policy = cache_policy, json_loads = json_loads, token_store = token_store, tenant_quota = tenant_quota)
+        key_pool = self.client.key_pool
+        if key_pool is not None:
+            # Each key has its own limits, so the authorized hosts can take the combined rate
+            for builder in (self.apim, self.api):
+                self.configure_host(urlsplit(builder.base).netloc, rate_limit=key_pool.rate_limit * len(key_pool))
 
     @property
     def apim(self) -> RouteBuilder:
@@ -82,6 +96,62 @@ class RouteManager:
         """
         return RouteBuilder(self.client, "https://ns.rec.net/")
 
+    @property
+    def stats(self) -> Dict[str, HostStats]:
+        """
+        The traffic stats of each host, or group of hosts.
+
+        @return: A dictionary of stats keyed by pool name.
+        """
+        return self.client.stats
+
+    @property
+    def tenant_stats(self) -> Dict[Hashable, TenantStats]:
+        """
+        The requests made by each tenant. Requests made
+        without a tenant are listed under None. Only the
+        most recently active tenants are kept.
+
+        @return: A dictionary of stats keyed by tenant.
+        """
+        return self.client.tenants.stats
+
+    def set_tenant_quota(self, tenant: Hashable, rate: Optional[float]) -> None:
+        """
+        Caps the number of requests per second a tenant can
+        make, overriding the default quota.
+
+        @param tenant: The id of the tenant.
+        @param rate: The number of requests per second allowed, or None for no limit.
+        """
+        self.client.tenants.set_quota(tenant, rate)
+
+    def configure_host(self, name: str, hosts: Optional[Iterable[str]] = None, rate_limit: Optional[float] = None, connection_limit: Optional[int] = None) -> HostPool:
+        """
+        Configures the limits of a host, or groups multiple
+        hosts which share the same limits together.
+
+        @param name: The name of the host, or group of hosts.
+        @param hosts: The hosts which share the limits, defaults to the name.
+        @param rate_limit: The number of requests per second allowed.
+        @param connection_limit: The max number of simultaneous connections.
+        @return: The configured host pool.
+        """
+        return self.client.configure_pool(name, hosts, rate_limit, connection_limit)
+
+    async def warm_up(self, connections: int = 1, timeout: float = 10) -> Dict[str, bool]:
+        """
+        Resolves and connects to every host the route
+        builders send requests to, so the first requests
+        don't pay for DNS resolution and TLS handshakes.
+
+        @param connections: The number of connections to open to each host.
+        @param timeout: The number of seconds to wait for each connection.
+        @return: A dictionary of hosts, and whether connecting to them succeeded.
+        """
+        builders = (self.apim, self.api, self.rooms, self.accounts, self.clubs, self.cdn, self.namespace)
+        return await self.client.warm_up([builder.base for builder in builders], connections, timeout)
+
     def custom(self, host: str) -> RouteBuilder:
         """
         Creates a route builer with a base url
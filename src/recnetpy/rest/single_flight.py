@@ -0,0 +1,93 @@
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+from asyncio import Task, CancelledError, TimeoutError, ensure_future, shield, wait_for
+
+from .deadline import remaining
+from .exceptions.deadline_exceeded import DeadlineExceeded
+
+RT = TypeVar('RT')
+
+class Flight:
+    """
+    A call that's in flight, the deadline it runs
+    under, and the number of callers waiting on it.
+    """
+    task: Task
+    #: The monotonic time the call has to complete by, or None.
+    deadline: Optional[float]
+    waiters: int
+
+    def __init__(self, task: Task, deadline: Optional[float] = None) -> None:
+        self.task = task
+        self.deadline = deadline
+        self.waiters = 0
+
+    def covers(self, deadline: Optional[float]) -> bool:
+        """
+        Checks if a caller can wait on the call, which is
+        when the call won't give up before the caller does.
+
+        @param deadline: The deadline of the caller, or None.
+        @return: True if the call runs at least as long as the caller waits.
+        """
+        if self.deadline is None: return True
+        return deadline is not None and deadline <= self.deadline
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls that are in flight at the
+    same time. The first caller starts the call, and every
+    caller with the same key receives its result. A caller
+    only joins a call whose deadline is no earlier than its
+    own, and stops waiting at its own deadline.
+    """
+    __flights: Dict[Hashable, Flight]
+
+    def __init__(self) -> None:
+        self.__flights = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of distinct calls currently in flight.
+        """
+        return len(self.__flights)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[RT]], deadline: Optional[float] = None) -> RT:
+        """
+        Runs the function, unless a call with the same key is
+        already in flight and runs at least until the deadline,
+        in which case its result is awaited instead. A call
+        with an earlier deadline is left to its own callers,
+        and later callers join the new one. The shared call is
+        only cancelled once every caller waiting on it has
+        been cancelled, or has given up.
+
+        @param key: A hashable key identifying the call.
+        @param func: A function returning the awaitable to run.
+        @param deadline: The monotonic time the caller stops waiting at, or None.
+        @return: The result of the shared call.
+        @raise DeadlineExceeded: If the deadline passes before the shared call completes.
+        """
+        flight = self.__flights.get(key)
+        if flight is None or not flight.covers(deadline):
+            flight = Flight(ensure_future(func()), deadline)
+            self.__flights[key] = flight
+            flight.task.add_done_callback(lambda _, flight=flight: self.__forget(key, flight))
+        flight.waiters += 1
+        try:
+            if deadline is None or deadline == flight.deadline:
+                return await shield(flight.task)
+            return await wait_for(shield(flight.task), max(remaining(deadline), 0))
+        except TimeoutError:
+            if flight.waiters == 1: flight.task.cancel()
+            raise DeadlineExceeded("The deadline passed while waiting on an identical request.")
+        except CancelledError:
+            if flight.waiters == 1: flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def __forget(self, key: Hashable, flight: Flight) -> None:
+        if self.__flights.get(key) is flight:
+            del self.__flights[key]
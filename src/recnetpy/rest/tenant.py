@@ -0,0 +1,159 @@
+from typing import Dict, Hashable, Iterator, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .rate_limiter import RateLimiter
+from .priority import Priority
+
+#: The default max number of tenants whose stats and limiters are kept.
+MAX_TENANTS = 10000
+
+#: The tenant requests made in the current context are made on behalf of.
+current_tenant: ContextVar[Optional[Hashable]] = ContextVar("recnetpy_tenant", default=None)
+
+@contextmanager
+def use_tenant(tenant: Optional[Hashable]) -> Iterator[None]:
+    """
+    Tags every request made within the block, including
+    requests made by tasks created within it, with a tenant,
+    such as the id of the guild a command came from.
+
+    @param tenant: A hashable id of the tenant.
+    """
+    token = current_tenant.set(tenant)
+    try:
+        yield
+    finally:
+        current_tenant.reset(token)
+
+
+class TenantStats:
+    """
+    A small data class that keeps track of the
+    requests a tenant made.
+    """
+    #: The number of requests sent.
+    requests: int
+    #: The number of requests currently waiting for their quota, or a rate limiter.
+    waiting: int
+    #: The number of requests dropped because their deadline couldn't be met.
+    shed: int
+    #: The total number of seconds requests spent waiting before being sent.
+    total_wait: float
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.waiting = 0
+        self.shed = 0
+        self.total_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """
+        The average number of seconds a request waited before being sent.
+        """
+        if not self.requests: return 0.0
+        return self.total_wait / self.requests
+
+
+class TenantScheduler:
+    """
+    Keeps track of the quotas and stats of each tenant. Rate
+    limiters share tokens fairly between the tenants waiting
+    on them, while a quota caps the rate of a single tenant,
+    even when nobody else is making requests. Once more than
+    ``max_tenants`` tenants are tracked, the stats and limiters
+    of the least recently active idle tenants are dropped.
+    """
+    #: The number of requests per second each tenant is allowed, or None for no limit.
+    default_quota: Optional[float]
+    #: The quotas of tenants which differ from the default.
+    quotas: Dict[Hashable, Optional[float]]
+    #: The max number of tenants whose stats and limiters are kept.
+    max_tenants: int
+    #: The requests made by each tenant, from the least to the most recently active.
+    stats: 'OrderedDict[Hashable, TenantStats]'
+    __limiters: Dict[Hashable, RateLimiter]
+
+    def __init__(self, default_quota: Optional[float] = None, max_tenants: int = MAX_TENANTS) -> None:
+        self.default_quota = default_quota
+        self.max_tenants = max_tenants
+        self.quotas = {}
+        self.stats = OrderedDict()
+        self.__limiters = {}
+
+    def get_quota(self, tenant: Hashable) -> Optional[float]:
+        """
+        Returns the quota of a tenant.
+
+        @param tenant: The id of the tenant.
+        @return: The number of requests per second allowed, or None for no limit.
+        """
+        return self.quotas.get(tenant, self.default_quota)
+
+    def set_quota(self, tenant: Hashable, rate: Optional[float]) -> None:
+        """
+        Sets the quota of a tenant.
+
+        @param tenant: The id of the tenant.
+        @param rate: The number of requests per second allowed, or None for no limit.
+        """
+        self.quotas[tenant] = rate
+        limiter = self.__limiters.get(tenant)
+        if limiter is None: return
+        if rate is None: del self.__limiters[tenant]
+        else: limiter.set_rate(rate)
+
+    def get_stats(self, tenant: Hashable) -> TenantStats:
+        """
+        Returns the stats of a tenant, and starts tracking it
+        if it hasn't made any requests yet. The tenant is marked
+        as the most recently active one.
+
+        @param tenant: The id of the tenant.
+        @return: The stats of the tenant.
+        """
+        stats = self.stats.get(tenant)
+        if stats is None:
+            stats = self.stats[tenant] = TenantStats()
+            if len(self.stats) > self.max_tenants: self.__evict(tenant)
+        else:
+            self.stats.move_to_end(tenant)
+        return stats
+
+    async def acquire(self, tenant: Hashable, priority: Priority = Priority.NORMAL, deadline: Optional[float] = None) -> None:
+        """
+        Waits until the quota of a tenant allows another request.
+        Tenants without a quota don't wait.
+
+        @param tenant: The id of the tenant.
+        @param priority: The priority class of the request.
+        @param deadline: The monotonic time the request has to be sent by, or None.
+        """
+        rate = self.get_quota(tenant)
+        if rate is None: return
+        # Keeps the tenant tracked, so its limiter is dropped along with its stats
+        self.get_stats(tenant)
+        limiter = self.__limiters.get(tenant)
+        if limiter is None: limiter = self.__limiters[tenant] = RateLimiter(rate)
+        await limiter.acquire(priority, deadline)
+
+    def forget(self, tenant: Hashable) -> None:
+        """
+        Drops the stats and limiter of a tenant, such as a
+        guild the bot was removed from. Its quota is kept.
+
+        @param tenant: The id of the tenant.
+        """
+        self.stats.pop(tenant, None)
+        self.__limiters.pop(tenant, None)
+
+    def __evict(self, newest: Hashable) -> None:
+        excess = len(self.stats) - self.max_tenants
+        evicted = []
+        # The newest tenant, and tenants with requests waiting, are kept, since they're in use
+        for tenant, stats in self.stats.items():
+            if len(evicted) >= excess or tenant == newest: break
+            if not stats.waiting: evicted.append(tenant)
+        for tenant in evicted: self.forget(tenant)
@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+from ...misc import lazy_import
+
+if TYPE_CHECKING:
+    from .base_token_store import BaseTokenStore
+    from .file_token_store import FileTokenStore
+    from .redis_token_store import RedisTokenStore
+
+__getattr__, __dir__, __all__ = lazy_import(__name__, {
+    ".base_token_store": ["BaseTokenStore"],
+    ".file_token_store": ["FileTokenStore"],
+    ".redis_token_store": ["RedisTokenStore"],
+})
\ No newline at end of file
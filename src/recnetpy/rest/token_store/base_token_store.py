@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+from asyncio import sleep
+
+from ..deadline import remaining
+from ..exceptions import DeadlineExceeded
+
+#: The state of a token bucket, which holds its tokens, and the last refill and pause times.
+Bucket = Dict[str, float]
+
+def take_token(bucket: Bucket, rate: float, capacity: float, now: float) -> Tuple[Bucket, float]:
+    """
+    Refills a shared token bucket, and takes a token from
+    it if one is available. Buckets which don't exist yet
+    start full.
+
+    @param bucket: The state of the bucket, which may be empty.
+    @param rate: The number of tokens added per second.
+    @param capacity: The max number of tokens the bucket can hold.
+    @param now: The current unix time.
+    @return: The new state of the bucket, and the number of seconds to wait before trying again, 0 if a token was taken.
+    """
+    tokens = bucket.get("tokens", capacity)
+    last = bucket.get("last", now)
+    paused_until = bucket.get("paused_until", 0.0)
+    elapsed = now - max(last, paused_until)
+    if elapsed > 0: tokens = min(capacity, tokens + elapsed * rate)
+    wait = 0.0
+    if now < paused_until: wait = paused_until - now
+    elif tokens >= 1: tokens -= 1
+    else: wait = (1 - tokens) / rate
+    return {"tokens": tokens, "last": max(last, now), "paused_until": paused_until}, wait
+
+
+class BaseTokenStore(ABC):
+    """
+    The base class used by all token stores. A token store
+    holds rate limiter buckets outside of the process, so
+    several processes sending requests with the same key
+    share one rate limit. This class is only to be
+    inherited, and shouldn't be created manually.
+    """
+
+    @abstractmethod
+    async def take(self, name: str, rate: float, capacity: float) -> float:
+        """
+        Takes a token from a shared bucket if one is available.
+
+        @param name: The name of the bucket.
+        @param rate: The number of tokens added per second.
+        @param capacity: The max number of tokens the bucket can hold.
+        @return: The number of seconds to wait before trying again, 0 if a token was taken.
+        """
+        pass
+
+    @abstractmethod
+    async def pause(self, name: str, delay: float) -> None:
+        """
+        Stops a shared bucket from handing out tokens for
+        a period of time, in every process that uses it.
+
+        @param name: The name of the bucket.
+        @param delay: The number of seconds to pause for.
+        """
+        pass
+
+    async def acquire(self, name: str, rate: float, capacity: float, deadline: Optional[float] = None) -> None:
+        """
+        Waits until a token is available in a shared bucket,
+        and takes it.
+
+        @param name: The name of the bucket.
+        @param rate: The number of tokens added per second.
+        @param capacity: The max number of tokens the bucket can hold.
+        @param deadline: The monotonic time the token has to be taken by, or None.
+        @raise DeadlineExceeded: If no token is available before the deadline.
+        """
+        while True:
+            wait = await self.take(name, rate, capacity)
+            if wait <= 0: return
+            time_left = remaining(deadline)
+            if time_left is not None and wait >= time_left:
+                raise DeadlineExceeded("The shared rate limit has no token before the deadline of the request.")
+            await sleep(wait)
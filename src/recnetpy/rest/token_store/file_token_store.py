@@ -0,0 +1,95 @@
+from typing import Callable, Dict, TypeVar
+from asyncio import to_thread
+from threading import Lock
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+from .base_token_store import BaseTokenStore, Bucket, take_token
+
+RT = TypeVar('RT')
+
+class FileTokenStore(BaseTokenStore):
+    """
+    A token store kept in a file, which every process on the
+    host shares. Each update locks the file, so processes
+    take turns. Placing the file on a memory backed file
+    system, such as ``/dev/shm``, keeps it off the disk.
+    """
+    #: The path to the file holding the buckets.
+    path: str
+    __lock: Lock
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__lock = Lock()
+
+    async def __update(self, func: Callable[[Dict[str, Bucket], float], RT]) -> RT:
+        def locked() -> RT:
+            with self.__lock, open(self.path, "a+b") as file:
+                lock_file(file.fileno())
+                try:
+                    file.seek(0)
+                    raw = file.read()
+                    buckets = json.loads(raw) if raw else {}
+                    result = func(buckets, time.time())
+                    file.seek(0)
+                    file.truncate()
+                    file.write(json.dumps(buckets).encode())
+                    file.flush()
+                    return result
+                finally:
+                    unlock_file(file.fileno())
+        return await to_thread(locked)
+
+    async def take(self, name: str, rate: float, capacity: float) -> float:
+        def take(buckets: Dict[str, Bucket], now: float) -> float:
+            buckets[name], wait = take_token(buckets.get(name, {}), rate, capacity, now)
+            return wait
+        return await self.__update(take)
+
+    async def pause(self, name: str, delay: float) -> None:
+        def pause(buckets: Dict[str, Bucket], now: float) -> None:
+            bucket = buckets.setdefault(name, {})
+            bucket["paused_until"] = max(bucket.get("paused_until", 0.0), now + max(0.0, delay))
+            bucket["tokens"] = min(bucket.get("tokens", 0.0), 0.0)
+        await self.__update(pause)
+
+    def clear(self) -> None:
+        """
+        Removes every bucket, by deleting the file.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def lock_file(fd: int) -> None:
+    """
+    Takes an exclusive lock on an open file, and
+    waits until it's released by other processes.
+
+    @param fd: The file descriptor of the file.
+    """
+    if fcntl is not None: fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+def unlock_file(fd: int) -> None:
+    """
+    Releases the lock on a file.
+
+    @param fd: The file descriptor of the file.
+    """
+    if fcntl is not None: fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,64 @@
+from typing import Any
+import time
+
+from .base_token_store import BaseTokenStore
+
+#: Refills a bucket and takes a token, atomically. It mirrors ``take_token``.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last', 'paused_until')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+local elapsed = now - math.max(last, paused_until)
+if elapsed > 0 then tokens = math.min(capacity, tokens + elapsed * rate) end
+local wait = 0
+if now < paused_until then wait = paused_until - now
+elseif tokens >= 1 then tokens = tokens - 1
+else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last', math.max(last, now), 'paused_until', paused_until)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(wait)
+"""
+
+#: Pauses a bucket, and empties it.
+PAUSE_SCRIPT = """
+local until_time = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'paused_until')
+local tokens = math.min(tonumber(state[1]) or 0, 0)
+local paused_until = math.max(tonumber(state[2]) or 0, until_time)
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'paused_until', paused_until)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+class RedisTokenStore(BaseTokenStore):
+    """
+    A token store kept in Redis, which lets processes on
+    several hosts share rate limits. Buckets are updated
+    by Lua scripts, so each update is atomic. Any client
+    with an async ``eval(script, numkeys, *keys_and_args)``
+    method can be used, such as ``redis.asyncio.Redis``,
+    or a stand-in which implements the same method.
+    """
+    #: The Redis client used to run the scripts.
+    client: Any
+    #: Prepended to bucket names, to keep them apart from other keys.
+    prefix: str
+    #: The number of seconds an unused bucket is kept for.
+    ttl: int
+
+    def __init__(self, client: Any, prefix: str = "recnetpy:ratelimit:", ttl: int = 3600) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    async def take(self, name: str, rate: float, capacity: float) -> float:
+        wait = await self.client.eval(TAKE_SCRIPT, 1, self.prefix + name, rate, capacity, time.time(), self.ttl)
+        if isinstance(wait, bytes): wait = wait.decode()
+        return float(wait)
+
+    async def pause(self, name: str, delay: float) -> None:
+        await self.client.eval(PAUSE_SCRIPT, 1, self.prefix + name, time.time() + max(0.0, delay), self.ttl)
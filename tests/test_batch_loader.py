@@ -0,0 +1,64 @@
+import asyncio
+
+from recnetpy.managers.batch_loader import BatchLoader
+from recnetpy.rest.exceptions import BulkFetchError, DeadlineExceeded
+from recnetpy.rest.deadline import current_deadline, use_timeout
+
+class Object:
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+def test_partial_bulk_failure_resolves_the_ids_that_succeeded():
+    async def load_many(ids):
+        error = RuntimeError("chunk failed")
+        raise BulkFetchError([Object(1)], [2], [error])
+
+    async def main():
+        loader = BatchLoader(load_many)
+        return await asyncio.gather(loader.load(1), loader.load(2), loader.load(3), return_exceptions=True)
+
+    found, failed, missing = asyncio.run(main())
+    assert found.id == 1
+    assert isinstance(failed, BulkFetchError)
+    assert missing is None
+
+def test_other_errors_fail_every_id():
+    async def load_many(ids):
+        raise RuntimeError("request failed")
+
+    async def main():
+        loader = BatchLoader(load_many)
+        return await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(main()))
+
+def test_batch_runs_under_the_latest_deadline_of_its_callers():
+    seen = []
+
+    async def load_many(ids):
+        seen.append(current_deadline.get())
+        await asyncio.sleep(0.1)
+        return [Object(id) for id in ids]
+
+    async def main():
+        loader = BatchLoader(load_many)
+        async def short():
+            with use_timeout(0.05):
+                return await loader.load(1)
+        return await asyncio.gather(short(), loader.load(2), return_exceptions=True)
+
+    short, unbounded = asyncio.run(main())
+    assert seen == [None]
+    assert isinstance(short, DeadlineExceeded)
+    assert unbounded.id == 2
+
+def test_deadline_exceeded_reaches_callers_unchanged():
+    async def load_many(ids):
+        raise DeadlineExceeded()
+
+    async def main():
+        loader = BatchLoader(load_many)
+        with use_timeout(1):
+            return await asyncio.gather(loader.load(1), return_exceptions=True)
+
+    assert type(asyncio.run(main())[0]) is DeadlineExceeded
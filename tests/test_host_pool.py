@@ -0,0 +1,46 @@
+import asyncio
+
+from aiohttp import web
+
+from recnetpy.rest.host_pool import HostPool
+
+async def handler(request):
+    return web.Response()
+
+async def start_server():
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+def test_warm_up_takes_tokens_from_the_rate_limiter():
+    async def main():
+        runner, url = await start_server()
+        pool = HostPool("local", rate_limit=2)
+        try:
+            connected = await pool.warm_up(url, connections=2)
+            return connected, pool.limiter.try_acquire()
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    connected, token_left = asyncio.run(main())
+    assert connected
+    assert not token_left
+
+def test_warm_up_gives_up_when_no_token_comes_in_time():
+    async def main():
+        runner, url = await start_server()
+        pool = HostPool("local", rate_limit=30)
+        pool.limiter.pause(5)
+        try:
+            return await pool.warm_up(url, timeout=0.1)
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    assert asyncio.run(main()) is False
@@ -0,0 +1,77 @@
+import asyncio
+
+from recnetpy.rest.http_client import HTTPClient
+from recnetpy.rest.request import Request
+from recnetpy.rest.response import Response
+from recnetpy.rest.priority import Priority
+from recnetpy.rest.cache import MemoryCache
+
+URL = "https://rooms.rec.net/rooms/1"
+
+def make_client(sent):
+    client = HTTPClient(None)
+
+    async def execute(request):
+        sent.append(request)
+        await asyncio.sleep(0.05)
+        return Response(request.url, 200, True, {}, {"RoomId": 1})
+
+    client.execute = execute
+    return client
+
+def make_request(client, **kwargs):
+    return Request(client.get_pool(URL), "get", URL, **kwargs)
+
+def test_identical_requests_share_a_flight():
+    sent = []
+
+    async def main():
+        client = make_client(sent)
+        await asyncio.gather(*(client.push(make_request(client)) for _ in range(3)))
+
+    asyncio.run(main())
+    assert len(sent) == 1
+
+def test_requests_of_other_priorities_and_tenants_dont_share_a_flight():
+    sent = []
+
+    async def main():
+        client = make_client(sent)
+        await asyncio.gather(
+            client.push(make_request(client, priority=Priority.BACKGROUND)),
+            client.push(make_request(client, priority=Priority.INTERACTIVE)),
+            client.push(make_request(client, priority=Priority.INTERACTIVE, tenant="guild")),
+        )
+
+    asyncio.run(main())
+    assert sorted((request.priority, str(request.tenant)) for request in sent) == [
+        (Priority.INTERACTIVE, "None"), (Priority.INTERACTIVE, "guild"), (Priority.BACKGROUND, "None")
+    ]
+
+class CountingCache(MemoryCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sets = 0
+        self.closed = False
+
+    async def set(self, key, resp, ttl) -> None:
+        self.sets += 1
+        await super().set(key, resp, ttl)
+
+    def close(self) -> None:
+        self.closed = True
+
+def test_coalesced_response_is_cached_once():
+    sent = []
+    cache = CountingCache()
+
+    async def main():
+        client = make_client(sent)
+        client.cache = cache
+        await asyncio.gather(*(client.push(make_request(client)) for _ in range(5)))
+        await client.stop()
+
+    asyncio.run(main())
+    assert len(sent) == 1
+    assert cache.sets == 1
+    assert cache.closed
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import random
+from json import JSONDecodeError
+
+import pytest
+
+from recnetpy.rest.json_stream import iter_json_array
+
+async def chunked(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+def parse(body: bytes, size: int = 1) -> list:
+    async def main():
+        return [element async for element in iter_json_array(chunked(body, size))]
+    return asyncio.run(main())
+
+PAYLOAD = [
+    {"Name": "Rec Center ✨", "Tags": ["pvp", "ħángöut"], "Stats": {"CheerCount": 12, "Ratio": -0.5e3}},
+    "emoji 🎉 and escapes \" \\ é",
+    12345678901234567890,
+    [[], {}, [None, True, False]],
+    0,
+]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 16])
+def test_elements_match_json_loads(size):
+    body = json.dumps(PAYLOAD, ensure_ascii=False, indent=1).encode()
+    assert parse(body, size) == PAYLOAD
+
+def test_random_splits():
+    rng = random.Random(0)
+    body = json.dumps(PAYLOAD * 20, ensure_ascii=False).encode()
+    for _ in range(50):
+        assert parse(body, rng.randint(1, 40)) == PAYLOAD * 20
+
+def test_multi_byte_characters_split_across_chunks():
+    body = json.dumps(["🎉ħé"], ensure_ascii=False).encode()
+    # Every split lands inside a multi-byte sequence at least once
+    assert parse(body, 1) == ["🎉ħé"]
+
+def test_number_at_the_end_of_a_chunk_isnt_cut_short():
+    assert parse(b"[123,4567]", 3) == [123, 4567]
+
+def test_empty_array():
+    assert parse(b" [ ] ") == []
+
+def test_empty_body():
+    assert parse(b"") == []
+
+def test_truncated_body():
+    with pytest.raises(JSONDecodeError):
+        parse(b'[{"a": 1}, {"b": ', 4)
+
+def test_unterminated_array():
+    with pytest.raises(JSONDecodeError):
+        parse(b'[{"a": 1}, 2', 4)
+
+def test_non_array_body():
+    with pytest.raises(JSONDecodeError):
+        parse(b'{"a": [1, 2]}')
@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+def run(code: str) -> subprocess.CompletedProcess:
+    # Every check runs in a fresh interpreter, so nothing was imported beforehand
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+
+@pytest.mark.parametrize("path", [
+    "recnetpy.rest", "recnetpy.managers", "recnetpy.dataclasses", "recnetpy.misc",
+    "recnetpy.rest.cache", "recnetpy.rest.exceptions", "recnetpy.rest.rate_limiter",
+])
+def test_subpackages_are_reachable_as_attributes(path):
+    result = run(f"import recnetpy, importlib; assert {path} is importlib.import_module({path!r})")
+    assert result.returncode == 0, result.stderr
+
+def test_exports_are_reachable_as_attributes():
+    result = run("import recnetpy; from recnetpy.rest import RateLimiter; assert recnetpy.Client and recnetpy.rest.RateLimiter is RateLimiter")
+    assert result.returncode == 0, result.stderr
+
+def test_missing_attributes_raise_attribute_error():
+    result = run("import recnetpy; assert not hasattr(recnetpy, 'missing'); assert not hasattr(recnetpy.rest, 'missing')")
+    assert result.returncode == 0, result.stderr
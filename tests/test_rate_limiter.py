@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+
+from recnetpy.rest.rate_limiter import RateLimiter, BACKOFF_FACTOR
+from recnetpy.rest.response import Response
+from recnetpy.rest.priority import Priority
+from recnetpy.rest.exceptions import DeadlineExceeded
+
+def rate_limited(retry_after: str = "1") -> Response:
+    return Response("https://apim.rec.net/", 429, False, {"retry-after": retry_after}, None)
+
+def test_concurrent_rate_limits_back_off_once():
+    async def main():
+        limiter = RateLimiter(30)
+        for _ in range(20):
+            limiter.feedback(rate_limited())
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert limiter.rate == 30 * BACKOFF_FACTOR
+
+def test_rate_limits_after_the_window_back_off_again():
+    async def main():
+        limiter = RateLimiter(30)
+        limiter.feedback(rate_limited("0.05"))
+        await asyncio.sleep(0.1)
+        limiter.feedback(rate_limited("0.05"))
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert limiter.rate == 30 * BACKOFF_FACTOR ** 2
+
+def test_back_off_still_extends_the_pause():
+    async def main():
+        limiter = RateLimiter(30)
+        limiter.feedback(rate_limited("1"))
+        limiter.feedback(rate_limited("5"))
+        return limiter.paused_until - asyncio.get_running_loop().time()
+
+    assert asyncio.run(main()) > 4
+
+def test_cancelled_token_wakes_the_next_waiter():
+    async def main():
+        loop = asyncio.get_running_loop()
+        limiter = RateLimiter(1, capacity=1)
+        await limiter.acquire()
+        first = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(limiter.acquire(Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        # Cancel the first waiter after it was handed a token, but before it resumed
+        release = limiter._RateLimiter__timer.when()
+        loop.call_at(release + 0.001, first.cancel)
+        time.sleep(release + 0.01 - loop.time())
+        start = loop.time()
+        await second
+        return loop.time() - start
+
+    assert asyncio.run(main()) < 0.5
+
+def test_rate_can_be_set_before_the_loop_runs():
+    limiter = RateLimiter(30)
+    limiter.set_rate(10)
+    assert limiter.rate == limiter.max_rate == 10
+
+def test_pause_before_the_loop_runs_starts_on_first_use():
+    limiter = RateLimiter(30)
+    limiter.pause(0.2)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(main()) >= 0.19
+
+def test_existing_pools_can_be_configured_before_the_loop_runs():
+    from recnetpy import Client
+    client = Client(["key a", "key b"])
+    client.rec_net.configure_host("apim.rec.net", rate_limit=10)
+    assert client.rec_net.client.pools["apim.rec.net"].limiter.rate == 10
+
+def serve_order(flows):
+    # Queues waiters on a drained limiter, and returns their labels in the order they got tokens
+    async def main():
+        limiter = RateLimiter(500, capacity=1)
+        await limiter.acquire()
+        order = []
+
+        async def wait(label, priority, tenant):
+            await limiter.acquire(priority, tenant=tenant)
+            order.append(label)
+
+        tasks = [asyncio.ensure_future(wait(label, priority, tenant)) for label, priority, tenant in flows]
+        await asyncio.gather(*tasks)
+        return order
+
+    return asyncio.run(main())
+
+def test_higher_priorities_are_served_first():
+    flows = [("background", Priority.BACKGROUND, None)] * 8 + [("interactive", Priority.INTERACTIVE, None)] * 8
+    assert serve_order(flows) == ["interactive"] * 8 + ["background"] * 8
+
+def test_lower_priorities_arent_starved():
+    flows = [("background", Priority.BACKGROUND, None)] + [("interactive", Priority.INTERACTIVE, None)] * 40
+    # The weights are 16 to 1, so the background waiter is served within the first 17
+    assert serve_order(flows).index("background") <= 16
+
+def test_tenants_share_tokens_fairly():
+    flows = [("busy", Priority.NORMAL, "busy")] * 20 + [("quiet", Priority.NORMAL, "quiet")] * 2
+    order = serve_order(flows)
+    assert order.index("quiet") <= 1
+    assert [index for index, label in enumerate(order) if label == "quiet"][-1] <= 3
+
+def test_waiter_is_dropped_at_its_deadline():
+    async def main():
+        limiter = RateLimiter(1, capacity=1)
+        await limiter.acquire()
+        with pytest.raises(DeadlineExceeded):
+            await limiter.acquire(deadline=time.monotonic() + 0.05)
+        return limiter.waiting
+
+    assert asyncio.run(main()) == 0
+
+def test_paused_limiter_rejects_waiters_whose_deadline_is_sooner():
+    async def main():
+        limiter = RateLimiter(30)
+        limiter.pause(5)
+        with pytest.raises(DeadlineExceeded):
+            await limiter.acquire(deadline=time.monotonic() + 1)
+
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import pytest
+
+from recnetpy.rest.single_flight import SingleFlight
+from recnetpy.rest.exceptions import DeadlineExceeded
+
+def test_identical_calls_are_coalesced():
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        flights = SingleFlight()
+        return await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == [1] * 5
+
+def test_caller_without_deadline_doesnt_join_call_with_deadline():
+    async def fetch(timeout):
+        await asyncio.sleep(0.1)
+        if timeout: raise DeadlineExceeded()
+        return "ok"
+
+    async def main():
+        flights = SingleFlight()
+        short = flights.do("key", lambda: fetch(True), time.monotonic() + 0.05)
+        unbounded = flights.do("key", lambda: fetch(False))
+        return await asyncio.gather(short, unbounded, return_exceptions=True)
+
+    short, unbounded = asyncio.run(main())
+    assert isinstance(short, DeadlineExceeded)
+    assert unbounded == "ok"
+
+def test_caller_with_shorter_deadline_stops_waiting_at_it():
+    async def fetch():
+        await asyncio.sleep(0.2)
+        return "ok"
+
+    async def main():
+        flights = SingleFlight()
+        leader = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        with pytest.raises(DeadlineExceeded):
+            await flights.do("key", fetch, time.monotonic() + 0.05)
+        return await leader
+
+    assert asyncio.run(main()) == "ok"
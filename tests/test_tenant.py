@@ -0,0 +1,29 @@
+import asyncio
+
+from recnetpy.rest.tenant import TenantScheduler
+
+def test_least_recently_active_tenants_are_evicted():
+    scheduler = TenantScheduler(max_tenants=3)
+    for tenant in ("a", "b", "c"):
+        scheduler.get_stats(tenant)
+    scheduler.get_stats("a")
+    scheduler.get_stats("d")
+    assert list(scheduler.stats) == ["c", "a", "d"]
+
+def test_tenants_with_waiting_requests_arent_evicted():
+    scheduler = TenantScheduler(max_tenants=2)
+    scheduler.get_stats("busy").waiting += 1
+    scheduler.get_stats("idle")
+    scheduler.get_stats("new")
+    assert list(scheduler.stats) == ["busy", "new"]
+
+def test_limiters_are_evicted_with_their_tenants():
+    scheduler = TenantScheduler(default_quota=100, max_tenants=10)
+
+    async def main():
+        for tenant in range(1000):
+            await scheduler.acquire(tenant)
+
+    asyncio.run(main())
+    assert len(scheduler.stats) == 10
+    assert len(scheduler._TenantScheduler__limiters) == 10
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from recnetpy.managers.worker_pool import WorkerPool
+from recnetpy.rest.exceptions import MapError
+
+async def double(item: int) -> int:
+    await asyncio.sleep(0)
+    if item == 3: raise asyncio.CancelledError()
+    return item * 2
+
+def test_cancelled_call_is_a_failed_call():
+    async def main():
+        pool = WorkerPool(double, range(6), concurrency=2)
+        return await asyncio.wait_for(pool.collect(), 1)
+
+    with pytest.raises(MapError) as info:
+        asyncio.run(main())
+    assert info.value.results == [0, 2, 4, 8, 10]
+    assert info.value.failed == [3]
+    assert isinstance(info.value.errors[0], asyncio.CancelledError)
+
+def test_cancelled_call_is_streamed_with_return_exceptions():
+    async def main():
+        pool = WorkerPool(double, range(6), concurrency=2, return_exceptions=True)
+        return dict([entry async for entry in pool])
+
+    results = asyncio.run(asyncio.wait_for(main(), 1))
+    assert isinstance(results.pop(3), asyncio.CancelledError)
+    assert results == {0: 0, 1: 2, 2: 4, 4: 8, 5: 10}
+
+def test_breaking_early_stops_the_workers():
+    async def main():
+        pool = WorkerPool(double, range(100), concurrency=4)
+        async for item, result in pool:
+            break
+        await asyncio.sleep(0.05)
+        return len(asyncio.all_tasks())
+
+    assert asyncio.run(main()) == 1